@@ -0,0 +1,123 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Run the benchmarks, print their results and save them as JSON::
+
+    python -m benchmarks -l en fr -o before.json
+    python -m benchmarks -l en fr --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+from text_to_num.lang import LANG
+from text_to_num.phrases import build_phrase_table
+
+from .corpora import WORKLOADS
+from .suite import BENCHES, Result, compare, run_cold_start, run_suite
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load(path: str) -> List[Result]:
+    with open(path, encoding="utf-8") as f:
+        return [Result(**result) for result in json.load(f)["results"]]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("::")[0])
+    parser.add_argument("-l", "--langs", nargs="+", choices=list(LANG), default=list(LANG))
+    parser.add_argument("-w", "--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("-b", "--benches", nargs="+", choices=list(BENCHES), default=list(BENCHES))
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum duration of each timing, in seconds"
+    )
+    parser.add_argument(
+        "--no-cold-start",
+        action="store_true",
+        help="do not time the first calls of each language in a new interpreter",
+    )
+    parser.add_argument(
+        "--phrase-limit",
+        type=int,
+        default=0,
+        help="look the numbers up to this one in phrase tables, and report their size and build time",
+    )
+    parser.add_argument("-o", "--output", help="save the results as JSON in this file")
+    parser.add_argument("--compare", metavar="JSON", help="compare to the results saved in this file")
+    args = parser.parse_args(argv)
+
+    phrase_tables = {}
+    if args.phrase_limit:
+        for lang in args.langs:
+            start = time.perf_counter()
+            phrase_tables[lang] = build_phrase_table(lang, args.phrase_limit)
+            print(
+                "phrase table {:<3} {} built in {:.2f} s".format(
+                    lang, phrase_tables[lang].info(), time.perf_counter() - start
+                )
+            )
+
+    results = []
+    measures = run_suite(args.langs, args.workloads, args.benches, args.min_time, phrase_tables)
+    if not args.no_cold_start:
+        measures = chain(measures, run_cold_start(args.langs))
+    for result in measures:
+        results.append(result)
+        if not args.compare:
+            print(
+                "{0.bench:<28} {0.lang:<3} {0.workload:<13} {0.us_per_call:>10.2f} µs/call "
+                "{0.tokens_per_s:>12.0f} tokens/s".format(result)
+            )
+    if args.compare:
+        for line in compare(results, _load(args.compare)):
+            print(line)
+    if args.output:
+        report: Dict[str, Any] = {
+            "commit": _commit(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "min_time": args.min_time,
+            "phrase_limit": args.phrase_limit,
+            "results": [result._asdict() for result in results],
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark corpora: number-free, number-dense and pathological texts for each
+language of ``LANG``.
+
+The texts are built deterministically from a few hand-written sentences and
+number phrases, so that the results of different commits can be compared.
+"""
+
+import random
+from typing import Dict, List, NamedTuple, Tuple
+
+from .words import NUMBER_WORDS
+
+# Number-free sentences, as found in conversations.
+SENTENCES: Dict[str, Tuple[str, ...]] = {
+    "ca": (
+        "Podries enviar-me l'informe sobre la reunió que vam tenir ahir a la tarda?",
+        "Et truco més tard perquè ara estic conduint cap a casa.",
+    ),
+    "de": (
+        "Könnten Sie mir bitte den Bericht über das Treffen von gestern schicken?",
+        "Ich rufe Sie später zurück, weil ich gerade nach Hause fahre.",
+    ),
+    "en": (
+        "Could you please send me the report about the meeting we had yesterday afternoon?",
+        "I will call you back later because I am driving home right now.",
+    ),
+    "es": (
+        "¿Podrías enviarme el informe sobre la reunión que tuvimos ayer por la tarde?",
+        "Te llamo más tarde porque ahora estoy conduciendo hacia casa.",
+    ),
+    "fr": (
+        "Pourriez-vous m'envoyer le rapport sur la réunion que nous avons eue hier après-midi ?",
+        "Je vous rappelle plus tard car je suis en train de rentrer à la maison.",
+    ),
+    "it": (
+        "Potresti mandarmi il rapporto sulla riunione che abbiamo avuto ieri pomeriggio?",
+        "Ti richiamo più tardi perché adesso sto guidando verso casa.",
+    ),
+    "nl": (
+        "Kunt u mij het verslag sturen over de vergadering van gisteren middag?",
+        "Ik bel je later terug omdat ik nu naar huis rijd.",
+    ),
+    "no": (
+        "Kan du sende meg rapporten om møtet vi hadde i går ettermiddag?",
+        "Jeg ringer deg tilbake senere fordi jeg kjører hjem akkurat nå.",
+    ),
+    "pt": (
+        "Você poderia me enviar o relatório sobre a reunião que tivemos ontem à tarde?",
+        "Eu te ligo mais tarde porque agora estou dirigindo para casa.",
+    ),
+    "ru": (
+        "Не могли бы вы прислать мне отчёт о встрече, которая была вчера днём?",
+        "Я перезвоню вам позже, потому что сейчас еду домой.",
+    ),
+}
+
+# Spelled numbers that ``text2num`` accepts.
+NUMBERS: Dict[str, Tuple[str, ...]] = {
+    "ca": ("vint-i-cinc", "dos-cents seixanta-sis", "mil dos-cents seixanta-sis", "tres milions"),
+    "de": (
+        "fünfundzwanzig", "zweihundertsechsundsechzig", "tausendzweihundertsechsundsechzig", "drei millionen"
+    ),
+    "en": ("twenty five", "two hundred sixty six", "one thousand two hundred sixty six", "three million"),
+    "es": ("veinticinco", "doscientos sesenta y seis", "mil doscientos sesenta y seis", "tres millones"),
+    "fr": ("vingt-cinq", "deux cent soixante-six", "mille deux cent soixante-six", "trois millions"),
+    "it": ("venticinque", "duecentosessantasei", "milleduecentosessantasei", "tre milioni"),
+    "nl": ("vijfentwintig", "twee honderd zesenzestig", "twee duizend drie honderd", "drie miljoen"),
+    "no": ("tjuefem", "to hundre sekstiseks", "to tusen tre hundre", "tre millioner"),
+    "pt": ("vinte e cinco", "duzentos e sessenta e seis", "mil duzentos e sessenta e seis", "três milhões"),
+    "ru": ("двадцать пять", "двести шестьдесят шесть", "тысяча двести шестьдесят шесть", "три миллиона"),
+}
+
+TEXTS_PER_WORKLOAD = 20
+PATHOLOGICAL_LENGTH = 200  # words
+
+
+class Workload(NamedTuple):
+    """Named texts of one language: ``texts`` for the ``alpha2digit`` like benchmarks,
+    ``phrases`` for the ``text2num`` like ones.
+    """
+
+    name: str
+    lang: str
+    texts: List[str]
+    phrases: List[str]
+
+    @property
+    def tokens(self) -> int:
+        return sum(len(text.split()) for text in self.texts)
+
+    @property
+    def phrase_tokens(self) -> int:
+        return sum(len(phrase.split()) for phrase in self.phrases)
+
+
+def number_free(lang: str, count: int = TEXTS_PER_WORKLOAD) -> Workload:
+    """Return ``count`` texts made of the sentences of ``lang``, without any number."""
+    sentences = SENTENCES[lang]
+    texts = [" ".join(sentences[(i + j) % len(sentences)] for j in range(3)) for i in range(count)]
+    return Workload("number-free", lang, texts, texts)
+
+
+def number_dense(lang: str, count: int = TEXTS_PER_WORKLOAD, seed: int = 0) -> Workload:
+    """Return ``count`` texts where every other word group is a spelled number, and
+    these numbers as phrases.
+    """
+    rnd = random.Random(seed)
+    words = [word for sentence in SENTENCES[lang] for word in sentence.split()]
+    texts = []
+    numbers = []
+    for _ in range(count):
+        groups = []
+        for _ in range(6):
+            numbers.append(rnd.choice(NUMBERS[lang]))
+            groups.append(numbers[-1])
+            groups.append(" ".join(rnd.sample(words, 2)))
+        texts.append(" ".join(groups))
+    return Workload("number-dense", lang, texts, numbers)
+
+
+def pathological(lang: str, count: int = TEXTS_PER_WORKLOAD, seed: int = 0) -> Workload:
+    """Return ``count`` long texts of random number words, without any separator.
+
+    Most sequences are not valid numbers, so the parsers keep failing and restarting
+    within a single segment.
+    """
+    rnd = random.Random(seed)
+    texts = [" ".join(rnd.choices(NUMBER_WORDS[lang], k=PATHOLOGICAL_LENGTH)) for _ in range(count)]
+    return Workload("pathological", lang, texts, texts)
+
+
+WORKLOADS = {
+    "number-free": number_free,
+    "number-dense": number_dense,
+    "pathological": pathological,
+}
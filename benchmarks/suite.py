@@ -0,0 +1,256 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+The benchmarks and their measurement.
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Type
+
+import text_to_num
+from text_to_num import alpha2digit, try_text2num
+from text_to_num.lang import LANG
+from text_to_num.parsers import (
+    WordStreamValueAutomaton,
+    WordStreamValueParser,
+    WordStreamValueParserGerman,
+    WordStreamValueParserInterface,
+    WordToDigitParser,
+    WordToDigitParserGerman,
+)
+from text_to_num.phrases import PhraseTable
+from text_to_num.transforms import WORD_SEP, look_ahead
+
+from .corpora import NUMBERS, WORKLOADS, Workload, number_dense
+
+REPEAT = 5
+
+
+class Result(NamedTuple):
+    """The measure of a benchmark on a workload, for the best of ``REPEAT`` runs."""
+
+    bench: str
+    lang: str
+    workload: str
+    calls: int  # per run
+    tokens: int  # per run
+    us_per_call: float
+    tokens_per_s: float
+
+
+class Run(NamedTuple):
+    """The function to time, and the number of calls and tokens it processes."""
+
+    func: Callable[[], None]
+    calls: int
+    tokens: int
+
+
+class Bench(NamedTuple):
+    """A benchmark: ``setup`` takes a workload and the phrase table of its language, if
+    any, and returns its run, or None if the benchmark does not apply.
+    """
+
+    name: str
+    setup: Callable[[Workload, Optional[PhraseTable]], Optional[Run]]
+
+
+def _text2num(workload: Workload, phrases: Optional[PhraseTable]) -> Run:
+    def run() -> None:
+        for phrase in workload.phrases:
+            try_text2num(phrase, workload.lang, phrases=phrases)
+
+    return Run(run, len(workload.phrases), workload.phrase_tokens)
+
+
+def _alpha2digit(workload: Workload, phrases: Optional[PhraseTable]) -> Run:
+    def run() -> None:
+        for text in workload.texts:
+            alpha2digit(text, workload.lang, phrases=phrases)
+
+    return Run(run, len(workload.texts), workload.tokens)
+
+
+def _value_parser_push(
+    parser_class: Type[WordStreamValueParserInterface],
+) -> Callable[[Workload, Optional[PhraseTable]], Optional[Run]]:
+    """Return the setup of a benchmark that pushes the words of each phrase to a new
+    ``parser_class`` until it rejects one.
+
+    The German parser only applies to German, and the others to the other languages
+    but Italian, whose numbers are read by ``iWtoN``.
+    """
+
+    def setup(workload: Workload, phrases: Optional[PhraseTable]) -> Optional[Run]:
+        language = LANG[workload.lang]
+        if language.ISO_CODE == "it":
+            return None
+        if (language.ISO_CODE == "de") != (parser_class is WordStreamValueParserGerman):
+            return None
+
+        def parse(phrase: str) -> int:
+            parser = parser_class(language)
+            pushed = 0
+            for word, ahead in look_ahead(phrase.split()):
+                pushed += 1
+                if not parser.push(word, ahead):
+                    break
+            return pushed
+
+        def run() -> None:
+            for phrase in workload.phrases:
+                parse(phrase)
+
+        calls = sum(parse(phrase) for phrase in workload.phrases)
+        return Run(run, calls, workload.phrase_tokens)
+
+    return setup
+
+
+def _word_to_digit_parser(workload: Workload, phrases: Optional[PhraseTable]) -> Run:
+    """Push all the words of each segment, like ``alpha2digit``, without rewriting."""
+    language = LANG[workload.lang]
+    parser: WordToDigitParser
+    if language.ISO_CODE == "de":
+        # the German parser takes the words in their original case
+        parser = WordToDigitParserGerman(language)
+        segments = [segment.split() for text in workload.texts for segment in WORD_SEP.split(text)]
+    else:
+        parser = WordToDigitParser(language)
+        segments = [segment.lower().split() for text in workload.texts for segment in WORD_SEP.split(text)]
+
+    def run() -> None:
+        for words in segments:
+            parser.reset()
+            for word, ahead in look_ahead(words):
+                if not parser.push(word, ahead):
+                    parser.reset(preceding_word=word)
+            parser.close()
+
+    tokens = sum(map(len, segments))
+    return Run(run, tokens, tokens)
+
+
+BENCHES: Dict[str, Bench] = {
+    bench.name: bench
+    for bench in (
+        Bench("text2num", _text2num),
+        Bench("alpha2digit", _alpha2digit),
+        # the value parser of text2num, and the reference one it is checked against
+        Bench("WordStreamValueAutomaton.push", _value_parser_push(WordStreamValueAutomaton)),
+        Bench("WordStreamValueParser.push", _value_parser_push(WordStreamValueParser)),
+        Bench("WordStreamValueParserGerman.push", _value_parser_push(WordStreamValueParserGerman)),
+        Bench("WordToDigitParser", _word_to_digit_parser),
+    )
+}
+
+
+def measure(run: Run, min_time: float = 0.2) -> float:
+    """Return the best time, in seconds, of ``REPEAT`` runs of ``run``, each one looped
+    for at least ``min_time`` seconds.
+    """
+    timer = timeit.Timer(run.func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def run_suite(
+    langs: Sequence[str] = tuple(LANG),
+    workloads: Sequence[str] = tuple(WORKLOADS),
+    benches: Sequence[str] = tuple(BENCHES),
+    min_time: float = 0.2,
+    phrase_tables: Optional[Dict[str, PhraseTable]] = None,
+) -> Iterator[Result]:
+    """Measure each benchmark of ``benches`` on each workload of each language, with
+    its table of ``phrase_tables``, if any.
+    """
+    for lang in langs:
+        phrases = phrase_tables.get(lang) if phrase_tables else None
+        for workload_name in workloads:
+            workload = WORKLOADS[workload_name](lang)
+            for bench_name in benches:
+                run = BENCHES[bench_name].setup(workload, phrases)
+                if run is None:
+                    continue
+                seconds = measure(run, min_time)
+                yield Result(
+                    bench_name,
+                    lang,
+                    workload_name,
+                    run.calls,
+                    run.tokens,
+                    seconds / run.calls * 1e6 if run.calls else 0.0,
+                    run.tokens / seconds,
+                )
+
+
+COLD_START_SCRIPT = """
+import time
+from text_to_num import alpha2digit, text2num
+start = time.perf_counter()
+text2num({number!r}, {lang!r})
+alpha2digit({text!r}, {lang!r})
+print(time.perf_counter() - start)
+"""
+
+
+def run_cold_start(langs: Sequence[str] = tuple(LANG), runs: int = REPEAT) -> Iterator[Result]:
+    """Measure the first ``text2num`` and ``alpha2digit`` calls of each language in a new
+    interpreter, where the language is loaded and its tables compiled.
+
+    The best time of ``runs`` interpreters is kept.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.dirname(os.path.dirname(text_to_num.__file__)), env.get("PYTHONPATH")])
+    )
+    for lang in langs:
+        text = number_dense(lang, count=1).texts[0]
+        script = COLD_START_SCRIPT.format(number=NUMBERS[lang][0], text=text, lang=lang)
+        seconds = min(
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", script], env=env, capture_output=True, check=True, text=True
+                ).stdout
+            )
+            for _ in range(runs)
+        )
+        tokens = len(NUMBERS[lang][0].split()) + len(text.split())
+        yield Result("first calls", lang, "cold-start", 2, tokens, seconds / 2 * 1e6, tokens / seconds)
+
+
+def compare(results: List[Result], baseline: List[Result]) -> Iterator[str]:
+    """Yield a line per result found in ``baseline``, with the speed ratio."""
+    previous = {(r.bench, r.lang, r.workload): r for r in baseline}
+    for result in results:
+        old = previous.get((result.bench, result.lang, result.workload))
+        if old is not None and result.us_per_call:
+            yield "{:<28} {:<3} {:<13} {:>10.2f} µs/call  x{:.2f}".format(
+                result.bench, result.lang, result.workload, result.us_per_call,
+                old.us_per_call / result.us_per_call,
+            )
@@ -0,0 +1,446 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+The number words of each language, for the pathological corpus.
+
+They are frozen here, as the ``vocabulary()`` of the languages was when the suite
+was added, so that the corpus does not change with the code under test.
+"""
+
+from typing import Dict, Tuple
+
+NUMBER_WORDS: Dict[str, Tuple[str, ...]] = {
+    "ca": (
+        "bilion", "bilionena", "bilionenes", "bilionens", "bilions", "bilionsena", "bilionsenes",
+        "bilionsens", "bilionsè", "bilionsé", "bilionè", "bilioné", "bilió", "bilióena",
+        "bilióenes", "bilióens", "bilióè", "bilióé", "catorz", "catorze", "catorzeena",
+        "catorzeenes", "catorzeens", "catorzena", "catorzenes", "catorzens", "catorzeè", "catorzeé",
+        "catorzè", "catorzé", "cent", "cente", "centeena", "centeenes", "centeens", "centena",
+        "centenes", "centens", "centes", "centesena", "centesenes", "centesens", "centesè",
+        "centesé", "centeè", "centeé", "cents", "centsena", "centsenes", "centsens", "centsè",
+        "centsé", "centè", "centé", "cinc", "cincena", "cincenes", "cincens", "cincè", "cincé",
+        "cinqu", "cinquant", "cinquanta", "cinquantaena", "cinquantaenes", "cinquantaens",
+        "cinquantaè", "cinquantaé", "cinquantena", "cinquantenes", "cinquantens", "cinquantè",
+        "cinquanté", "cinquena", "cinquenes", "cinquens", "cinquè", "cinqué", "coma", "comaena",
+        "comaenes", "comaens", "comaè", "comaé", "deneu", "deneuena", "deneuenes", "deneuens",
+        "deneuè", "deneué", "denou", "denouena", "denouenes", "denouens", "denouè", "denoué", "des",
+        "desena", "desenes", "desens", "desset", "dessetena", "dessetenes", "dessetens", "dessetè",
+        "desseté", "desè", "desé", "deu", "deuena", "deuenes", "deuens", "deuè", "deué", "devuit",
+        "devuitena", "devuitenes", "devuitens", "devuitè", "devuité", "dihuit", "dihuitena",
+        "dihuitenes", "dihuitens", "dihuitè", "dihuité", "dinou", "dinouena", "dinouenes",
+        "dinouens", "dinouè", "dinoué", "disset", "dissetena", "dissetenes", "dissetens", "dissetè",
+        "disseté", "divuit", "divuitena", "divuitenes", "divuitens", "divuitè", "divuité", "do",
+        "doena", "doenes", "doens", "dos", "dosena", "dosenes", "dosens", "dosè", "dosé", "dotz",
+        "dotze", "dotzeena", "dotzeenes", "dotzeens", "dotzena", "dotzenes", "dotzens", "dotzeè",
+        "dotzeé", "dotzè", "dotzé", "doè", "doé", "due", "dueena", "dueenes", "dueens", "dues",
+        "duesena", "duesenes", "duesens", "duesè", "duesé", "dueè", "dueé", "dècim", "dècima",
+        "dècimaena", "dècimaenes", "dècimaens", "dècimaè", "dècimaé", "dècimena", "dècimenes",
+        "dècimens", "dècimes", "dècimesena", "dècimesenes", "dècimesens", "dècimesè", "dècimesé",
+        "dècims", "dècimsena", "dècimsenes", "dècimsens", "dècimsè", "dècimsé", "dècimè", "dècimé",
+        "dèneu", "dèneuena", "dèneuenes", "dèneuens", "dèneuè", "dèneué", "dènou", "dènouena",
+        "dènouenes", "dènouens", "dènouè", "dènoué", "dèsset", "dèssetena", "dèssetenes",
+        "dèssetens", "dèssetè", "dèsseté", "díhuit", "díhuitena", "díhuitenes", "díhuitens",
+        "díhuitè", "díhuité", "huit", "huitant", "huitanta", "huitantaena", "huitantaenes",
+        "huitantaens", "huitantaè", "huitantaé", "huitantena", "huitantenes", "huitantens",
+        "huitantè", "huitanté", "huitena", "huitenes", "huitens", "huitè", "huité", "i", "iena",
+        "ienes", "iens", "iè", "ié", "menys", "menysena", "menysenes", "menysens", "menysè",
+        "menysé", "mil", "milena", "milenes", "milens", "miliard", "miliardena", "miliardenes",
+        "miliardens", "miliards", "miliardsena", "miliardsenes", "miliardsens", "miliardsè",
+        "miliardsé", "miliardè", "miliardé", "milion", "milionena", "milionenes", "milionens",
+        "milions", "milionsena", "milionsenes", "milionsens", "milionsè", "milionsé", "milionè",
+        "milioné", "milió", "milióena", "milióenes", "milióens", "milióè", "milióé", "milè", "milé",
+        "més", "mésena", "mésenes", "mésens", "mésè", "mésé", "norant", "noranta", "norantaena",
+        "norantaenes", "norantaens", "norantaè", "norantaé", "norantena", "norantenes", "norantens",
+        "norantè", "noranté", "nou", "nouena", "nouenes", "nouens", "nouè", "noué", "nov", "novena",
+        "novenes", "novens", "novè", "nové", "octau", "octauena", "octauenes", "octauens", "octaus",
+        "octausena", "octausenes", "octausens", "octausè", "octausé", "octauè", "octaué", "octava",
+        "octavaena", "octavaenes", "octavaens", "octavaè", "octavaé", "octaves", "octavesena",
+        "octavesenes", "octavesens", "octavesè", "octavesé", "onz", "onze", "onzeena", "onzeenes",
+        "onzeens", "onzena", "onzenes", "onzens", "onzeè", "onzeé", "onzè", "onzé", "primer",
+        "primera", "primeraena", "primeraenes", "primeraens", "primeraè", "primeraé", "primerena",
+        "primerenes", "primerens", "primeres", "primeresena", "primeresenes", "primeresens",
+        "primeresè", "primeresé", "primers", "primersena", "primersenes", "primersens", "primersè",
+        "primersé", "primerè", "primeré", "quarant", "quaranta", "quarantaena", "quarantaenes",
+        "quarantaens", "quarantaè", "quarantaé", "quarantena", "quarantenes", "quarantens",
+        "quarantè", "quaranté", "quart", "quarta", "quartaena", "quartaenes", "quartaens",
+        "quartaè", "quartaé", "quartena", "quartenes", "quartens", "quartes", "quartesena",
+        "quartesenes", "quartesens", "quartesè", "quartesé", "quarts", "quartsena", "quartsenes",
+        "quartsens", "quartsè", "quartsé", "quartè", "quarté", "quatr", "quatre", "quatreena",
+        "quatreenes", "quatreens", "quatrena", "quatrenes", "quatrens", "quatreè", "quatreé",
+        "quatrè", "quatré", "quint", "quinta", "quintaena", "quintaenes", "quintaens", "quintaè",
+        "quintaé", "quintena", "quintenes", "quintens", "quintes", "quintesena", "quintesenes",
+        "quintesens", "quintesè", "quintesé", "quints", "quintsena", "quintsenes", "quintsens",
+        "quintsè", "quintsé", "quintè", "quinté", "quinz", "quinze", "quinzeena", "quinzeenes",
+        "quinzeens", "quinzena", "quinzenes", "quinzens", "quinzeè", "quinzeé", "quinzè", "quinzé",
+        "segon", "segona", "segonaena", "segonaenes", "segonaens", "segonaè", "segonaé", "segonena",
+        "segonenes", "segonens", "segones", "segonesena", "segonesenes", "segonesens", "segonesè",
+        "segonesé", "segons", "segonsena", "segonsenes", "segonsens", "segonsè", "segonsé",
+        "segonè", "segoné", "seixant", "seixanta", "seixantaena", "seixantaenes", "seixantaens",
+        "seixantaè", "seixantaé", "seixantena", "seixantenes", "seixantens", "seixantè", "seixanté",
+        "set", "setant", "setanta", "setantaena", "setantaenes", "setantaens", "setantaè",
+        "setantaé", "setantena", "setantenes", "setantens", "setantè", "setanté", "setena",
+        "setenes", "setens", "setz", "setze", "setzeena", "setzeenes", "setzeens", "setzena",
+        "setzenes", "setzens", "setzeè", "setzeé", "setzè", "setzé", "setè", "seté", "sext",
+        "sexta", "sextaena", "sextaenes", "sextaens", "sextaè", "sextaé", "sextena", "sextenes",
+        "sextens", "sextes", "sextesena", "sextesenes", "sextesens", "sextesè", "sextesé", "sexts",
+        "sextsena", "sextsenes", "sextsens", "sextsè", "sextsé", "sextè", "sexté", "si", "siena",
+        "sienes", "siens", "sis", "sisena", "sisenes", "sisens", "sisè", "sisé", "siè", "sié",
+        "sèptim", "sèptima", "sèptimaena", "sèptimaenes", "sèptimaens", "sèptimaè", "sèptimaé",
+        "sèptimena", "sèptimenes", "sèptimens", "sèptimes", "sèptimesena", "sèptimesenes",
+        "sèptimesens", "sèptimesè", "sèptimesé", "sèptims", "sèptimsena", "sèptimsenes",
+        "sèptimsens", "sèptimsè", "sèptimsé", "sèptimè", "sèptimé", "tercer", "tercera",
+        "terceraena", "terceraenes", "terceraens", "terceraè", "terceraé", "tercerena",
+        "tercerenes", "tercerens", "terceres", "terceresena", "terceresenes", "terceresens",
+        "terceresè", "terceresé", "tercers", "tercersena", "tercersenes", "tercersens", "tercersè",
+        "tercersé", "tercerè", "terceré", "tre", "treena", "treenes", "treens", "trent", "trenta",
+        "trentaena", "trentaenes", "trentaens", "trentaè", "trentaé", "trentena", "trentenes",
+        "trentens", "trentè", "trenté", "tres", "tresena", "tresenes", "tresens", "tresè", "tresé",
+        "tretz", "tretze", "tretzeena", "tretzeenes", "tretzeens", "tretzena", "tretzenes",
+        "tretzens", "tretzeè", "tretzeé", "tretzè", "tretzé", "treè", "treé", "trilion",
+        "trilionena", "trilionenes", "trilionens", "trilions", "trilionsena", "trilionsenes",
+        "trilionsens", "trilionsè", "trilionsé", "trilionè", "trilioné", "trilió", "trilióena",
+        "trilióenes", "trilióens", "trilióè", "trilióé", "u", "uena", "uenes", "uens", "un", "una",
+        "unaena", "unaenes", "unaens", "unaè", "unaé", "unena", "unenes", "unens", "unè", "uné",
+        "uè", "ué", "vint", "vintena", "vintenes", "vintens", "vintè", "vinté", "vuit", "vuitant",
+        "vuitanta", "vuitantaena", "vuitantaenes", "vuitantaens", "vuitantaè", "vuitantaé",
+        "vuitantena", "vuitantenes", "vuitantens", "vuitantè", "vuitanté", "vuitena", "vuitenes",
+        "vuitens", "vuitè", "vuité", "zero", "zeroena", "zeroenes", "zeroens", "zeroè", "zeroé",
+    ),
+    "de": (
+        "acht", "achte", "achtzehn", "achtzig", "billiarde", "billiarden", "billion", "billionen",
+        "drei", "dreizehn", "dreißig", "dritte", "ein", "eine", "eins", "elf", "erste", "fünf",
+        "fünfzehn", "fünfzig", "hundert", "komma", "milliarde", "milliarden", "million",
+        "millionen", "minus", "neun", "neunzehn", "neunzig", "null", "plus", "sechs", "sechste",
+        "sechzehn", "sechzig", "sieben", "siebte", "siebzehn", "siebzig", "tausend", "trilliarde",
+        "trilliarden", "trillion", "trillionen", "vier", "vierzehn", "vierzig", "zehn", "zwanzig",
+        "zwei", "zwölf",
+    ),
+    "en": (
+        "billion", "billions", "billionsth", "billionsths", "billionth", "billionths", "eigh",
+        "eight", "eighteen", "eighteenth", "eighteenths", "eighth", "eighths", "eightie",
+        "eightieth", "eightieths", "eightth", "eightths", "eighty", "eightyth", "eightyths",
+        "eleven", "eleventh", "elevenths", "fif", "fifteen", "fifteenth", "fifteenths", "fifth",
+        "fifths", "fiftie", "fiftieth", "fiftieths", "fifty", "fiftyth", "fiftyths", "first",
+        "firstth", "firstths", "five", "fiveth", "fiveths", "fortie", "fortieth", "fortieths",
+        "forty", "fortyth", "fortyths", "four", "fourteen", "fourteenth", "fourteenths", "fourth",
+        "fourths", "hundred", "hundreds", "hundredsth", "hundredsths", "hundredth", "hundredths",
+        "million", "millions", "millionsth", "millionsths", "millionth", "millionths", "minus",
+        "minusth", "minusths", "nin", "nine", "nineteen", "nineteenth", "nineteenths", "nineth",
+        "nineths", "ninetie", "ninetieth", "ninetieths", "ninety", "ninetyth", "ninetyths", "ninth",
+        "ninths", "o", "one", "oneth", "oneths", "oth", "oths", "plus", "plusth", "plusths",
+        "point", "pointth", "pointths", "second", "secondth", "secondths", "seven", "seventeen",
+        "seventeenth", "seventeenths", "seventh", "sevenths", "seventie", "seventieth",
+        "seventieths", "seventy", "seventyth", "seventyths", "six", "sixteen", "sixteenth",
+        "sixteenths", "sixth", "sixths", "sixtie", "sixtieth", "sixtieths", "sixty", "sixtyth",
+        "sixtyths", "ten", "tenth", "tenths", "third", "thirdth", "thirdths", "thirteen",
+        "thirteenth", "thirteenths", "thirtie", "thirtieth", "thirtieths", "thirty", "thirtyth",
+        "thirtyths", "thousand", "thousands", "thousandsth", "thousandsths", "thousandth",
+        "thousandths", "three", "threeth", "threeths", "trillion", "trillions", "trillionsth",
+        "trillionsths", "trillionth", "trillionths", "twelf", "twelfth", "twelfths", "twelve",
+        "twelveth", "twelveths", "twentie", "twentieth", "twentieths", "twenty", "twentyth",
+        "twentyths", "two", "twoth", "twoths", "zero", "zeroth", "zeroths",
+    ),
+    "es": (
+        "catorce", "cero", "cien", "ciento", "cinco", "cincuenta", "coma", "cuarenta", "cuatro",
+        "cuatrocientas", "cuatrocientos", "diecinueve", "dieciocho", "dieciseis", "diecisiete",
+        "diez", "doce", "dos", "doscientas", "doscientos", "mas", "menos", "mil", "miles", "millon",
+        "millones", "millón", "novecientas", "novecientos", "noventa", "nueve", "ochenta", "ocho",
+        "ochocientas", "ochocientos", "once", "quince", "quinientas", "quinientos", "seis",
+        "seiscientas", "seiscientos", "sesenta", "setecientas", "setecientos", "setenta", "siete",
+        "trece", "treinta", "tres", "trescientas", "trescientos", "un", "una", "uno", "veinte",
+        "veinticinco", "veinticuatro", "veintidos", "veintidós", "veintinueve", "veintiocho",
+        "veintiseis", "veintisiete", "veintitres", "veintitrés", "veintiuno",
+    ),
+    "fr": (
+        "cent", "centième", "centièmes", "cents", "centsième", "centsièmes", "cinq", "cinqième",
+        "cinqièmes", "cinqu", "cinquant", "cinquante", "cinquanteième", "cinquanteièmes",
+        "cinquantième", "cinquantièmes", "cinquième", "cinquièmes", "deux", "deuxième", "deuxièmes",
+        "dix", "dixième", "dixièmes", "douz", "douze", "douzeième", "douzeièmes", "douzième",
+        "douzièmes", "et", "etième", "etièmes", "huit", "huitant", "huitante", "huitanteième",
+        "huitanteièmes", "huitantième", "huitantièmes", "huitième", "huitièmes", "mil", "milième",
+        "milièmes", "mill", "mille", "milleième", "milleièmes", "milles", "millesième",
+        "millesièmes", "milliard", "milliardième", "milliardièmes", "milliards", "milliardsième",
+        "milliardsièmes", "million", "millionième", "millionièmes", "millions", "millionsième",
+        "millionsièmes", "millième", "millièmes", "moins", "moinsième", "moinsièmes", "neuf",
+        "neufième", "neufièmes", "neuv", "neuvième", "neuvièmes", "nonant", "nonante",
+        "nonanteième", "nonanteièmes", "nonantième", "nonantièmes", "octant", "octante",
+        "octanteième", "octanteièmes", "octantième", "octantièmes", "onz", "onze", "onzeième",
+        "onzeièmes", "onzième", "onzièmeième", "onzièmeièmes", "onzièmes", "plus", "plusième",
+        "plusièmes", "premier", "premierième", "premierièmes", "première", "premièreième",
+        "premièreièmes", "quarant", "quarante", "quaranteième", "quaranteièmes", "quarantième",
+        "quarantièmes", "quatorz", "quatorze", "quatorzeième", "quatorzeièmes", "quatorzième",
+        "quatorzièmes", "quatr", "quatre", "quatreième", "quatreièmes", "quatrième", "quatrièmes",
+        "quinz", "quinze", "quinzeième", "quinzeièmes", "quinzième", "quinzièmes", "second",
+        "seconde", "secondeième", "secondeièmes", "secondième", "secondièmes", "seiz", "seize",
+        "seizeième", "seizeièmes", "seizième", "seizièmes", "sept", "septant", "septante",
+        "septanteième", "septanteièmes", "septantième", "septantièmes", "septième", "septièmes",
+        "six", "sixième", "sixièmes", "soixant", "soixante", "soixanteième", "soixanteièmes",
+        "soixantième", "soixantièmes", "treiz", "treize", "treizeième", "treizeièmes", "treizième",
+        "treizièmes", "trent", "trente", "trenteième", "trenteièmes", "trentième", "trentièmes",
+        "trois", "troisième", "troisièmes", "un", "une", "uneième", "uneièmes", "unième",
+        "unièmeième", "unièmeièmes", "unièmes", "vingt", "vingtième", "vingtièmes", "vingts",
+        "vingtsième", "vingtsièmes", "virgule", "virguleième", "virguleièmes", "zéro", "zéroième",
+        "zéroièmes",
+    ),
+    "it": (
+        "cento", "cinquanta", "cinque", "cinquecento", "diciannove", "diciassette", "diciotto",
+        "dieci", "dodici", "due", "duecento", "meno", "mila", "miliardi", "miliardo", "milione",
+        "milioni", "mille", "novanta", "nove", "novecento", "ottanta", "otto", "ottocento", "più",
+        "quaranta", "quattordici", "quattro", "quattrocento", "quindici", "sedici", "sei",
+        "seicento", "sessanta", "settanta", "sette", "settecento", "tre", "trecento", "tredici",
+        "trenta", "undici", "uno", "venti", "virgola", "zero",
+    ),
+    "nl": (
+        "acht", "achtde", "achtendertig", "achtendertigde", "achtendertigste", "achtennegentig",
+        "achtennegentigde", "achtennegentigste", "achtentachtig", "achtentachtigde",
+        "achtentachtigste", "achtentwintig", "achtentwintigde", "achtentwintigste", "achtenveertig",
+        "achtenveertigde", "achtenveertigste", "achtenvijftig", "achtenvijftigde",
+        "achtenvijftigste", "achtenzestig", "achtenzestigde", "achtenzestigste", "achtenzeventig",
+        "achtenzeventigde", "achtenzeventigste", "achtste", "achtstede", "achtsteste", "achttien",
+        "achttiende", "achttiendede", "achttiendeste", "achttienste", "biljoen", "biljoende",
+        "biljoenen", "biljoenende", "biljoenenste", "biljoenste", "derde", "derdede", "derdeste",
+        "dertien", "dertiende", "dertiendede", "dertiendeste", "dertienste", "dertig", "dertigde",
+        "dertigste", "dertigstede", "dertigsteste", "drie", "driede", "drieendertig",
+        "drieendertigde", "drieendertigste", "drieennegentig", "drieennegentigde",
+        "drieennegentigste", "drieentachtig", "drieentachtigde", "drieentachtigste",
+        "drieentwintig", "drieentwintigde", "drieentwintigste", "drieenveertig", "drieenveertigde",
+        "drieenveertigste", "drieenvijftig", "drieenvijftigde", "drieenvijftigste", "drieenzestig",
+        "drieenzestigde", "drieenzestigste", "drieenzeventig", "drieenzeventigde",
+        "drieenzeventigste", "drieste", "duizend", "duizendde", "duizenden", "duizendende",
+        "duizendenste", "duizendste", "een", "eende", "eenendertig", "eenendertigde",
+        "eenendertigste", "eenennegentig", "eenennegentigde", "eenennegentigste", "eenentachtig",
+        "eenentachtigde", "eenentachtigste", "eenentwintig", "eenentwintigde", "eenentwintigste",
+        "eenenveertig", "eenenveertigde", "eenenveertigste", "eenenvijftig", "eenenvijftigde",
+        "eenenvijftigste", "eenenzestig", "eenenzestigde", "eenenzestigste", "eenenzeventig",
+        "eenenzeventigde", "eenenzeventigste", "eenste", "eerste", "eerstede", "eersteste", "elf",
+        "elfde", "elfdede", "elfdeste", "elfste", "honderd", "honderdde", "honderden",
+        "honderdende", "honderdenste", "honderdste", "komma", "kommade", "kommaste", "miljard",
+        "miljardde", "miljarden", "miljardende", "miljardenste", "miljardste", "miljoen",
+        "miljoende", "miljoenen", "miljoenende", "miljoenenste", "miljoenste", "minus", "minusde",
+        "minusste", "negen", "negende", "negendede", "negendeste", "negenendertig",
+        "negenendertigde", "negenendertigste", "negenennegentig", "negenennegentigde",
+        "negenennegentigste", "negenentachtig", "negenentachtigde", "negenentachtigste",
+        "negenentwintig", "negenentwintigde", "negenentwintigste", "negenenveertig",
+        "negenenveertigde", "negenenveertigste", "negenenvijftig", "negenenvijftigde",
+        "negenenvijftigste", "negenenzestig", "negenenzestigde", "negenenzestigste",
+        "negenenzeventig", "negenenzeventigde", "negenenzeventigste", "negenste", "negentien",
+        "negentiende", "negentiendede", "negentiendeste", "negentienste", "negentig", "negentigde",
+        "negentigste", "negentigstede", "negentigsteste", "nul", "nulde", "nulste", "plus",
+        "plusde", "plusste", "tachtig", "tachtigde", "tachtigste", "tachtigstede", "tachtigsteste",
+        "tien", "tiende", "tiendede", "tiendeste", "tienste", "twaalf", "twaalfde", "twaalfdede",
+        "twaalfdeste", "twaalfste", "twee", "tweede", "tweedede", "tweedeste", "tweeendertig",
+        "tweeendertigde", "tweeendertigste", "tweeennegentig", "tweeennegentigde",
+        "tweeennegentigste", "tweeentachtig", "tweeentachtigde", "tweeentachtigste",
+        "tweeentwintig", "tweeentwintigde", "tweeentwintigste", "tweeenveertig", "tweeenveertigde",
+        "tweeenveertigste", "tweeenvijftig", "tweeenvijftigde", "tweeenvijftigste", "tweeenzestig",
+        "tweeenzestigde", "tweeenzestigste", "tweeenzeventig", "tweeenzeventigde",
+        "tweeenzeventigste", "tweeste", "twintig", "twintigde", "twintigste", "twintigstede",
+        "twintigsteste", "veertien", "veertiende", "veertiendede", "veertiendeste", "veertienste",
+        "veertig", "veertigde", "veertigste", "veertigstede", "veertigsteste", "vier", "vierde",
+        "vierdede", "vierdeste", "vierendertig", "vierendertigde", "vierendertigste",
+        "vierennegentig", "vierennegentigde", "vierennegentigste", "vierentachtig",
+        "vierentachtigde", "vierentachtigste", "vierentwintig", "vierentwintigde",
+        "vierentwintigste", "vierenveertig", "vierenveertigde", "vierenveertigste", "vierenvijftig",
+        "vierenvijftigde", "vierenvijftigste", "vierenzestig", "vierenzestigde", "vierenzestigste",
+        "vierenzeventig", "vierenzeventigde", "vierenzeventigste", "vierste", "vijf", "vijfde",
+        "vijfdede", "vijfdeste", "vijfendertig", "vijfendertigde", "vijfendertigste",
+        "vijfennegentig", "vijfennegentigde", "vijfennegentigste", "vijfentachtig",
+        "vijfentachtigde", "vijfentachtigste", "vijfentwintig", "vijfentwintigde",
+        "vijfentwintigste", "vijfenveertig", "vijfenveertigde", "vijfenveertigste", "vijfenvijftig",
+        "vijfenvijftigde", "vijfenvijftigste", "vijfenzestig", "vijfenzestigde", "vijfenzestigste",
+        "vijfenzeventig", "vijfenzeventigde", "vijfenzeventigste", "vijfste", "vijftien",
+        "vijftiende", "vijftiendede", "vijftiendeste", "vijftienste", "vijftig", "vijftigde",
+        "vijftigste", "vijftigstede", "vijftigsteste", "zes", "zesde", "zesdede", "zesdeste",
+        "zesendertig", "zesendertigde", "zesendertigste", "zesennegentig", "zesennegentigde",
+        "zesennegentigste", "zesentachtig", "zesentachtigde", "zesentachtigste", "zesentwintig",
+        "zesentwintigde", "zesentwintigste", "zesenveertig", "zesenveertigde", "zesenveertigste",
+        "zesenvijftig", "zesenvijftigde", "zesenvijftigste", "zesenzestig", "zesenzestigde",
+        "zesenzestigste", "zesenzeventig", "zesenzeventigde", "zesenzeventigste", "zesste",
+        "zestien", "zestiende", "zestiendede", "zestiendeste", "zestienste", "zestig", "zestigde",
+        "zestigste", "zestigstede", "zestigsteste", "zeven", "zevende", "zevendede", "zevendeste",
+        "zevenendertig", "zevenendertigde", "zevenendertigste", "zevenennegentig",
+        "zevenennegentigde", "zevenennegentigste", "zevenentachtig", "zevenentachtigde",
+        "zevenentachtigste", "zevenentwintig", "zevenentwintigde", "zevenentwintigste",
+        "zevenenveertig", "zevenenveertigde", "zevenenveertigste", "zevenenvijftig",
+        "zevenenvijftigde", "zevenenvijftigste", "zevenenzestig", "zevenenzestigde",
+        "zevenenzestigste", "zevenenzeventig", "zevenenzeventigde", "zevenenzeventigste",
+        "zevenste", "zeventien", "zeventiende", "zeventiendede", "zeventiendeste", "zeventienste",
+        "zeventig", "zeventigde", "zeventigste", "zeventigstede", "zeventigsteste",
+    ),
+    "no": (
+        "andre", "atten", "attende", "billion", "billioner", "elleve", "ellevte", "en", "ett",
+        "fem", "femte", "femten", "femtende", "femti", "femtien", "femtiende", "femtiett",
+        "femtifem", "femtifire", "femtini", "femtiseks", "femtisju", "femtito", "femtitre",
+        "femtiåtte", "fire", "fjerde", "fjorten", "fjortende", "første", "førti", "førtien",
+        "førtiende", "førtiett", "førtifem", "førtifire", "førtini", "førtiseks", "førtisju",
+        "førtito", "førtitre", "førtiåtte", "hundre", "hundrede", "hundrer", "komma", "milliard",
+        "milliarder", "million", "millioner", "minus", "ni", "niende", "nitten", "nittende",
+        "nitti", "nittien", "nittiende", "nittiett", "nittifem", "nittifire", "nittini",
+        "nittiseks", "nittisju", "nittito", "nittitre", "nittiåtte", "null", "o", "pluss", "seks",
+        "seksten", "sekstende", "seksti", "sekstien", "sekstiende", "sekstiett", "sekstifem",
+        "sekstifire", "sekstini", "sekstiseks", "sekstisju", "sekstito", "sekstitre", "sekstiåtte",
+        "sjette", "sju", "sjuende", "sytten", "syttende", "sytti", "syttien", "syttiende",
+        "syttiett", "syttifem", "syttifire", "syttini", "syttiseks", "syttisju", "syttito",
+        "syttitre", "syttiåtte", "syv", "syvende", "ti", "tiende", "tjue", "tjueen", "tjueett",
+        "tjuefem", "tjuefire", "tjuende", "tjueni", "tjueseks", "tjuesju", "tjueto", "tjuetre",
+        "tjueåtte", "to", "tolv", "tolvte", "tre", "tredje", "tretten", "trettende", "tretti",
+        "trettien", "trettiende", "trettiett", "trettifem", "trettifire", "trettini", "trettiseks",
+        "trettisju", "trettito", "trettitre", "trettiåtte", "tusen", "tusener", "åtte", "åttende",
+        "åtti", "åttien", "åttiende", "åttiett", "åttifem", "åttifire", "åttini", "åttiseks",
+        "åttisju", "åttito", "åttitre", "åttiåtte",
+    ),
+    "pt": (
+        "bilhao", "bilhoes", "bilhão", "bilhões", "catorze", "cem", "centena", "centenas", "cento",
+        "centésim", "cinco", "cinquenta", "dez", "dezanove", "dezasseis", "dezassete", "dezenove",
+        "dezesseis", "dezessete", "dezoito", "dois", "doze", "duas", "ducentésim", "duzentas",
+        "duzentos", "décim", "mais", "menos", "mil", "milhao", "milhar", "milhares", "milhoes",
+        "milhão", "milhões", "milionésim", "non", "nonagésim", "nonigentésim", "nove", "novecentas",
+        "novecentos", "noventa", "octagésim", "octigentésim", "oitav", "oitenta", "oito",
+        "oitocentas", "oitocentos", "onze", "primeir", "quadragésim", "quadrigentésim", "quarenta",
+        "quart", "quatorze", "quatro", "quatrocentas", "quatrocentos", "quingentésim", "quinhentas",
+        "quinhentos", "quinquagésim", "quint", "quinze", "segund", "seis", "seiscentas",
+        "seiscentos", "septagésim", "sessenta", "sete", "setecentas", "setecentos", "setenta",
+        "setingentésim", "sexagésim", "sexgentésim", "sext", "sétim", "terceir", "trecentésim",
+        "tres", "treze", "trezentas", "trezentos", "trigésim", "trilhao", "trilhoes", "trilhão",
+        "trilhões", "trinta", "três", "um", "uma", "vigésim", "vinte", "vírgula", "zero",
+    ),
+    "ru": (
+        "o", "oая", "oий", "oое", "oой", "oый", "oье", "oья", "восемнадцать", "восемнадцатьая",
+        "восемнадцатьий", "восемнадцатьое", "восемнадцатьой", "восемнадцатьый", "восемнадцатьье",
+        "восемнадцатьья", "восемсот", "восемсотая", "восемсотий", "восемсотое", "восемсотой",
+        "восемсотый", "восемсотье", "восемсотья", "восемь", "восемьая", "восемьдесят",
+        "восемьдесятая", "восемьдесятий", "восемьдесятое", "восемьдесятой", "восемьдесятый",
+        "восемьдесятье", "восемьдесятья", "восемьий", "восемьнадцать", "восемьнадцатьая",
+        "восемьнадцатьий", "восемьнадцатьое", "восемьнадцатьой", "восемьнадцатьый",
+        "восемьнадцатьье", "восемьнадцатьья", "восемьое", "восемьой", "восемьсот", "восемьсотая",
+        "восемьсотий", "восемьсотое", "восемьсотой", "восемьсотый", "восемьсотье", "восемьсотья",
+        "восемьый", "восемьье", "восемьья", "восмидесят", "восмидесятая", "восмидесятий",
+        "восмидесятое", "восмидесятой", "восмидесятый", "восмидесятье", "восмидесятья", "восьм",
+        "восьмая", "восьмий", "восьмое", "восьмой", "восьмый", "восьмье", "восьмья", "втор",
+        "вторая", "вторий", "второе", "второй", "вторый", "вторье", "вторья", "два", "дваая",
+        "двадцат", "двадцатая", "двадцатий", "двадцатое", "двадцатой", "двадцатый", "двадцать",
+        "двадцатьая", "двадцатье", "двадцатьий", "двадцатьое", "двадцатьой", "двадцатьый",
+        "двадцатьье", "двадцатьья", "двадцатья", "дваий", "дваое", "дваой", "дваый", "дваье",
+        "дваья", "две", "двеая", "двеий", "двенадцать", "двенадцатьая", "двенадцатьий",
+        "двенадцатьое", "двенадцатьой", "двенадцатьый", "двенадцатьье", "двенадцатьья", "двеое",
+        "двеой", "двести", "двестиая", "двестиий", "двестиое", "двестиой", "двестиый", "двестиье",
+        "двестиья", "двеый", "двеье", "двеья", "девяност", "девяностая", "девяностий", "девяносто",
+        "девяностоая", "девяностое", "девяностоий", "девяностой", "девяностоое", "девяностоой",
+        "девяностоый", "девяностоье", "девяностоья", "девяностый", "девяностье", "девяностья",
+        "девят", "девятая", "девятий", "девятнадцать", "девятнадцатьая", "девятнадцатьий",
+        "девятнадцатьое", "девятнадцатьой", "девятнадцатьый", "девятнадцатьье", "девятнадцатьья",
+        "девятое", "девятой", "девятсот", "девятсотая", "девятсотий", "девятсотое", "девятсотой",
+        "девятсотый", "девятсотье", "девятсотья", "девятый", "девять", "девятьая", "девятье",
+        "девятьий", "девятьое", "девятьой", "девятьсот", "девятьсотая", "девятьсотий",
+        "девятьсотое", "девятьсотой", "девятьсотый", "девятьсотье", "девятьсотья", "девятьый",
+        "девятьье", "девятьья", "девятья", "десят", "десятая", "десятий", "десятое", "десятой",
+        "десятый", "десять", "десятьая", "десятье", "десятьий", "десятьое", "десятьой", "десятьый",
+        "десятьье", "десятьья", "десятья", "миллиард", "миллиарда", "миллиардаая", "миллиардаий",
+        "миллиардаое", "миллиардаой", "миллиардаый", "миллиардаье", "миллиардаья", "миллиардая",
+        "миллиардий", "миллиардн", "миллиардная", "миллиардний", "миллиардное", "миллиардной",
+        "миллиардный", "миллиарднье", "миллиарднья", "миллиардов", "миллиардовая", "миллиардовий",
+        "миллиардовое", "миллиардовой", "миллиардовый", "миллиардовье", "миллиардовья",
+        "миллиардое", "миллиардой", "миллиардый", "миллиардье", "миллиардья", "миллион", "миллиона",
+        "миллионаая", "миллионаий", "миллионаое", "миллионаой", "миллионаый", "миллионаье",
+        "миллионаья", "миллионая", "миллионий", "миллионн", "миллионная", "миллионний",
+        "миллионное", "миллионной", "миллионный", "миллионнье", "миллионнья", "миллионов",
+        "миллионовая", "миллионовий", "миллионовое", "миллионовой", "миллионовый", "миллионовье",
+        "миллионовья", "миллионое", "миллионой", "миллионый", "миллионье", "миллионья", "минус",
+        "минусая", "минусий", "минусое", "минусой", "минусый", "минусье", "минусья", "ноль",
+        "нольая", "нольий", "нольое", "нольой", "нольый", "нольье", "нольья", "один", "одинадцать",
+        "одинадцатьая", "одинадцатьий", "одинадцатьое", "одинадцатьой", "одинадцатьый",
+        "одинадцатьье", "одинадцатьья", "одиная", "одиний", "одиннадцать", "одиннадцатьая",
+        "одиннадцатьий", "одиннадцатьое", "одиннадцатьой", "одиннадцатьый", "одиннадцатьье",
+        "одиннадцатьья", "одиное", "одиной", "одиный", "одинье", "одинья", "одна", "однаая",
+        "однаий", "однаое", "однаой", "однаый", "однаье", "однаья", "перв", "первая", "первий",
+        "первое", "первой", "первый", "первье", "первья", "плюс", "плюсая", "плюсий", "плюсое",
+        "плюсой", "плюсый", "плюсье", "плюсья", "пят", "пятая", "пятидесят", "пятидесятая",
+        "пятидесятий", "пятидесятое", "пятидесятой", "пятидесятый", "пятидесятье", "пятидесятья",
+        "пятий", "пятнадцать", "пятнадцатьая", "пятнадцатьий", "пятнадцатьое", "пятнадцатьой",
+        "пятнадцатьый", "пятнадцатьье", "пятнадцатьья", "пятое", "пятой", "пятсот", "пятсотая",
+        "пятсотий", "пятсотое", "пятсотой", "пятсотый", "пятсотье", "пятсотья", "пятый", "пять",
+        "пятьая", "пятьдесят", "пятьдесятая", "пятьдесятий", "пятьдесятое", "пятьдесятой",
+        "пятьдесятый", "пятьдесятье", "пятьдесятья", "пятье", "пятьий", "пятьнадцать",
+        "пятьнадцатьая", "пятьнадцатьий", "пятьнадцатьое", "пятьнадцатьой", "пятьнадцатьый",
+        "пятьнадцатьье", "пятьнадцатьья", "пятьое", "пятьой", "пятьсот", "пятьсотая", "пятьсотий",
+        "пятьсотое", "пятьсотой", "пятьсотый", "пятьсотье", "пятьсотья", "пятьый", "пятьье",
+        "пятьья", "пятья", "седьм", "седьмая", "седьмий", "седьмое", "седьмой", "седьмый",
+        "седьмье", "седьмья", "семидесят", "семидесятая", "семидесятий", "семидесятое",
+        "семидесятой", "семидесятый", "семидесятье", "семидесятья", "семнадцать", "семнадцатьая",
+        "семнадцатьий", "семнадцатьое", "семнадцатьой", "семнадцатьый", "семнадцатьье",
+        "семнадцатьья", "семсот", "семсотая", "семсотий", "семсотое", "семсотой", "семсотый",
+        "семсотье", "семсотья", "семь", "семьая", "семьдесят", "семьдесятая", "семьдесятий",
+        "семьдесятое", "семьдесятой", "семьдесятый", "семьдесятье", "семьдесятья", "семьий",
+        "семьнадцать", "семьнадцатьая", "семьнадцатьий", "семьнадцатьое", "семьнадцатьой",
+        "семьнадцатьый", "семьнадцатьье", "семьнадцатьья", "семьое", "семьой", "семьсот",
+        "семьсотая", "семьсотий", "семьсотое", "семьсотой", "семьсотый", "семьсотье", "семьсотья",
+        "семьый", "семьье", "семьья", "сорок", "сорокая", "сорокий", "сороков", "сороковая",
+        "сороковий", "сороковое", "сороковой", "сороковый", "сороковье", "сороковья", "сорокое",
+        "сорокой", "сорокый", "сорокье", "сорокья", "сот", "сотая", "сотен", "сотеная", "сотений",
+        "сотеное", "сотеной", "сотеный", "сотенье", "сотенья", "сотий", "сотни", "сотниая",
+        "сотниий", "сотниое", "сотниой", "сотниый", "сотниье", "сотниья", "сотня", "сотняая",
+        "сотняий", "сотняое", "сотняой", "сотняый", "сотняье", "сотняья", "сотое", "сотой", "сотый",
+        "сотье", "сотья", "сто", "стоая", "стоий", "стоое", "стоой", "стоый", "стоье", "стоья",
+        "точка", "точка,целых,целая", "точка,целых,целаяая", "точка,целых,целаяий",
+        "точка,целых,целаяое", "точка,целых,целаяой", "точка,целых,целаяый", "точка,целых,целаяье",
+        "точка,целых,целаяья", "точкаая", "точкаий", "точкаое", "точкаой", "точкаый", "точкаье",
+        "точкаья", "трет", "третая", "третий", "третое", "третой", "третый", "третье", "третья",
+        "три", "триая", "тридцат", "тридцатая", "тридцатий", "тридцатое", "тридцатой", "тридцатый",
+        "тридцать", "тридцатьая", "тридцатье", "тридцатьий", "тридцатьое", "тридцатьой",
+        "тридцатьый", "тридцатьье", "тридцатьья", "тридцатья", "триий", "триллион", "триллиона",
+        "триллионаая", "триллионаий", "триллионаое", "триллионаой", "триллионаый", "триллионаье",
+        "триллионаья", "триллионая", "триллионий", "триллионн", "триллионная", "триллионний",
+        "триллионное", "триллионной", "триллионный", "триллионнье", "триллионнья", "триллионов",
+        "триллионовая", "триллионовий", "триллионовое", "триллионовой", "триллионовый",
+        "триллионовье", "триллионовья", "триллионое", "триллионой", "триллионый", "триллионье",
+        "триллионья", "тринадцать", "тринадцатьая", "тринадцатьий", "тринадцатьое", "тринадцатьой",
+        "тринадцатьый", "тринадцатьье", "тринадцатьья", "триое", "триой", "триста", "тристаая",
+        "тристаий", "тристаое", "тристаой", "тристаый", "тристаье", "тристаья", "тристо",
+        "тристоая", "тристоий", "тристоое", "тристоой", "тристоый", "тристоье", "тристоья", "триый",
+        "триье", "триья", "тысяч", "тысяча", "тысячаая", "тысячаий", "тысячаое", "тысячаой",
+        "тысячаый", "тысячаье", "тысячаья", "тысячая", "тысячи", "тысячиая", "тысячиий", "тысячий",
+        "тысячиое", "тысячиой", "тысячиый", "тысячиье", "тысячиья", "тысячн", "тысячная",
+        "тысячний", "тысячное", "тысячной", "тысячный", "тысячнье", "тысячнья", "тысячое",
+        "тысячой", "тысячый", "тысячье", "тысячья", "целая", "целаяая", "целаяий", "целаяое",
+        "целаяой", "целаяый", "целаяье", "целаяья", "целых", "целыхая", "целыхий", "целыхое",
+        "целыхой", "целыхый", "целыхье", "целыхья", "четверт", "четвертая", "четвертий",
+        "четвертое", "четвертой", "четвертый", "четвертье", "четвертья", "четвёрт", "четвёртая",
+        "четвёртий", "четвёртое", "четвёртой", "четвёртый", "четвёртье", "четвёртья", "четыре",
+        "четыреая", "четыреий", "четыреое", "четыреой", "четыреста", "четырестаая", "четырестаий",
+        "четырестаое", "четырестаой", "четырестаый", "четырестаье", "четырестаья", "четыресто",
+        "четырестоая", "четырестоий", "четырестоое", "четырестоой", "четырестоый", "четырестоье",
+        "четырестоья", "четыреый", "четыреье", "четыреья", "четырнадцать", "четырнадцатьая",
+        "четырнадцатьий", "четырнадцатьое", "четырнадцатьой", "четырнадцатьый", "четырнадцатьье",
+        "четырнадцатьья", "шест", "шестая", "шестидесят", "шестидесятая", "шестидесятий",
+        "шестидесятое", "шестидесятой", "шестидесятый", "шестидесятье", "шестидесятья", "шестий",
+        "шестнадцать", "шестнадцатьая", "шестнадцатьий", "шестнадцатьое", "шестнадцатьой",
+        "шестнадцатьый", "шестнадцатьье", "шестнадцатьья", "шестое", "шестой", "шестсот",
+        "шестсотая", "шестсотий", "шестсотое", "шестсотой", "шестсотый", "шестсотье", "шестсотья",
+        "шестый", "шесть", "шестьая", "шестьдесят", "шестьдесятая", "шестьдесятий", "шестьдесятое",
+        "шестьдесятой", "шестьдесятый", "шестьдесятье", "шестьдесятья", "шестье", "шестьий",
+        "шестьнадцать", "шестьнадцатьая", "шестьнадцатьий", "шестьнадцатьое", "шестьнадцатьой",
+        "шестьнадцатьый", "шестьнадцатьье", "шестьнадцатьья", "шестьое", "шестьой", "шестьсот",
+        "шестьсотая", "шестьсотий", "шестьсотое", "шестьсотой", "шестьсотый", "шестьсотье",
+        "шестьсотья", "шестьый", "шестьье", "шестьья", "шестья",
+    ),
+}
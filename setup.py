@@ -17,7 +17,7 @@ setup(
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.7",
         "Topic :: Text Processing :: Linguistic",
         "Topic :: Text Processing :: Filters",
         "Natural Language :: French",
@@ -34,8 +34,8 @@ setup(
     author="Allo-Media",
     author_email="contact@allo-media.fr",
     license="MIT",
-    packages=find_packages(),
-    python_requires=">=3.6",
+    packages=find_packages(exclude=["benchmarks"]),
+    python_requires=">=3.7",
     test_suite="tests",
     include_package_data=True,
     zip_safe=False,
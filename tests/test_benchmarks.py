@@ -0,0 +1,65 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the benchmark suite runs.
+"""
+from unittest import TestCase
+
+from benchmarks.corpora import NUMBERS, WORKLOADS
+from benchmarks.suite import BENCHES, run_cold_start, run_suite
+from benchmarks.words import NUMBER_WORDS
+from text_to_num import text2num
+from text_to_num.lang import LANG
+
+
+class TestBenchmarks(TestCase):
+    def test_corpora(self):
+        self.assertEqual(set(NUMBERS), set(LANG))
+        self.assertEqual(set(NUMBER_WORDS), set(LANG))
+        for lang, numbers in NUMBERS.items():
+            for number in numbers:
+                text2num(number, lang)
+            for workload in WORKLOADS.values():
+                self.assertTrue(workload(lang, count=2).texts)
+
+    def test_suite(self):
+        results = list(run_suite(["en", "de", "it"], min_time=0.0001))
+        # the value parser benchmarks only apply to the languages of their parser
+        self.assertEqual(len(results), len(WORKLOADS) * (3 * len(BENCHES) - 6))
+        benches = {(result.lang, result.bench) for result in results if result.bench.endswith(".push")}
+        self.assertEqual(
+            benches,
+            {
+                ("en", "WordStreamValueAutomaton.push"),
+                ("en", "WordStreamValueParser.push"),
+                ("de", "WordStreamValueParserGerman.push"),
+            },
+        )
+        for result in results:
+            self.assertGreater(result.tokens_per_s, 0)
+
+    def test_cold_start(self):
+        (result,) = run_cold_start(["fr"], runs=1)
+        self.assertEqual((result.lang, result.workload, result.calls), ("fr", "cold-start", 2))
+        self.assertGreater(result.us_per_call, 0)
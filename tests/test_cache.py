@@ -0,0 +1,144 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the result caches.
+"""
+from threading import Thread
+from unittest import TestCase
+
+from text_to_num import alpha2digit, alpha2digit_many, text2num, text2num_many, try_text2num
+from text_to_num.cache import CacheInfo, CallStats, LRUCache
+
+
+class TestLRUCache(TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)  # evicts "b"
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.info(), CacheInfo(hits=2, misses=1, evictions=1, maxsize=2, currsize=2))
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 0, 2, 0))
+        self.assertRaises(ValueError, LRUCache, 0)
+
+    def test_threads(self):
+        cache = LRUCache(50)
+
+        def work():
+            for i in range(1000):
+                cache.put(i % 100, i)
+                cache.get((i + 1) % 100)
+
+        threads = [Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 4000)
+        self.assertEqual(info.currsize, 50)
+
+
+class TestText2numCache(TestCase):
+    def test_text2num(self):
+        cache = LRUCache(10)
+        self.assertEqual(text2num("twenty one", "en", cache=cache), 21)
+        self.assertEqual(text2num(" twenty  one ", "en", cache=cache), 21)
+        self.assertEqual(text2num("twenty one", "en", relaxed=True, cache=cache), 21)
+        self.assertEqual(cache.info().hits, 1)
+        self.assertEqual(cache.info().currsize, 2)
+
+    def test_errors(self):
+        cache = LRUCache(10)
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "invalid literal"):
+                text2num("fifty fifty", "en", cache=cache)
+        self.assertEqual(cache.info()[:2], (1, 1))
+        self.assertEqual(
+            text2num_many(["fifty fifty", "fifty"], "en", errors="none", cache=cache), [None, 50]
+        )
+        self.assertEqual(cache.info()[:2], (2, 2))
+        self.assertIsNone(try_text2num("fifty fifty", "en", cache=cache))
+        self.assertEqual(cache.info()[:2], (3, 2))
+
+    def test_languages(self):
+        cache = LRUCache(10)
+        self.assertEqual(text2num("zweiundzwanzig", "de", cache=cache), 22)
+        self.assertEqual(text2num("ventidue", "it", cache=cache), 22)
+        self.assertEqual(text2num("vingt-deux", "fr", cache=cache), 22)
+        self.assertEqual(text2num("zweiundzwanzig", "de", cache=cache), 22)
+        self.assertEqual(cache.info().hits, 1)
+
+
+class TestAlpha2digitCache(TestCase):
+    def test_segments(self):
+        cache = LRUCache(10)
+        stats = CallStats()
+        self.assertEqual(
+            alpha2digit("Press two. Thank you. Press two.", "en", cache=cache, stats=stats),
+            "Press 2. Thank you. Press 2.",
+        )
+        self.assertEqual((stats.hits, stats.misses), (1, 3))
+        self.assertEqual(
+            alpha2digit_many(["Press two.", "Press two!"], "en", cache=cache, stats=stats),
+            ["Press 2.", "Press 2!"],
+        )
+        self.assertEqual((stats.hits, stats.misses), (5, 3))
+        self.assertEqual(cache.info().hits, 5)
+
+    def test_shared_stats(self):
+        cache = LRUCache(10)
+        stats = CallStats()
+
+        def work():
+            for _ in range(200):
+                alpha2digit("Press two. Thank you.", "en", cache=cache, stats=stats)
+
+        threads = [Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 3 segments per text, with the empty one at the end
+        self.assertEqual(stats.hits + stats.misses, 2400)
+        self.assertEqual(stats.misses, cache.info().misses)
+
+    def test_options(self):
+        cache = LRUCache(10)
+        self.assertEqual(alpha2digit("minus three", "en", cache=cache), "-3")
+        self.assertEqual(alpha2digit("minus three", "en", signed=False, cache=cache), "minus 3")
+        self.assertEqual(alpha2digit("the third", "en", cache=cache), "the third")
+        self.assertEqual(alpha2digit("the third", "en", ordinal_threshold=0, cache=cache), "the 3rd")
+        self.assertEqual(cache.info().hits, 0)
+
+    def test_german(self):
+        cache = LRUCache(10)
+        for _ in range(2):
+            self.assertEqual(
+                alpha2digit("Zweiundzwanzig, bitte.", "de", cache=cache), "22, bitte."
+            )
+        self.assertEqual(cache.info()[:2], (3, 3))
@@ -0,0 +1,98 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test the conversions bound to a language and options.
+"""
+from threading import Thread
+from unittest import TestCase
+
+from text_to_num import Converter, alpha2digit, alpha2digit_stream, extract_numbers, text2num
+from text_to_num.cache import CallStats, LRUCache
+
+
+class TestConverter(TestCase):
+    def test_text2num(self):
+        converter = Converter("fr", relaxed=True)
+        text = "quatre vingt quinze"
+        self.assertEqual(converter.text2num(text), text2num(text, "fr", relaxed=True))
+        self.assertIsNone(converter.try_text2num("mille mille deux cents"))
+        self.assertRaises(ValueError, converter.text2num, "mille mille deux cents")
+        self.assertEqual(Converter("de").text2num("zweiundzwanzig"), 22)
+
+    def test_alpha2digit(self):
+        text = "Il en a vingt et un, et moins trois. Le premier et le cinquième."
+        for options in ({}, {"relaxed": True}, {"signed": False, "ordinal_threshold": 0}):
+            converter = Converter("fr", **options)
+            self.assertEqual(converter.alpha2digit(text), alpha2digit(text, "fr", **options))
+        text = "Ich habe einundzwanzig Hunde und minus drei Katzen"
+        self.assertEqual(Converter("de").alpha2digit(text), alpha2digit(text, "de"))
+
+    def test_stream(self):
+        converter = Converter("en")
+        lines = ["twenty one, thirty\n", "three. Fourty two\n"]
+        self.assertEqual(
+            "".join(converter.alpha2digit_stream(lines)), "".join(alpha2digit_stream(lines, "en"))
+        )
+
+    def test_extract_numbers(self):
+        text = "twenty one and the fifth, minus four"
+        self.assertEqual(
+            [repr(match) for match in Converter("en").extract_numbers(text)],
+            [repr(match) for match in extract_numbers(text, "en")],
+        )
+        self.assertRaises(Exception, Converter("de").extract_numbers, "zwei")
+
+    def test_pt_ordinal_merge(self):
+        text = "vigésimo sétimo andar"
+        self.assertEqual(Converter("pt").alpha2digit(text), "27º andar")
+        self.assertEqual(Converter("pt", pt_ordinal_merge=False).alpha2digit(text), "20º 7º andar")
+        self.assertEqual(Converter("pt").alpha2digit(text), alpha2digit(text, "pt"))
+
+    def test_cache(self):
+        cache, stats = LRUCache(10), CallStats()
+        converter = Converter("en", cache=cache, stats=stats)
+        for _ in range(2):
+            self.assertEqual(converter.alpha2digit("twenty one"), "21")
+            self.assertIsNone(converter.try_text2num("fifty fifty"))
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(cache.info()[:2], (2, 2))
+
+    def test_threads(self):
+        converter = Converter("en")
+        texts = ["{} apples and {} pears".format(*pair) for pair in (
+            ("one", "two"), ("twenty one", "thirty"), ("a hundred", "nine thousand and five"),
+        )]
+        expected = [alpha2digit(text, "en") for text in texts]
+        failures = []
+
+        def run():
+            for _ in range(200):
+                if [converter.alpha2digit(text) for text in texts] != expected:
+                    failures.append(True)
+
+        threads = [Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
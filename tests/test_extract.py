@@ -0,0 +1,68 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the number extraction.
+"""
+from unittest import TestCase
+
+from text_to_num import extract_numbers
+from text_to_num.extract import CARDINAL, DECIMAL, ORDINAL, SIGNED, ZERO_LED
+
+
+class TestExtractNumbers(TestCase):
+    def spans(self, text, lang, **options):
+        return [
+            (text[match.start:match.end], match.digits, match.value, match.kind)
+            for match in extract_numbers(text, lang, **options)
+        ]
+
+    def test_cardinals(self):
+        text = "I have twenty-one cats and one hundred  two dogs, one of them is old."
+        self.assertEqual(
+            self.spans(text, "en"),
+            [
+                ("twenty-one", "21", 21, CARDINAL),
+                ("one hundred  two", "102", 102, CARDINAL),
+            ],
+        )
+        self.assertEqual(self.spans("no number here", "en"), [])
+
+    def test_kinds(self):
+        self.assertEqual(
+            self.spans("the twenty-fifth, the first", "en"),
+            [("twenty-fifth", "25th", 25, ORDINAL)],
+        )
+        self.assertEqual(
+            self.spans("moins vingt degrés", "fr"), [("moins vingt", "-20", -20, SIGNED)]
+        )
+        self.assertEqual(
+            self.spans("trois virgule cinq", "fr"), [("trois virgule cinq", "3,5", 3.5, DECIMAL)]
+        )
+        self.assertEqual(
+            self.spans("zero zero seven", "en"), [("zero zero seven", "007", 7, ZERO_LED)]
+        )
+
+    def test_german(self):
+        with self.assertRaisesRegex(Exception, "Language not supported"):
+            extract_numbers("zwei", "de")
@@ -0,0 +1,87 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the incremental conversion of growing texts.
+"""
+from unittest import TestCase
+
+from text_to_num import IncrementalConverter, alpha2digit
+
+
+class TestIncrementalConverter(TestCase):
+    def check(self, lang, versions, **options):
+        converter = IncrementalConverter(lang, **options)
+        for text in versions:
+            self.assertEqual(converter.update(text), alpha2digit(text, lang, **options))
+        return converter
+
+    def test_growing(self):
+        text = "I have twenty. Then twenty one, and thirty three thousand. Minus four"
+        converter = self.check("en", [text[:end] for end in range(len(text) + 1)])
+        self.assertEqual(converter.closed, "I have twenty. Then twenty one, and thirty three thousand. ")
+        self.assertEqual(converter.converted, "I have 20. Then 21, and 33000. ")
+
+    def test_revisions(self):
+        self.check(
+            "en",
+            [
+                "twenty. one",
+                "twenty. one hundred, fifty",
+                "twenty. one hundred",
+                "twenty. one hundred...",
+                "twenty  . forty two",
+                "",
+                "minus three.",
+            ],
+            signed=False,
+        )
+
+    def test_word_revisions(self):
+        # the open segment is taken up from the words that changed
+        self.check(
+            "fr",
+            [
+                "il y a vingt",
+                "il y a vingt et",
+                "il y a vingt et un",
+                "il y a vingt et une pommes",
+                "il y a vingt deux",
+                "il y a vingt-deux virgule cinq",
+                "Il y a vingt-deux virgule cinq",
+                "il y a",
+            ],
+        )
+        self.check("de", ["zwei und", "zwei und zwanzig", "zwei und Hund", "zwei"])
+
+    def test_separators(self):
+        # a closed separator can still grow with the next version
+        self.check("fr", ["vingt \nun", "vingt \n. trois", "vingt \n.\ttrois"])
+        self.check("pt", ["vigésimo. primeiro", "vigésimo. primeiro\nsegundo"])
+        self.check("de", ["zweiundzwanzig, drei", "zweiundzwanzig, dreiundvierzig"])
+
+    def test_reset(self):
+        converter = self.check("es", ["uno, dos, tres"])
+        converter.reset()
+        self.assertEqual(converter.closed, "")
+        self.assertEqual(converter.update("veintidós"), "22")
@@ -0,0 +1,221 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the compiled language tables.
+"""
+import re
+import subprocess
+import sys
+from unittest import TestCase
+
+from text_to_num.lang import LANG, English, LanguageRegistry
+from text_to_num.lang.base import (
+    CompoundSplitter,
+    NOT_NUMBER,
+    UNIT,
+    MTEN,
+    MTEN_WSTEN,
+    MHUNDRED,
+    MULTIPLIER,
+    TERMINAL,
+    split_segments,
+)
+
+
+class TestTokenTable(TestCase):
+    def test_all_numbers(self):
+        for code, language in LANG.items():
+            for word, value in language.NUMBERS.items():
+                token = language.lookup(word)
+                self.assertIsNotNone(token, (code, word))
+                self.assertNotEqual(token.kind, NOT_NUMBER, (code, word))
+
+    def test_classes(self):
+        self.assertEqual(LANG["en"].lookup("hundred").kind, MULTIPLIER)
+        self.assertEqual(LANG["en"].lookup("twenty-one").kind, TERMINAL)
+        self.assertEqual(LANG["fr"].lookup("soixante").kind, MTEN_WSTEN)
+        self.assertEqual(LANG["fr"].lookup("trente").kind, MTEN)
+        self.assertEqual(LANG["ru"].lookup("двести").kind, MHUNDRED)
+        self.assertEqual(LANG["ru"].lookup("двести").value, 200)
+
+    def test_normalized_forms(self):
+        token = LANG["ru"].lookup("одна")
+        self.assertEqual(token.word, "один")
+        self.assertEqual(token.kind, UNIT)
+        self.assertEqual(LANG["fr"].lookup("quatre-vingts").word, "quatre-vingt")
+        self.assertEqual(LANG["fr"].lookup("quatre-vingts-deux").value, 82)
+        self.assertEqual(LANG["nl"].lookup("Twee").value, 2)
+        self.assertEqual(LANG["no"].lookup("syv").value, 7)
+
+    def test_flags(self):
+        english = LANG["en"]
+        self.assertTrue(english.lookup("zero").is_zero)
+        self.assertEqual(english.lookup("minus").sign, "-")
+        self.assertTrue(english.lookup("point").is_decimal_sep)
+        self.assertTrue(LANG["ru"].lookup("целых").is_decimal_sep)
+        self.assertEqual(LANG["fr"].lookup("quatre").relaxed[1].value, 80)
+        self.assertIsNone(english.lookup("cat"))
+
+
+class TestVocabulary(TestCase):
+    def test_no_number(self):
+        for code, language in LANG.items():
+            self.assertFalse(language.may_contain_number("The cat (Tom) sat on a mat."), code)
+
+    def test_numbers(self):
+        for code, language in LANG.items():
+            for word in language.NUMBERS:
+                self.assertTrue(language.may_contain_number(f"abc {word.upper()}, def"), (code, word))
+
+    def test_ordinals(self):
+        cases = [
+            ("en", "the twenty-fifth time"),
+            ("en", "the thirtieth"),
+            ("fr", "la vingt-deuxième fois"),
+            ("fr", "la neuvième"),
+            ("ca", "el cinquè"),
+            ("nl", "de derde"),
+            ("no", "den første"),
+            ("ru", "двадцатый"),
+            ("pt", "o vigésimo"),
+            ("pt", "o 1º"),
+            ("de", "der Einundzwanzigste"),
+            ("de", "der erste"),
+        ]
+        for code, text in cases:
+            self.assertTrue(LANG[code].may_contain_number(text), (code, text))
+        # digits are left as they are
+        self.assertFalse(LANG["pt"].may_contain_number("1\ncarro"))
+
+    def test_compounds(self):
+        german = LANG["de"]
+        self.assertTrue(german.may_contain_number("Zweihundertfünfzig Euro"))
+        self.assertTrue(german.may_contain_number("das plus ist gut"))
+        self.assertFalse(german.may_contain_number("das ist gut"))
+
+
+class TestCompoundSplitter(TestCase):
+    def test_split(self):
+        splitter = CompoundSplitter(["drei", "dreizehn", "zehn", "und", "zwanzig"], suffixes=["ste", "sten"])
+        self.assertEqual(splitter.split("dreiundzwanzig"), ("drei", "und", "zwanzig"))
+        self.assertEqual(splitter.split("dreizehn zehn"), ("dreizehn", "zehn"))
+        self.assertEqual(splitter.split("xydrei zwanzigsten"), ("xy", "drei", "zwanzig"))
+        self.assertEqual(splitter.split("sten dreixste"), ("sten", "drei", "xste"))
+        self.assertIs(splitter.split("dreizehn"), splitter.split("dreizehn"))
+
+    def test_backtrack(self):
+        words = ["cento", "cent", "otto", "tto"]
+        self.assertEqual(CompoundSplitter(words[:3]).split("centotto"), ("cento", "tto"))
+        self.assertEqual(CompoundSplitter(words[:3], backtrack=True).split("centotto"), ("cent", "otto"))
+        self.assertEqual(CompoundSplitter(words, backtrack=True).split("centotto"), ("cento", "tto"))
+
+    def test_languages(self):
+        from text_to_num.lang.italian import iWtoN  # loaded with the language
+
+        for code, word, split in (
+            ("de", "Zweihunderteinundzwanzigste", "zwei hundert ein und zwanzig "),
+            ("de", "dreitausendx", "drei tausend x "),
+            ("no", "tjuesjusju", "tjuesjusju"),
+        ):
+            self.assertEqual(LANG[code].split_number_word(word), split, word)
+        self.assertEqual(LANG["no"].splitter().split("tjuesju"), ("tjue", "sju"))
+        self.assertEqual(iWtoN.split("milleottocentottantuno"), ("mille", "otto", "cent", "ottant", "uno"))
+
+
+class TestOrdinalTable(TestCase):
+    def test_ordinals(self):
+        for code, word, cardinal, ordinal in (
+            ("en", "twenty-first", "twenty-one", "21st"),
+            ("en", "thirtieths", "thirty", "21ths"),
+            ("fr", "vingt-deuxième", "vingt-deux", "21ème"),
+            ("fr", "première", "un", "1ère"),
+            ("ca", "cinquenes", "cinc", "21es"),
+            ("ca", "segones", "dos", "2es"),
+            ("pt", "vigésima", "vinte", "21ª"),
+            ("de", "Einundzwanzigste", "einundzwanzig", "21."),
+            ("nl", "derde", "drie", "21de"),
+            ("no", "første", "en", "21."),
+            ("ru", "двадцатый", "двадцать", "21ый"),
+        ):
+            language = LANG[code]
+            self.assertEqual(language.ord2card(word), cardinal, word)
+            self.assertEqual(language.num_ord("21", word), ordinal, word)
+
+    def test_not_ordinals(self):
+        for code, word in (("en", "one"), ("en", "th"), ("fr", "ième"), ("pt", "vigésime"), ("ru", "ый")):
+            self.assertIsNone(LANG[code].ord2card(word), word)
+
+    def test_compiled_once(self):
+        self.assertIs(LANG["en"].ordinal_table(), LANG["en"].ordinal_table())
+        self.assertIn("twenty-first", LANG["en"].ordinal_table())
+
+
+class TestSplitSegments(TestCase):
+    def test_split_segments(self):
+        separator = re.compile(r"\s*[,.]+\s*|\n")
+        for text in ("", "a", "a, b. c", ", a,\n", "a b\n\nc ...", "..."):
+            segments = separator.split(text)
+            punct = separator.findall(text) + [""]
+            self.assertEqual(list(split_segments(separator, text)), list(zip(segments, punct)), text)
+
+
+class TestRegistry(TestCase):
+    def test_lazy_import(self):
+        script = (
+            "import sys; from text_to_num import alpha2digit; from text_to_num.lang import LANG; "
+            "print(alpha2digit('twenty one', 'en'), 'de' in LANG, LANG.loaded(), "
+            "sorted(m for m in sys.modules if m.startswith('text_to_num.lang.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout
+        self.assertEqual(
+            output.strip(), "21 True ('en',) ['text_to_num.lang.base', 'text_to_num.lang.english']"
+        )
+        # the modules of the other APIs are only imported with them
+        script = (
+            "import sys; from text_to_num import alpha2digit; "
+            "lazy = ['text_to_num.converter', 'text_to_num.extract', 'text_to_num.incremental']; "
+            "print([m for m in lazy if m in sys.modules]); "
+            "from text_to_num import Converter, IncrementalConverter, extract_numbers; "
+            "print([m for m in lazy if m in sys.modules])"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout
+        self.assertEqual(
+            output.split("\n")[:2],
+            ["[]", "['text_to_num.converter', 'text_to_num.extract', 'text_to_num.incremental']"],
+        )
+
+    def test_mapping(self):
+        self.assertEqual(list(LANG), ["fr", "en", "es", "pt", "de", "ca", "ru", "it", "nl", "no"])
+        self.assertEqual(len(LANG), 10)
+        self.assertIs(LANG["en"], LANG["en"])
+        self.assertIs(type(LANG["en"]), English)
+        for code, language in LANG.items():
+            self.assertEqual(language.ISO_CODE, code)
+        self.assertNotIn("xx", LANG)
+        self.assertRaises(KeyError, LANG.__getitem__, "xx")
+        self.assertIsInstance(LANG, LanguageRegistry)
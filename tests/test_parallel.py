@@ -0,0 +1,88 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the parallel batch conversions.
+"""
+from unittest import TestCase
+
+from text_to_num import alpha2digit, text2num
+from text_to_num.lang import LANG
+from text_to_num.lang.italian import iWtoN
+from text_to_num.parallel import (
+    alpha2digit_parallel,
+    chunk,
+    preload,
+    process_pool,
+    text2num_parallel,
+)
+
+
+class TestParallel(TestCase):
+    def test_chunk(self):
+        texts = ["x" * 1000] * 10
+        self.assertEqual([len(c) for c in chunk(texts, 2, chunksize=4)], [4, 4, 2])
+        self.assertEqual([len(c) for c in chunk(texts, 2)], [2, 2, 2, 2, 2])
+        self.assertEqual(len(chunk(texts, 100)), 5)
+        self.assertEqual(chunk([], 2), [])
+
+    def test_alpha2digit(self):
+        texts = [f"{n} vingt et un chats, moins trois" for n in range(50)]
+        expected = [alpha2digit(text, "fr", signed=False) for text in texts]
+        self.assertEqual(
+            alpha2digit_parallel(texts, "fr", signed=False, max_workers=2, chunksize=7), expected
+        )
+        # single chunk: no worker
+        self.assertEqual(alpha2digit_parallel(texts, "fr", signed=False), expected)
+
+    def test_text2num(self):
+        texts = ["twenty-one", "one hundred", "cat"] * 10
+        with process_pool(["en"], max_workers=2) as pool:
+            values = text2num_parallel(texts, "en", errors="none", executor=pool, chunksize=4)
+            self.assertEqual(values, [21, 100, None] * 10)
+            with self.assertRaises(ValueError):
+                text2num_parallel(texts, "en", executor=pool, chunksize=4)
+        self.assertEqual(text2num_parallel(texts[:2], "en"), [text2num(t, "en") for t in texts[:2]])
+
+    def test_preload(self):
+        preload("en", "de")
+        for code in ("en", "de"):
+            language_class = type(LANG[code])
+            self.assertIn("_ordinal_table", language_class.__dict__, code)
+            self.assertIn("_automaton", language_class.__dict__, code)
+        self.assertIn("_splitter", type(LANG["de"]).__dict__)
+        self.assertNotIn("_splitter", type(LANG["en"]).__dict__)
+
+        italian_class = type(LANG["it"])
+        if "_automaton" in italian_class.__dict__:
+            delattr(italian_class, "_automaton")
+        iWtoN.splitter = None
+        # text2num reads the Italian numbers with iWtoN only
+        preload("it", alpha2digit=False)
+        self.assertIsNotNone(iWtoN.splitter)
+        self.assertIn("_ordinal_table", italian_class.__dict__)
+        self.assertNotIn("_automaton", italian_class.__dict__)
+        preload("it")
+        self.assertIn("_automaton", italian_class.__dict__)
+        self.assertEqual(alpha2digit("venti gatti", "it"), "20 gatti")
+        self.assertEqual(text2num("duemilatrecentoventuno", "it"), 2321)
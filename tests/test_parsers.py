@@ -0,0 +1,225 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the parser classes.
+"""
+from random import Random
+from unittest import TestCase
+
+from text_to_num.lang import LANG
+from text_to_num.parsers import (
+    WordStreamValueAutomaton,
+    WordStreamValueParser,
+    WordStreamValueParserGerman,
+    WordToDigitParser,
+    WordToDigitParserGerman,
+)
+from text_to_num.transforms import look_ahead
+
+
+class TestParsers(TestCase):
+    def test_slots(self):
+        parser = WordToDigitParser(LANG["en"])
+        self.assertFalse(hasattr(parser, "__dict__"))
+        self.assertFalse(hasattr(parser.int_builder, "__dict__"))
+
+    def test_value_parser_reset(self):
+        parser = WordStreamValueParser(LANG["en"])
+        for word in "three hundred twelve".split():
+            self.assertTrue(parser.push(word))
+        self.assertEqual(parser.value, 312)
+        parser.reset()
+        self.assertEqual(parser.value, 0)
+        self.assertTrue(parser.push("twelve"))
+        self.assertEqual(parser.value, 12)
+
+    def test_german_parser(self):
+        parser = WordStreamValueParserGerman(LANG["de"])
+        for text, value in (
+            ("null", 0),
+            ("hundert", 100),
+            ("einundzwanzig", 21),
+            ("hundert tausend", 100000),
+            ("zehn tausend", 10000),
+            ("dreihundertelf", 311),
+            ("zwei millionen dreitausendvierzig", 2003040),
+            ("eine milliarde zweihundertdreiundvierzig millionen neunzehn", 1243000019),
+        ):
+            parser.reset()
+            self.assertTrue(parser.parse(text))
+            self.assertEqual(parser.value, value, text)
+        for text in (
+            "null null",
+            "null drei",
+            "minus drei",
+            "drei zwanzig",
+            "zwanzig hundert",
+            "eins und zwanzig",
+            "tausend zwei tausend",
+            "drei hundert zwei hundert",
+        ):
+            parser.reset()
+            self.assertFalse(parser.parse(text))
+
+    def test_german_parser_push(self):
+        parser = WordStreamValueParserGerman(LANG["de"])
+        for word, valid, value in (
+            ("zwei", True, 2),
+            ("und", False, 2),
+            ("zwanzig", True, 22),
+            ("tausend", True, 22000),
+            ("dreihundert", True, 22300),
+            ("ste", True, 22300),
+            ("tausend", False, 22300),
+        ):
+            self.assertEqual(parser.push(word), valid, word)
+            self.assertEqual(parser.value, value, word)
+        parser.reset()
+        self.assertFalse(parser.push("ste"))
+
+    def test_german_digit_parser(self):
+        parser = WordToDigitParserGerman(LANG["de"])
+        self.assertFalse(hasattr(parser, "__dict__"))
+        for text, value in (
+            ("minus drei komma fünf", "-3,5"),
+            ("zwei und zwanzig tausend", "22000"),
+            ("zwei und", "2 und"),
+            ("einundzwanzigste", "21."),
+            ("Ein", "Ein"),
+        ):
+            words = text.split()
+            parser.reset()
+            for word, ahead in look_ahead(words + ["Grad"]):
+                self.assertEqual(parser.push(word, ahead), word != "Grad", word)
+            self.assertEqual(parser.value, value)
+        # held words are given back if no number follows
+        parser.reset()
+        self.assertTrue(parser.push("drei", "komma"))
+        self.assertTrue(parser.push("Komma", "Hund"))
+        self.assertFalse(parser.push("Hund", None))
+        self.assertEqual(parser.value, "3 Komma")
+        # a sign not followed by a number is dropped
+        parser.reset()
+        self.assertTrue(parser.push("plus", "Hund"))
+        self.assertTrue(parser.push("Hund", None))
+        parser.close()
+        self.assertEqual(parser.value, "Hund")
+        parser.reset()
+        self.assertFalse(parser.push("Hund", "zwei"))
+        self.assertTrue(parser.push("zwei", None))
+        parser.close()
+        self.assertEqual(parser.value, "2")
+
+    def test_digit_parser_reset(self):
+        parser = WordToDigitParser(LANG["en"])
+        for word, ahead in (("two", "point"), ("point", "five"), ("five", None)):
+            self.assertTrue(parser.push(word, ahead))
+        parser.close()
+        self.assertEqual(parser.value, "2.5")
+        parser.reset(preceding_word="the")
+        self.assertEqual(parser.value, "")
+        self.assertEqual(parser.last_word, "the")
+        self.assertFalse(parser.in_frac)
+        self.assertFalse(parser.push("one", "cat"))
+        self.assertTrue(parser.push("seven", None))
+        parser.close()
+        self.assertEqual(parser.value, "7")
+
+    def test_snapshot(self):
+        for parser, words in (
+            (WordStreamValueParser(LANG["fr"]), "deux cent mille"),
+            (WordStreamValueAutomaton(LANG["fr"]), "deux cent mille"),
+            (WordStreamValueParserGerman(LANG["de"]), "zwei hundert tausend"),
+            (WordToDigitParser(LANG["en"]), "two hundred point"),
+            (WordToDigitParserGerman(LANG["de"]), "zwei hundert komma"),
+        ):
+            first, *rest = words.split()
+            self.assertTrue(parser.push(first, rest[0]))
+            state = parser.snapshot()
+            # a continuation is rolled back, even after a reset
+            for word, ahead in look_ahead(rest + ["drei"]):
+                parser.push(word, ahead)
+            parser.reset()
+            parser.push("one")
+            parser.restore(state)
+            # and another one tried from the same state
+            for word, ahead in look_ahead(["trois", "vingt"]):
+                parser.push(word, ahead)
+            parser.restore(state)
+            if isinstance(parser, WordToDigitParser):
+                parser.close()
+                self.assertEqual(parser.value, "2")
+            else:
+                self.assertEqual(parser.value, 2)
+                self.assertTrue(parser.push(rest[0]))
+                self.assertEqual(parser.value, 200)
+
+    def test_snapshot_any_order(self):
+        for parser, first, second, other in (
+            (WordToDigitParser(LANG["en"]), "zero zero", "one two", "seven"),
+            (WordToDigitParserGerman(LANG["de"]), "zwei komma", "drei vier", "fünf"),
+            (WordStreamValueParserGerman(LANG["de"]), "zwei millionen drei", "tausend vier", "hundert"),
+        ):
+            for word in first.split():
+                parser.push(word)
+            state_a, value_a = parser.snapshot(), parser.value
+            for word in second.split():
+                parser.push(word)
+            state_b, value_b = parser.snapshot(), parser.value
+            # restore a snapshot taken before another one, and continue from it
+            parser.restore(state_a)
+            for word in other.split():
+                parser.push(word)
+            parser.restore(state_b)
+            self.assertEqual(parser.value, value_b, first)
+            self.assertEqual(parser.snapshot(), state_b, first)
+            parser.restore(state_a)
+            self.assertEqual(parser.value, value_a, first)
+            self.assertEqual(parser.snapshot(), state_a, first)
+        self.assertEqual(value_b, 2003004)
+
+    def test_lazy_frac_builder(self):
+        parser = WordToDigitParser(LANG["fr"])
+        self.assertTrue(parser.push("douze", None))
+        parser.close()
+        self.assertIsNone(parser._frac_builder)
+
+    def test_automaton_matches_reference(self):
+        rnd = Random(42)
+        for code, language in LANG.items():
+            if code == "de":
+                continue  # German has its own engine
+            words = sorted(language.NUMBERS) + [language.AND, "cat"]
+            words += sorted(getattr(language, "RELAXED", {}))
+            for _ in range(2000):
+                sequence = [rnd.choice(words) for _ in range(rnd.randint(1, 6))]
+                for relaxed in (False, True):
+                    reference = WordStreamValueParser(language, relaxed=relaxed)
+                    automaton = WordStreamValueAutomaton(language, relaxed=relaxed)
+                    for word, ahead in look_ahead(sequence):
+                        expected = reference.push(word, ahead)
+                        self.assertEqual(automaton.push(word, ahead), expected, (code, sequence))
+                        self.assertEqual(automaton.value, reference.value, (code, sequence))
+                        if not expected:
+                            break
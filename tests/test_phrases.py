@@ -0,0 +1,120 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test the phrase tables.
+"""
+from io import StringIO
+from unittest import TestCase
+
+from text_to_num import (
+    Converter,
+    alpha2digit,
+    alpha2digit_many,
+    alpha2digit_stream,
+    text2num,
+    text2num_many,
+    try_text2num,
+)
+from text_to_num.cache import LRUCache
+from text_to_num.lang import LANG
+from text_to_num.phrases import PhraseTable, PhraseTableInfo, build_phrase_table
+
+
+class TestPhraseTable(TestCase):
+    def test_lookup(self):
+        table = build_phrase_table("en", 2100)
+        self.assertIs(table.language, LANG["en"])
+        self.assertEqual(table.limit, 2100)
+        self.assertEqual(table.values["two thousand twenty-one"], 2021)
+        self.assertEqual(table.digits["two thousand twenty-one"], "2021")
+        self.assertEqual(table.values["zero"], 0)
+        self.assertNotIn("two thousand one hundred one", table.values)
+
+        self.assertEqual(text2num("nine hundred ninety-nine", "en", phrases=table), 999)
+        self.assertEqual(try_text2num("nine hundred ninety-nine", "en", cache=LRUCache(), phrases=table), 999)
+        self.assertEqual(text2num_many(["two", "cat"], "en", errors="none", phrases=table), [2, None])
+        self.assertEqual(alpha2digit("one, two thousand twenty-one.", "en", phrases=table), "1, 2021.")
+        self.assertEqual(alpha2digit_many(["twenty-one."], "en", phrases=table), ["21."])
+        self.assertEqual(
+            "".join(alpha2digit_stream(StringIO("twenty-one, two."), "en", phrases=table)), "21, 2."
+        )
+        converter = Converter("en", phrases=table, cache=LRUCache())
+        self.assertEqual(converter.text2num("two thousand twenty-one"), 2021)
+        self.assertEqual(converter.alpha2digit("two thousand twenty-one cats"), "2021 cats")
+
+        self.assertRaises(ValueError, build_phrase_table, "en", -1)
+        self.assertRaises(Exception, build_phrase_table, "xx", 10)
+
+    def test_other_language(self):
+        table = build_phrase_table("en", 10)
+        self.assertRaises(ValueError, text2num, "deux", "fr", phrases=table)
+        self.assertRaises(ValueError, text2num_many, ["deux"], "fr", phrases=table)
+        self.assertRaises(ValueError, alpha2digit, "deux", "fr", phrases=table)
+        self.assertRaises(ValueError, Converter, "fr", phrases=table)
+
+    def test_shared_language(self):
+        # a table does not change the conversions it is not given to
+        table = build_phrase_table("en", 100)
+        self.assertEqual(text2num("twenty-one", "en", phrases=table), 21)
+        self.assertFalse(any(isinstance(value, PhraseTable) for value in vars(LANG["en"]).values()))
+        self.assertFalse(any(isinstance(value, PhraseTable) for value in vars(type(LANG["en"])).values()))
+
+    def test_info(self):
+        info = build_phrase_table("en", 99).info()
+        self.assertIsInstance(info, PhraseTableInfo)
+        self.assertEqual(info.limit, 99)
+        self.assertGreaterEqual(info.phrases, 100)
+        self.assertGreater(info.size, 0)
+        self.assertGreater(build_phrase_table("en", 999).info().size, info.size)
+
+    def test_languages(self):
+        for code, phrase, value in (
+            ("fr", "deux mille vingt-et-un", 2021),
+            ("fr", "quatre-vingt-dix-neuf", 99),
+            ("es", "mil novecientos noventa y nueve", 1999),
+            ("pt", "mil e vinte e um", 1021),
+            ("de", "zweitausendeinundzwanzig", 2021),
+            ("ca", "dos mil vint-i-u", 2021),
+            ("ru", "две тысячи двадцать один", 2021),
+            ("it", "duemilaventuno", 2021),
+            ("nl", "twee duizend eenentwintig", 2021),
+            ("no", "to tusen tjueen", 2021),
+        ):
+            self.assertEqual(build_phrase_table(code, 2100).values.get(phrase), value, phrase)
+        # alpha2digit does not convert the Italian compounds
+        self.assertNotIn("duemilaventuno", build_phrase_table("it", 2100).digits)
+
+    def test_same_results(self):
+        for code in LANG:
+            table = build_phrase_table(code, 1100)
+            phrases = list(table.values)[::50]
+            texts = phrases + [f"{phrase}, {phrase} {phrase}" for phrase in phrases[:5]]
+            self.assertEqual(
+                [try_text2num(phrase, code, phrases=table) for phrase in phrases],
+                [try_text2num(phrase, code) for phrase in phrases],
+                code,
+            )
+            self.assertEqual(
+                [alpha2digit(text, code, relaxed=True, phrases=table) for text in texts],
+                [alpha2digit(text, code, relaxed=True) for text in texts],
+                code,
+            )
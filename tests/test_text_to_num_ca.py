@@ -156,6 +156,7 @@ class TestTextToNumCA(TestCase):
         )
         expected = "5è 1r 2n 3r 21è 100è 1230è."
         self.assertEqual(alpha2digit(source, "ca", ordinal_threshold=0), expected)
+        self.assertEqual(alpha2digit("la mil segona", "ca"), "la 2a")
 
     def test_alpha2digit_decimals(self):
         source = (
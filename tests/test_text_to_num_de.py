@@ -25,7 +25,7 @@
 Test the ``text_to_num`` library.
 """
 from unittest import TestCase
-from text_to_num import alpha2digit, text2num
+from text_to_num import alpha2digit, text2num, try_text2num
 
 # TODO: we need to improve tests to use 'relaxed=True' explicitly.
 # without 'relaxed' some things should fail, e.g.: text2num("ein und zwanzig", "de")
@@ -74,6 +74,13 @@ class TestTextToNumDE(TestCase):
         self.assertRaises(ValueError, text2num, "hundert und eins", "de")   # TODO: humans get this...
         self.assertRaises(ValueError, text2num, "eins und zwanzig", "de", relaxed=True)
         self.assertRaises(ValueError, text2num, "eine und zwanzig", "de", relaxed=True)
+        self.assertRaises(ValueError, text2num, "drei und und", "de")
+
+    def test_try_text2num(self):
+        self.assertEqual(try_text2num("zweiundzwanzig", "de"), 22)
+        self.assertIsNone(try_text2num("sechzighundert", "de"))
+        self.assertIsNone(try_text2num("drei und und", "de"))
+        self.assertIsNone(try_text2num("Hallo", "de"))
 
     def test_text2num_zeroes(self):
         self.assertEqual(text2num("null", "de"), 0)
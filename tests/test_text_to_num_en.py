@@ -24,8 +24,17 @@
 """
 Test the ``text_to_num`` library.
 """
+import io
 from unittest import TestCase
-from text_to_num import alpha2digit, text2num
+from text_to_num import (
+    alpha2digit,
+    alpha2digit_many,
+    alpha2digit_stream,
+    alpha2digit_tokens,
+    text2num,
+    text2num_many,
+    try_text2num,
+)
 
 
 class TestTextToNumEN(TestCase):
@@ -199,6 +208,58 @@ class TestTextToNumEN(TestCase):
         expected = "One second please! 22nd is parsed as 22nd and is different from 20 seconds."
         self.assertEqual(alpha2digit(source, "en"), expected)
 
+    def test_text2num_many(self):
+        self.assertEqual(text2num_many(["one hundred", "twenty-one", "zero"], "en"), [100, 21, 0])
+        texts = ["fifty", "fifty fifty", "one thousand"]
+        self.assertRaises(ValueError, text2num_many, texts, "en")
+        self.assertEqual(text2num_many(texts, "en", errors="none"), [50, None, 1000])
+        self.assertRaises(ValueError, text2num_many, texts, "en", errors="ignore")
+
+    def test_try_text2num(self):
+        self.assertEqual(try_text2num("one hundred twenty-one", "en"), 121)
+        self.assertEqual(try_text2num("zero", "en"), 0)
+        self.assertIsNone(try_text2num("fifty fifty", "en"))
+        self.assertIsNone(try_text2num("no number", "en"))
+
+    def test_alpha2digit_many(self):
+        texts = ["twenty-one cats", "no cat", "minus two degrees", "the first one"]
+        self.assertEqual(
+            alpha2digit_many(texts, "en"), [alpha2digit(text, "en") for text in texts]
+        )
+        self.assertEqual(
+            alpha2digit_many(texts, "en", signed=False, ordinal_threshold=0),
+            ["21 cats", "no cat", "minus 2 degrees", "the 1st one"],
+        )
+
+    def test_alpha2digit_stream(self):
+        source = "We have two thousand three hundred cats.\nAnd fifty-one dogs, or two."
+        expected = alpha2digit(source, "en")
+        chunks = ["We have two thou", "sand three", " hundred cats.", "\nAnd fifty", "-one dogs, or two."]
+        self.assertEqual("".join(alpha2digit_stream(chunks, "en")), expected)
+        pieces = list(alpha2digit_stream(io.StringIO(source), "en", chunk_size=5))
+        self.assertEqual("".join(pieces), expected)
+        self.assertEqual(pieces[0], "We have 2300 cats.\n")
+        self.assertEqual(list(alpha2digit_stream([], "en")), [])
+
+    def test_alpha2digit_tokens(self):
+        tokens = ["I", "want", "Twenty", "one", "cups", "one", "hundred", "two", "three"]
+        out_tokens, sources = alpha2digit_tokens(tokens, "en")
+        self.assertEqual(out_tokens, ["I", "want", "21", "cups", "102", "3"])
+        self.assertEqual(
+            sources,
+            [range(0, 1), range(1, 2), range(2, 4), range(4, 5), range(5, 8), range(8, 9)],
+        )
+        out_tokens, sources = alpha2digit_tokens(tokens[5:], "en", lowercased=True, breaks=[2])
+        self.assertEqual(out_tokens, ["100", "2", "3"])
+        self.assertEqual(sources, [range(0, 2), range(2, 3), range(3, 4)])
+        self.assertEqual(alpha2digit_tokens([], "en"), ([], []))
+        self.assertRaises(Exception, alpha2digit_tokens, ["zwei"], "de")
+
+    def test_alpha2digit_no_number(self):
+        source = "Is it the right time to call? Yes, go ahead."
+        self.assertIs(alpha2digit(source, "en"), source)
+        self.assertEqual(alpha2digit("Is it  the time ", "en"), "Is it the time")
+
     def test_uppercase(self):
         source = "FIFTEEN ONE TEN ONE"
         expected = "15 1 10 1"
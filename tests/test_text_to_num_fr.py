@@ -161,6 +161,8 @@ class TestTextToNumFR(TestCase):
         )
         expected = "5ème 1er 2nd 3ème 21ème 100ème 1230ème."
         self.assertEqual(alpha2digit(source, "fr", ordinal_threshold=0), expected)
+        self.assertEqual(alpha2digit("le cent premier", "fr"), "le 1er")
+        self.assertEqual(alpha2digit("la quatre-vingt-deuxième", "fr"), "la 82ème")
 
     def test_alpha2digit_decimals(self):
         source = (
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from text_to_num import text2num
+from text_to_num import text2num, text2num_many, try_text2num
 
 
 class TestTextToNumIT(TestCase):
@@ -89,6 +89,12 @@ class TestTextToNumIT(TestCase):
         self.assertEqual(text2num("novemilanovecentodieci", "it"), 9910)
         self.assertEqual(text2num("diecimila", "it"), 10000)
         self.assertEqual(text2num("centomila", "it"), 100000)
+        self.assertEqual(text2num("centottanta", "it"), 180)
+        self.assertEqual(text2num("trecentotto", "it"), 308)
+        self.assertEqual(text2num("duemilioni", "it"), 2000000)
+        self.assertEqual(text2num("due milioni trecentomila", "it"), 2300000)
+        self.assertEqual(text2num("milleduecentomilioni", "it"), 1200000000)
+        self.assertEqual(text2num("duecento mila", "it"), 200000)
         # self.assertEqual(alpha2digit("uno virgola uno", "it"), '1.1')
         # self.assertEqual(alpha2digit("uno virgola quattrocentouno", "it"), '1.401')
 
@@ -109,6 +115,36 @@ class TestTextToNumIT(TestCase):
         # self.assertEqual(text2num("settantacinquemila", "it"), 75000)
         # self.assertEqual(text2num("millenovecentoventi", "it"), 1920)
 
+    def test_try_text2num(self):
+        self.assertEqual(try_text2num("cinquantuno", "it"), 51)
+        self.assertEqual(try_text2num("duemilacinquantotto", "it"), 2058)
+        self.assertIsNone(try_text2num("cinquantx", "it"))
+        self.assertIsNone(try_text2num("ciao", "it"))
+        self.assertEqual(
+            text2num_many(["cinquantuno", "cinquant", "ciao", "cinquantx"], "it", errors="none"),
+            [51, None, None, None],
+        )
+        # the elided tens are only read before "uno" and "otto"
+        self.assertIsNone(try_text2num("cinquant", "it"))
+        self.assertIsNone(try_text2num("vent", "it"))
+        self.assertIsNone(try_text2num("ventdue", "it"))
+
+    def test_text2num_order(self):
+        for text in (
+            "ottocentosettecento",
+            "centocento",
+            "trediciotto",
+            "novecentoseicentocinquanta",
+            "millecentoquarantaduecento",
+            "duecentoottantamilionemilioni",
+            "millemila",
+            "duemille",
+            "unomila",
+            "centuno",
+            "dueuno",
+        ):
+            self.assertRaises(ValueError, text2num, text, "it")
+
     # def test_text2num_exc(self):
     #     self.assertRaises(ValueError, text2num, "mille mille duecento", "it")
     #     self.assertRaises(ValueError, text2num, "sessanta quindici", "it")
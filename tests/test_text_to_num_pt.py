@@ -218,6 +218,15 @@ class TestTextToNumPT(TestCase):
         expected = "A 14ª brigada do exército português, juntamento com o 96º regimento britânico, bateu o 127º regimento de infantaria de Napoleão"
         self.assertEqual(alpha2digit(source, "pt"), expected)
 
+    def test_alpha2digit_ordinals_lines(self):
+        # the compound ordinals are joined within a line only
+        source = "o vigésimo\nandar, vinte\nsétimo ou um\ndois"
+        expected = "o 20º\nandar, 20\n7º ou um\n2"
+        self.assertEqual(alpha2digit(source, "pt"), expected)
+        source = "vigésimo sétimo\nsegundo"
+        expected = "27º\nsegundo"
+        self.assertEqual(alpha2digit(source, "pt"), expected)
+
     def test_brazilian_tenths(self):
         self.assertEqual(text2num("catorze", "pt"), 14)
         self.assertEqual(text2num("mil quatrocentos e catorze", "pt"), 1414)
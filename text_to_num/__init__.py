@@ -20,4 +20,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .transforms import text2num, alpha2digit  # noqa: F401
+from importlib import import_module
+from typing import Any, Dict
+
+from .transforms import (  # noqa: F401
+    text2num,
+    try_text2num,
+    alpha2digit,
+    text2num_many,
+    alpha2digit_many,
+    alpha2digit_stream,
+    alpha2digit_tokens,
+)
+
+# name => module, imported on first access to keep the package import fast
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    "extract_numbers": "extract",
+    "IncrementalConverter": "incremental",
+    "Converter": "converter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``extract_numbers``, ``IncrementalConverter`` and ``Converter`` on demand."""
+    module = LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return getattr(import_module("." + module, __name__), name)
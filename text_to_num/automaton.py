@@ -0,0 +1,125 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compile languages into finite-state automata over token classes.
+
+The automaton recognizes the words of a group of three digits. Its state is
+the role of the last word of the group and each transition carries the action
+that updates the group value. Multipliers are not part of the transition table:
+they apply from any state, as long as their coefficient can be applied to the
+current value, and bring the automaton back to ``START``.
+"""
+
+from typing import List, Optional, Tuple
+
+from .lang import Language
+from .lang.base import (
+    UNIT,
+    STEN,
+    MTEN,
+    MTEN_WSTEN,
+    HUNDRED,
+    MHUNDRED,
+    TERMINAL,
+)
+
+# States
+START = 0  # nothing yet in the group
+UNIT_LEAD = 1  # a unit that can still be multiplied by a hundred
+STEN_LEAD = 2  # a single ten that can still be multiplied by a hundred
+AFTER_MHUNDRED = 3
+AFTER_MTEN = 4
+AFTER_MTEN_WSTEN = 5
+AFTER_HUNDRED = 6
+END = 7  # the group is complete
+STATES = 8
+
+# Actions on the group value
+ADD = 0  # add the word value
+TIMES_HUNDRED = 1  # multiply by a hundred or start with the word value
+SET = 2  # replace by the word value
+
+# A lead state is kept only while the group value stays below its limit,
+# otherwise the group is complete.
+LEAD_LIMITS: Tuple[int, ...] = (0, 10, 20, 0, 0, 0, 0, 0)
+
+Transition = Tuple[int, int]  # (next state, action)
+
+
+class Automaton:
+    """Deterministic automaton for the groups of three digits of a language.
+
+    ``delta[state][kind]`` is the transition taken on a word of class ``kind``,
+    or None if such a word is not expected.
+    """
+
+    __slots__ = ("delta",)
+
+    def __init__(self, delta: Tuple[Tuple[Optional[Transition], ...], ...]) -> None:
+        self.delta = delta
+
+    def expects(self, state: int, kind: int) -> bool:
+        """Is a word of class ``kind`` expected in ``state``?"""
+        return self.delta[state][kind] is not None
+
+
+def _any_word(row: List[Optional[Transition]]) -> None:
+    row[UNIT] = (UNIT_LEAD, ADD)
+    row[STEN] = (STEN_LEAD, ADD)
+    row[MTEN] = (AFTER_MTEN, ADD)
+    row[MTEN_WSTEN] = (AFTER_MTEN_WSTEN, ADD)
+    row[HUNDRED] = (AFTER_HUNDRED, TIMES_HUNDRED)
+    row[MHUNDRED] = (AFTER_MHUNDRED, SET)
+    row[TERMINAL] = (END, ADD)
+
+
+def compile_automaton(lang: Language) -> Automaton:
+    """Build the automaton of ``lang``.
+
+    The result is cached on the language class.
+    """
+    automaton: Optional[Automaton] = type(lang).__dict__.get("_automaton")
+    if automaton is not None:
+        return automaton
+
+    delta: List[List[Optional[Transition]]] = [[None] * (TERMINAL + 1) for _ in range(STATES)]
+    _any_word(delta[START])
+    _any_word(delta[AFTER_MHUNDRED])
+    _any_word(delta[AFTER_HUNDRED])
+    delta[AFTER_HUNDRED][HUNDRED] = None
+    for lead in (UNIT_LEAD, STEN_LEAD):
+        delta[lead][HUNDRED] = (AFTER_HUNDRED, TIMES_HUNDRED)
+    delta[AFTER_MTEN][UNIT] = (UNIT_LEAD, ADD)
+    delta[AFTER_MTEN_WSTEN][UNIT] = (UNIT_LEAD, ADD)
+    delta[AFTER_MTEN_WSTEN][STEN] = (STEN_LEAD, ADD)
+
+    # drop the transitions on the classes the language does not use
+    kinds = {token.kind for token in lang.token_table().values()}
+    automaton = Automaton(
+        tuple(
+            tuple(transition if kind in kinds else None for kind, transition in enumerate(row))
+            for row in delta
+        )
+    )
+    setattr(type(lang), "_automaton", automaton)
+    return automaton
@@ -0,0 +1,120 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Bounded caches for the conversion results.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, like ``functools.lru_cache`` ones."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CallStats:
+    """Hits and misses of the cache lookups of one or several calls, to pass to the
+    functions taking a ``cache`` and ``stats`` argument.
+
+    It can be shared between threads, like the ``Converter`` it is given to.
+    """
+
+    __slots__ = ("hits", "misses", "_lock")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def count(self, hit: bool) -> None:
+        """Count a lookup: a hit if ``hit`` is True, else a miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __repr__(self) -> str:
+        return f"CallStats(hits={self.hits}, misses={self.misses})"
+
+
+class LRUCache:
+    """Thread-safe mapping that holds at most ``maxsize`` items, evicting the least
+    recently used ones first.
+
+    It counts its hits, misses and evictions (see ``info``).
+    """
+
+    __slots__ = ("maxsize", "_items", "_lock", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value cached for ``key`` or ``default``."""
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` for ``key``."""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._items))
+
+    def clear(self) -> None:
+        """Empty the cache and reset its statistics."""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
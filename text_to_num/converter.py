@@ -0,0 +1,157 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Convert many texts in one language with the same options.
+"""
+
+from threading import local
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, TextIO, Union
+
+from .cache import CallStats, LRUCache
+from .extract import NumberMatch, _extract_numbers
+from .lang import LANG, Language
+from .parsers import WordToDigitParser
+from .transforms import (
+    _alpha2digit,
+    _alpha2digit_stream,
+    _cached_text2num,
+    _check_phrases,
+    _digit_parser,
+    _post_processor,
+    _text2num,
+    _value_parser,
+)
+
+if TYPE_CHECKING:
+    from .lang.portuguese import OrdinalsMerger
+    from .phrases import PhraseTable
+
+
+class _Parsers(local):
+    """The parsers of a converter, one set per thread."""
+
+    def __init__(self, converter: "Converter") -> None:
+        self.value_parser = _value_parser(converter.language, converter.relaxed)
+        self.digit_parser = converter._digit_parser()
+
+
+class Converter:
+    """Convert texts in the language ``lang`` like ``text2num``, ``alpha2digit`` and
+    ``extract_numbers``, with the options given once.
+
+    The language, its post-processing and the options are resolved when the converter
+    is created, and each thread gets its own parsers on its first call, so a converter
+    can be shared between threads.
+
+    Set ``pt_ordinal_merge`` to False to leave the Portuguese compound ordinals apart
+    (« 20º 7º » instead of « 27º »). ``cache``, an ``LRUCache``, ``stats``, a
+    ``CallStats``, and ``phrases``, a ``PhraseTable`` of the language, are used by all
+    the conversions but ``extract_numbers`` (see ``alpha2digit``).
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        relaxed: bool = False,
+        signed: bool = True,
+        ordinal_threshold: int = 3,
+        pt_ordinal_merge: bool = True,
+        cache: Optional[LRUCache] = None,
+        stats: Optional[CallStats] = None,
+        phrases: Optional["PhraseTable"] = None,
+    ) -> None:
+        if lang not in LANG:
+            raise Exception("Language not supported")
+
+        self.language: Language = LANG[lang]
+        _check_phrases(phrases, self.language)
+        self.relaxed = relaxed
+        self.signed = signed
+        self.ordinal_threshold = ordinal_threshold
+        self.cache = cache
+        self.stats = stats
+        self.phrases = phrases
+        self.merger: Optional["OrdinalsMerger"] = _post_processor(self.language, pt_ordinal_merge)
+        self._parsers = _Parsers(self)
+
+    def text2num(self, text: str) -> int:
+        """Return the value of ``text`` like ``text2num``.
+
+        Raises a ValueError if ``text`` does not describe a valid number.
+        """
+        value = self.try_text2num(text)
+        if value is None:
+            raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+        return value
+
+    def try_text2num(self, text: str) -> Optional[int]:
+        """Return the value of ``text`` like ``try_text2num``, or None."""
+        num_parser = self._parsers.value_parser
+        if self.cache is not None:
+            return _cached_text2num(
+                text, self.language, self.relaxed, self.cache, num_parser, self.phrases
+            )
+        if num_parser is not None:
+            num_parser.reset()
+        return _text2num(text, self.language, num_parser, self.phrases)
+
+    def alpha2digit(self, text: str) -> str:
+        """Return ``text`` with its spelled numbers converted to digits like ``alpha2digit``."""
+        return _alpha2digit(
+            text,
+            self.language,
+            self._parsers.digit_parser,
+            self.cache,
+            self.stats,
+            self.merger,
+            self.phrases,
+        )
+
+    def alpha2digit_stream(
+        self, source: Union[TextIO, Iterable[str]], chunk_size: int = 65536
+    ) -> Iterator[str]:
+        """Convert the text read from ``source`` piece by piece like ``alpha2digit_stream``."""
+        # The generators get their own parser: they may be consumed in another
+        # thread, or interleaved with other calls
+        return _alpha2digit_stream(
+            source,
+            self.language,
+            self._digit_parser(),
+            chunk_size,
+            self.cache,
+            self.stats,
+            self.merger,
+            self.phrases,
+        )
+
+    def extract_numbers(self, text: str) -> Iterator[NumberMatch]:
+        """Yield the numbers of ``text`` like ``extract_numbers``.
+
+        German is not supported and the Portuguese compound ordinals are not merged.
+        """
+        if self.language.ISO_CODE == "de":
+            raise Exception("Language not supported")
+        return _extract_numbers(text, self._digit_parser())
+
+    def _digit_parser(self) -> WordToDigitParser:
+        return _digit_parser(self.language, self.relaxed, self.signed, self.ordinal_threshold)
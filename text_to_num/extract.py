@@ -0,0 +1,154 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Find the numbers of a text, without rewriting it.
+"""
+
+import re
+from itertools import filterfalse
+from typing import FrozenSet, Iterator, List, Optional, Union
+
+from .lang import LANG
+from .lang.base import split_words
+from .parsers import WordToDigitParser
+from .transforms import WORD_SEP, _number_spans
+
+TOKEN = re.compile(r"\S+")
+
+# Number kinds
+CARDINAL = "cardinal"
+ORDINAL = "ordinal"
+DECIMAL = "decimal"
+SIGNED = "signed"
+ZERO_LED = "zero-led"  # formal number with leading zeros, like a code
+
+
+class NumberMatch:
+    """A number found by ``extract_numbers``.
+
+    ``text[start:end]`` is the number in letters, ``digits`` the digit string
+    ``alpha2digit`` would write for it and ``value`` its numeric value.
+    ``kind`` is one of ``CARDINAL``, ``ORDINAL``, ``DECIMAL``, ``SIGNED`` or ``ZERO_LED``.
+    """
+
+    __slots__ = ("start", "end", "digits", "value", "kind")
+
+    def __init__(self, start: int, end: int, digits: str, value: Union[int, float], kind: str) -> None:
+        self.start = start
+        self.end = end
+        self.digits = digits
+        self.value = value
+        self.kind = kind
+
+    def __repr__(self) -> str:
+        return "NumberMatch({}, {}, {!r}, {!r}, {})".format(
+            self.start, self.end, self.digits, self.value, self.kind
+        )
+
+
+def extract_numbers(
+    text: str,
+    lang: str,
+    relaxed: bool = False,
+    signed: bool = True,
+    ordinal_threshold: int = 3,
+) -> Iterator[NumberMatch]:
+    """Yield the numbers of ``text`` that ``alpha2digit`` converts, with the same options,
+    in order.
+
+    The German parser does not report where its numbers are, so German is not supported.
+    The Portuguese compound ordinals are not merged.
+    """
+    if lang not in LANG:
+        raise Exception("Language not supported")
+
+    language = LANG[lang]
+    if language.ISO_CODE == "de":
+        raise Exception("Language not supported")
+    num_builder = WordToDigitParser(
+        language,
+        relaxed=relaxed,
+        signed=signed,
+        ordinal_threshold=ordinal_threshold,
+    )
+    return _extract_numbers(text, num_builder)
+
+
+def _extract_numbers(text: str, num_builder: WordToDigitParser) -> Iterator[NumberMatch]:
+    """Yield the numbers of ``text`` found by ``num_builder``, which also holds the
+    language and the options.
+    """
+    start = 0
+    for sep in WORD_SEP.finditer(text):
+        yield from _segment_numbers(text, start, sep.start(), num_builder)
+        start = sep.end()
+    yield from _segment_numbers(text, start, len(text), num_builder)
+
+
+def _segment_numbers(
+    text: str, start: int, end: int, num_builder: WordToDigitParser
+) -> Iterator[NumberMatch]:
+    """Yield the numbers of the segment ``text[start:end]``."""
+    tokens = list(TOKEN.finditer(text, start, end))
+    words = [token.group().lower() for token in tokens]
+    if not _has_number_word(words, num_builder.lang.vocabulary()):
+        return
+    for first, last, ordinal in _number_spans(words, num_builder):
+        match = _match(num_builder, tokens[first].start(), tokens[last - 1].end(), ordinal)
+        if match is not None:
+            yield match
+
+
+def _has_number_word(words: List[str], vocabulary: FrozenSet[str]) -> bool:
+    """Return False if none of ``words`` (in lower case) has a part, once split by
+    ``split_words``, in ``vocabulary``, like ``Language.may_contain_number`` for a text.
+    """
+    if not vocabulary.isdisjoint(words):
+        return True
+    # only the words with a break can have other parts
+    return any(not vocabulary.isdisjoint(split_words(word)) for word in filterfalse(str.isalnum, words))
+
+
+def _match(num_builder: WordToDigitParser, start: int, end: int, ordinal: bool) -> Optional[NumberMatch]:
+    """Return the match of the number ``num_builder`` has just parsed, if it was converted."""
+    digits = num_builder.value
+    if not digits:
+        return None
+    value: Union[int, float]
+    if ordinal:
+        value = num_builder.int_builder.value
+        if value <= num_builder.ordinal_threshold:
+            return None  # left in letters
+        kind = ORDINAL
+    elif num_builder.in_frac:
+        value = float(digits.replace(num_builder.lang.DECIMAL_SYM, "."))
+        kind = DECIMAL
+    else:
+        value = int(digits)
+        if digits[0] in "+-":
+            kind = SIGNED
+        elif digits[0] == "0" and len(digits) > 1:
+            kind = ZERO_LED
+        else:
+            kind = CARDINAL
+    return NumberMatch(start, end, digits, value, kind)
@@ -0,0 +1,184 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Convert a growing text, like the successive partial transcripts of a speech
+recognizer, without converting its stable beginning again.
+"""
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .cache import LRUCache
+from .lang import LANG
+from .parsers import ParserState, WordToDigitParser, WordToDigitParserGerman
+from .transforms import (
+    NON_SPACE,
+    WORD_SEP,
+    _alpha2digit,
+    _digit_parser,
+    _last_cut,
+    _post_processor,
+    look_ahead,
+)
+from . import transforms
+
+if TYPE_CHECKING:
+    from .lang.portuguese import OrdinalsMerger
+
+
+class IncrementalConverter:
+    """Convert the successive versions of a text like ``alpha2digit``.
+
+    Each call to ``update`` gives the full current text and returns its full conversion.
+    The text is cut after the separators (see ``WORD_SEP``) that more text cannot
+    extend, as in ``alpha2digit_stream``: the pieces before the last cut are closed,
+    and their conversions are kept as long as the next versions start with them.
+    So only the open end of the text, from the last closed segment, is converted again
+    when words are added or revised; and when it is a single segment, only from its
+    first word that changed.
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        relaxed: bool = False,
+        signed: bool = True,
+        ordinal_threshold: int = 3,
+        cache: Optional[LRUCache] = None,
+    ) -> None:
+        if lang not in LANG:
+            raise Exception("Language not supported")
+
+        self.language = LANG[lang]
+        self.cache = cache
+        self.num_builder = _digit_parser(self.language, relaxed, signed, ordinal_threshold)
+        self.merger = _post_processor(self.language, transforms.USE_PT_ORDINALS_MERGER)
+        self._open = _OpenSegment(self.num_builder, self.merger)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the closed pieces of the previous texts."""
+        self.closed = ""  # text of the closed pieces
+        self.converted = ""  # and its conversion
+        self._ends: List[Tuple[int, int]] = []  # end of each closed piece, in both
+
+    def update(self, text: str) -> str:
+        """Return ``text`` converted like ``alpha2digit`` would."""
+        # Drop the closed pieces that changed, or whose last separator may have grown.
+        while self._ends and not self._closes(text):
+            self._ends.pop()
+            end, converted_end = self._ends[-1] if self._ends else (0, 0)
+            self.closed = self.closed[:end]
+            self.converted = self.converted[:converted_end]
+        tail = text[len(self.closed):]
+        cut, _ = _last_cut(WORD_SEP, tail, 0)
+        if cut:
+            self.closed += tail[:cut]
+            self.converted += self._convert(tail[:cut])
+            self._ends.append((len(self.closed), len(self.converted)))
+            tail = tail[cut:]
+        if not tail:
+            return self.converted
+        if WORD_SEP.search(tail) is None:
+            return self.converted + self._open.convert(tail)
+        return self.converted + self._convert(tail)
+
+    def _closes(self, text: str) -> bool:
+        """Return True if the closed pieces are still the beginning of ``text``."""
+        if not text.startswith(self.closed):
+            return False
+        # What follows must still stop the last separator (see ``_last_cut``).
+        end = len(self.closed)
+        return end == len(text) or (
+            NON_SPACE.match(text, end) is not None and WORD_SEP.match(text, end) is None
+        )
+
+    def _convert(self, text: str) -> str:
+        return _alpha2digit(text, self.language, self.num_builder, self.cache, merger=self.merger)
+
+
+class _OpenSegment:
+    """Convert the successive versions of a segment (a text without separators, see
+    ``WORD_SEP``) like ``_alpha2digit_segment``, word by word.
+
+    The state of ``num_builder`` is kept before each word: when a version only differs
+    from the previous one by its last words, its conversion is taken up from the word
+    before the first one that changed (its push depends on the next word) instead of
+    pushing all the words again.
+    """
+
+    __slots__ = ("num_builder", "merger", "lowercase", "tokens", "states", "out_tokens")
+
+    def __init__(self, num_builder: WordToDigitParser, merger: Optional["OrdinalsMerger"]) -> None:
+        self.num_builder = num_builder
+        self.merger = merger
+        # The German parser gives back the words it holds as they were pushed
+        self.lowercase = not isinstance(num_builder, WordToDigitParserGerman)
+        self.tokens: List[str] = []
+        # Before each token: the parser state, the count of output tokens, whether in a
+        # number and the previous word
+        self.states: List[Tuple[ParserState, int, bool, Optional[str]]] = []
+        self.out_tokens: List[str] = []
+
+    def convert(self, segment: str) -> str:
+        """Return ``segment`` converted like ``_alpha2digit_segment`` would."""
+        num_builder = self.num_builder
+        tokens = segment.split()
+        same = 0
+        for old, new in zip(self.tokens, tokens):
+            if old != new:
+                break
+            same += 1
+        start = same - 1 if same else 0
+        if start:
+            state, length, in_number, last_word = self.states[start]
+            num_builder.restore(state)
+            del self.out_tokens[length:]
+            del self.states[start:]
+        else:
+            num_builder.reset()
+            self.out_tokens.clear()
+            self.states.clear()
+            in_number = False
+            last_word = None
+        self.tokens = tokens
+        out_tokens = self.out_tokens
+        states = self.states
+        new_tokens = tokens[start:]
+        words = [token.lower() for token in new_tokens] if self.lowercase else new_tokens
+        for token, (word, ahead) in zip(new_tokens, look_ahead(words)):
+            states.append((num_builder.snapshot(), len(out_tokens), in_number, last_word))
+            if num_builder.push(word, ahead):
+                in_number = True
+            elif in_number:
+                out_tokens.append(num_builder.value)
+                num_builder.reset(preceding_word=last_word)
+                in_number = num_builder.push(word, ahead)
+            if not in_number:
+                out_tokens.append(token)
+            last_word = word
+        # End of segment: the number, if any, is not kept in ``self.out_tokens``
+        num_builder.close()
+        converted = out_tokens + [num_builder.value] if num_builder.value else out_tokens
+        if self.merger is not None:
+            converted = self.merger.merge_tokens(converted)
+        return " ".join(converted)
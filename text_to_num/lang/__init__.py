@@ -22,29 +22,72 @@
 
 """
 Language support.
+
+The languages are only imported and instantiated on first access to ``LANG``.
 """
 
+from importlib import import_module
+from threading import Lock
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
 from .base import Language  # noqa: F401
-from .dutch import Dutch
-from .french import French
-from .english import English
-from .spanish import Spanish
-from .portuguese import Portuguese
-from .german import German
-from .catalan import Catalan
-from .russian import Russian
-from .italian import Italian
-from .norwegian import Norwegian
-
-LANG = {
-    "fr": French(),
-    "en": English(),
-    "es": Spanish(),
-    "pt": Portuguese(),
-    "de": German(),
-    "ca": Catalan(),
-    "ru": Russian(),
-    "it": Italian(),
-    "nl": Dutch(),
-    "no": Norwegian(),
+
+# code => (module, class)
+LANGUAGE_CLASSES: Dict[str, Tuple[str, str]] = {
+    "fr": ("french", "French"),
+    "en": ("english", "English"),
+    "es": ("spanish", "Spanish"),
+    "pt": ("portuguese", "Portuguese"),
+    "de": ("german", "German"),
+    "ca": ("catalan", "Catalan"),
+    "ru": ("russian", "Russian"),
+    "it": ("italian", "Italian"),
+    "nl": ("dutch", "Dutch"),
+    "no": ("norwegian", "Norwegian"),
 }
+
+
+class LanguageRegistry(Mapping[str, Language]):
+    """Read-only mapping of the language codes to their ``Language`` objects,
+    that imports and instantiates each language on first access.
+    """
+
+    def __init__(self, classes: Dict[str, Tuple[str, str]]) -> None:
+        self._classes = classes
+        self._languages: Dict[str, Language] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, code: str) -> Language:
+        try:
+            return self._languages[code]
+        except KeyError:
+            module, name = self._classes[code]
+        with self._lock:
+            if code not in self._languages:
+                language_class = getattr(import_module("." + module, __name__), name)
+                self._languages[code] = language_class()
+            return self._languages[code]
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def loaded(self) -> Tuple[str, ...]:
+        """Return the codes of the languages already instantiated."""
+        return tuple(self._languages)
+
+
+LANG = LanguageRegistry(LANGUAGE_CLASSES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the language classes (``French``, ``English``...) on demand."""
+    for module, class_name in LANGUAGE_CLASSES.values():
+        if class_name == name:
+            return getattr(import_module("." + module, __name__), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -24,12 +24,167 @@
 Base type for language objects.
 """
 
-from typing import Dict, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+# Token classes
+# A number word belongs to exactly one of them; words that are not numbers
+# (zero, signs, decimal separators) have class NOT_NUMBER.
+NOT_NUMBER = 0
+UNIT = 1
+STEN = 2
+MTEN = 3
+MTEN_WSTEN = 4  # a MTEN that can be followed by a STEN
+HUNDRED = 5
+MHUNDRED = 6
+MULTIPLIER = 7
+TERMINAL = 8  # composites and other number words that end a group
+
+# Characters that separate words besides spaces (see ``transforms.WORD_SEP``);
+# hyphens too, as the first part of a hyphenated number is a number word.
+WORD_BREAKS = ".,;()…[]:!?\n-"
+
+
+class Token:
+    """Compiled description of a surface word, as found in ``Language.lookup``.
+
+    ``word`` is the normalized form of the surface word, ``kind`` its token class
+    and ``value`` its numeric value (0 if not a number).
+    ``relaxed`` is the (next word prefix, target token) couple if the word can start
+    a relaxed composed number.
+    The other attributes describe the surface word itself.
+    """
+
+    __slots__ = ("word", "kind", "value", "relaxed", "is_zero", "sign", "is_decimal_sep")
+
+    def __init__(
+        self,
+        word: str,
+        kind: int,
+        value: int,
+        is_zero: bool = False,
+        sign: Optional[str] = None,
+        is_decimal_sep: bool = False,
+    ) -> None:
+        self.word = word
+        self.kind = kind
+        self.value = value
+        self.relaxed: Optional[Tuple[str, "Token"]] = None
+        self.is_zero = is_zero
+        self.sign = sign
+        self.is_decimal_sep = is_decimal_sep
+
+    def __repr__(self) -> str:
+        return "Token({!r}, kind={}, value={!r})".format(self.word, self.kind, self.value)
+
+
+class CompoundSplitter:
+    """Split the compound number words of a text into the words of ``vocabulary``.
+
+    The words are looked up in a trie, so that the longest word at each position is
+    found in one pass, and a text is split in a time linear in its length.
+    The characters that start no word are kept together as unknown pieces.
+    One of ``suffixes`` (ordinal endings) ending a word after a number word is dropped.
+
+    If ``backtrack`` is True, a shorter word is taken when the longest one leaves a
+    remainder of the word that cannot be split, as elisions require: the Italian
+    "centotto" is "cent" "otto", not "cento" "tto".
+
+    The splits of the last ``maxsize`` texts are memoized.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Iterable[str],
+        suffixes: Iterable[str] = (),
+        backtrack: bool = False,
+        maxsize: int = 4096,
+    ) -> None:
+        self.trie: Dict[str, Any] = {}
+        for word in vocabulary:
+            node = self.trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = True  # a word ends here
+        self.suffixes = tuple(sorted(suffixes, key=len, reverse=True))
+        self.backtrack = backtrack
+        self.split = lru_cache(maxsize=maxsize)(self._split)
+
+    def ends(self, text: str, start: int) -> List[int]:
+        """Return the end indices of the words of the vocabulary found at ``start``
+        in ``text``, shortest first.
+        """
+        ends = []
+        node = self.trie
+        for index in range(start, len(text)):
+            child = node.get(text[index])
+            if child is None:
+                break
+            node = child
+            if "" in node:
+                ends.append(index + 1)
+        return ends
+
+    def _split(self, text: str) -> Tuple[str, ...]:
+        """Return the pieces of ``text``: words of the vocabulary and unknown pieces."""
+        splittable = self._splittable(text) if self.backtrack else None
+        pieces: List[str] = []
+        unknown = ""
+        after_number = False
+        index = 0
+        while index < len(text):
+            ends = self.ends(text, index)
+            if ends:
+                end = ends[-1]
+                if splittable is not None:
+                    end = next((end for end in reversed(ends) if splittable[end]), end)
+                if unknown:
+                    pieces.append(unknown)
+                    unknown = ""
+                pieces.append(text[index:end])
+                after_number = True
+                index = end
+                continue
+            suffix = self._suffix(text, index) if after_number and not unknown else ""
+            if suffix:
+                # drop the suffix and the space after it
+                index += len(suffix) + 1
+            elif text[index] == " ":
+                if unknown:
+                    pieces.append(unknown)
+                    unknown = ""
+                index += 1
+            else:
+                unknown += text[index]
+                index += 1
+        if unknown:
+            pieces.append(unknown)
+        return tuple(pieces)
+
+    def _suffix(self, text: str, index: int) -> str:
+        """Return the suffix that ends a word at ``index`` in ``text``, if any."""
+        for suffix in self.suffixes:
+            end = index + len(suffix)
+            if text.startswith(suffix, index) and (end == len(text) or text[end].isspace()):
+                return suffix
+        return ""
+
+    def _splittable(self, text: str) -> List[bool]:
+        """Tell, for each index of ``text``, if the rest of the word from there can be
+        split into words of the vocabulary.
+        """
+        splittable = [True] * (len(text) + 1)
+        for index in range(len(text) - 1, -1, -1):
+            if not text[index].isspace():
+                splittable[index] = any(splittable[end] for end in self.ends(text, index))
+        return splittable
 
 
 class Language:
     """Base class for language object."""
 
+    ISO_CODE: str  # its key in ``LANG``
+
     MULTIPLIERS: Dict[str, int]
     UNITS: Dict[str, int]
     STENS: Dict[str, int]
@@ -54,17 +209,56 @@ class Language:
 
     simplify_check_coef_appliable: bool = False
 
+    # Extra surface forms that ``normalize`` maps to number words.
+    # If ``normalize`` is not a finite mapping, set ``normalize_on_miss`` instead.
+    NORMALIZED_VARIANTS: Set[str] = set()
+    normalize_on_miss: bool = False
+
+    # What ``ord2card`` recognizes: the suffixes that turn number words or ordinal stems
+    # into ordinals, and the ordinal stems or words that are not number words.
+    ORDINAL_SUFFIXES: Tuple[str, ...] = ()
+    ORDINAL_STEMS: Set[str] = set()
+
+    # How the phrase table spells the numbers (see ``text_to_num.phrases``): the tens
+    # followed by units, what follows the hundreds and the greater multipliers, what
+    # joins a multiplier to its coefficient, and the preferred spelling of some numbers
+    # (the first number word of their value otherwise).
+    PHRASE_TENS = "{tens}-{units}"
+    PHRASE_AFTER_HUNDREDS: Tuple[str, ...] = (" ",)
+    PHRASE_AFTER_THOUSANDS: Tuple[str, ...] = (" ",)
+    PHRASE_COEF = " "
+    PHRASE_WORDS: Dict[int, str] = {}
+
     def ord2card(self, word: str) -> Optional[str]:
         """Convert ordinal number to cardinal.
 
         Return None if word is not an ordinal or is better left in letters
         as is the case for fist and second.
         """
-        return NotImplemented
+        entry = self.ordinal_table().get(word)
+        return None if entry is None else entry[0]
 
     def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal"""
-        return NotImplemented
+        """Add suffix to number in digits to make an ordinal.
+
+        ``original_word`` is an ordinal, as recognized by ``ord2card``.
+        """
+        return digits + self.ordinal_table()[original_word][1]
+
+    def ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Return the table of the ordinals of the language: their cardinal number word,
+        for ``ord2card``, and their ending after digits, for ``num_ord``.
+
+        The table is compiled once per language class, on first use.
+        """
+        table: Optional[Dict[str, Tuple[str, str]]] = type(self).__dict__.get("_ordinal_table")
+        if table is None:
+            table = self._compile_ordinal_table()
+            setattr(type(self), "_ordinal_table", table)
+        return table
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        return {}
 
     def normalize(self, word: str) -> str:
         return NotImplemented
@@ -72,7 +266,125 @@ class Language:
     def not_numeric_word(self, word: Optional[str]) -> bool:
         return word is None or word != self.DECIMAL_SEP and word not in self.NUMBERS and word not in self.ZERO
 
+    def token_table(self) -> Dict[str, Token]:
+        """Return the table of all the known surface words of the language.
+
+        The table is compiled once per language class, on first use.
+        """
+        table: Optional[Dict[str, Token]] = type(self).__dict__.get("_token_table")
+        if table is None:
+            table = self._compile_token_table()
+            setattr(type(self), "_token_table", table)
+        return table
+
+    def _compile_token_table(self) -> Dict[str, Token]:
+        classes = (
+            (self.UNITS, UNIT),
+            (self.STENS, STEN),
+            (self.MTENS, MTEN),
+            (self.HUNDRED, HUNDRED),
+            (self.MHUNDREDS, MHUNDRED),
+            (self.MULTIPLIERS, MULTIPLIER),  # multipliers take precedence
+        )
+        mtens_wstens: Set[str] = getattr(self, "MTENS_WSTENS", set())
+        kinds: Dict[str, int] = {}
+        for words, kind in classes:
+            for word in words:
+                kinds[word] = MTEN_WSTEN if word in mtens_wstens else kind
+
+        decimal_seps = {self.DECIMAL_SEP, *self.DECIMAL_SEP.split(",")}
+        table: Dict[str, Token] = {}
+        for surface in (
+            set(self.NUMBERS) | self.NORMALIZED_VARIANTS | self.ZERO | set(self.SIGN) | decimal_seps
+        ):
+            word = self.normalize(surface)
+            table[surface] = Token(
+                word,
+                kinds.get(word, TERMINAL) if word in self.NUMBERS else NOT_NUMBER,
+                self.NUMBERS.get(word, 0),
+                is_zero=surface in self.ZERO,
+                sign=self.SIGN.get(surface),
+                is_decimal_sep=surface in decimal_seps,
+            )
+        relaxed = getattr(self, "RELAXED", {})
+        for token in table.values():
+            if token.word in relaxed:
+                nxt, target = relaxed[token.word]
+                token.relaxed = (nxt, table[target])
+        return table
+
+    def lookup(self, word: str) -> Optional[Token]:
+        """Return the compiled token for the surface ``word``, or None if it is unknown."""
+        table = self.token_table()
+        token = table.get(word)
+        if token is None and self.normalize_on_miss:
+            normalized = self.normalize(word)
+            number = table.get(normalized) if normalized != word else None
+            if number is not None and number.kind != NOT_NUMBER:
+                token = Token(normalized, number.kind, number.value)
+                token.relaxed = number.relaxed
+        return token
+
+    def vocabulary(self) -> FrozenSet[str]:
+        """Return all the lower case words that can be part of a number, once split
+        by ``split_words``.
+
+        The vocabulary is compiled once per language class, on first use.
+        """
+        vocabulary: Optional[FrozenSet[str]] = type(self).__dict__.get("_vocabulary")
+        if vocabulary is None:
+            vocabulary = self._compile_vocabulary()
+            setattr(type(self), "_vocabulary", vocabulary)
+        return vocabulary
+
+    def _compile_vocabulary(self) -> FrozenSet[str]:
+        and_nums: Set[str] = getattr(self, "AND_NUMS", set())
+        words = set(self.token_table()) | and_nums | self.ORDINAL_STEMS
+        parts = {part for word in words for part in word.split("-") if part}
+        return frozenset(
+            parts | {part + suffix for part in parts for suffix in self.ORDINAL_SUFFIXES}
+        )
+
+    def may_contain_number(self, text: str) -> bool:
+        """Return False if ``text`` is sure not to contain any number word of the language."""
+        return not self.vocabulary().isdisjoint(split_words(text.lower()))
+
     def split_number_word(self, word: str) -> str:  # maybe use: List[str]
         """In some languages numbers are written as one word, e.g. German
         'zweihunderteinundfünfzig' (251) and we might need to split the parts"""
         return NotImplemented
+
+    def splitter(self) -> CompoundSplitter:
+        """Return the splitter of the compound number words, for ``split_number_word``.
+
+        The splitter is built once per language class, on first use.
+        """
+        splitter: Optional[CompoundSplitter] = type(self).__dict__.get("_splitter")
+        if splitter is None:
+            splitter = self._compile_splitter()
+            setattr(type(self), "_splitter", splitter)
+        return splitter
+
+    def _compile_splitter(self) -> CompoundSplitter:
+        return CompoundSplitter(self.NUMBERS)
+
+
+def split_words(text: str) -> List[str]:
+    """Split ``text`` on spaces and ``WORD_BREAKS``."""
+    for char in WORD_BREAKS:
+        if char in text:
+            text = text.replace(char, " ")
+    return text.split()
+
+
+def split_segments(separator: Pattern[str], text: str) -> Iterator[Tuple[str, str]]:
+    """Yield the ``(segment, separator)`` couples of ``text`` split on ``separator``,
+    in order, in a single scan. The last segment comes with an empty separator.
+
+    ``separator`` must not match the empty string.
+    """
+    start = 0
+    for match in separator.finditer(text):
+        yield text[start:match.start()], match.group()
+        start = match.end()
+    yield text[start:], ""
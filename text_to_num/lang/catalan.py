@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Set, Tuple
 
 from .base import Language
 
@@ -201,6 +201,7 @@ IRR_ORD = {
 
 class Catalan(Language):
 
+    ISO_CODE = "ca"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -222,61 +223,46 @@ class Catalan(Language):
     # start => (next, target)
     RELAXED: Dict[str, Tuple[str, str]] = {}
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
+    ORDINAL_SUFFIXES = ("è", "é", "ena", "ens", "enes")
+    ORDINAL_STEMS = (
+        set(IRR_ORD)
+        | {"cinqu", "nov", "des", "dihuit", "deneu", "milion"}
+        | {word[:-1] for word in NUMBERS if word.endswith(("e", "a", "s"))}
+    )
 
-        Return None if word is not an ordinal or is better left in letters.
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the cardinals, without their final "e", "a" or "s" (onze -> onzè,
+        trenta -> trentè, dos-cents -> dos-centè), and some irregular radicals, with
+        a gender and number suffix, but for the first ten.
         """
-        if word in IRR_ORD:
-            return IRR_ORD[word][0]
-        plur_masc_suff = word.endswith("ens")
-        plur_fem_suff = word.endswith("enes")
-        sing_masc_suff = word.endswith("è") or word.endswith("é")  # dialectal variant
-        sing_fem_suff = word.endswith("ena")
-        if not (plur_masc_suff or plur_fem_suff or sing_masc_suff or sing_fem_suff):
-            return None
-        if plur_fem_suff:
-            source = word[:-4]
-        elif sing_masc_suff:
-            source = word[:-1]
-        else:  # if plur_masc_suff or sing_fem_suff:
-            source = word[:-3]
-        if source == "cinqu":  # 5
-            source = "cinc"
-        elif source == "nov":  # 9
-            source = "nou"
-        elif source == "des":  # 10
-            source = "deu"
-        elif source == "dihuit":  # 18 Valencian variant
-            source = "díhuit"
-        elif source == "deneu":  # 19 Valencian variant
-            source = "dèneu"
-        elif source == "milion":  # 1000000  # TODO: Fix "un milioné"->"1000000é"
-            source = "milió"
-        elif source not in self.NUMBERS:
-            source = source + "e"  # 11, 12, ..., 16
-            if source not in self.NUMBERS:
-                source = source[:-1] + "a"  # 30, 40, ..., 90
-                if source not in self.NUMBERS:
-                    source = source[:-1] + "s"  # 200, 300, ..., 900
-                    if source not in self.NUMBERS:
-                        return None
-        return source
+        radicals = {word: word for word in self.NUMBERS}
+        for ending in ("e", "a", "s"):  # 11, ..., 16; 30, ..., 90; 200, ..., 900
+            for word in self.NUMBERS:
+                if word.endswith(ending):
+                    radicals.setdefault(word[:-1], word)
+        radicals.update(
+            cinqu="cinc",  # 5
+            nov="nou",  # 9
+            des="deu",  # 10
+            dihuit="díhuit",  # 18 Valencian variant
+            deneu="dèneu",  # 19 Valencian variant
+            milion="milió",  # 1000000  # TODO: Fix "un milioné"->"1000000é"
+        )
+        table = {}
+        for radical, word in radicals.items():
+            for suffix, ending in (("è", "è"), ("é", "é"), ("ena", "a"), ("ens", "ns"), ("enes", "es")):
+                table[radical + suffix] = (word, ending)
+        table.update(IRR_ORD)  # written on their own (see ``num_ord``)
+        return table
 
     def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal"""
+        """Add suffix to number in digits to make an ordinal.
+
+        The irregular ordinals are written on their own, without the preceding digits.
+        """
         if original_word in IRR_ORD:
             return IRR_ORD[original_word][1]
-        elif original_word.endswith("è"):  # masc. sing.
-            return f"{digits}è"
-        elif original_word.endswith("é"):  # masc. sing. dialectal variant
-            return f"{digits}é"
-        elif original_word.endswith("ns"):  # masc. plur.
-            return f"{digits}ns"
-        elif original_word.endswith("a"):  # fem. sing.
-            return f"{digits}a"
-        else:  # if original_word.endswith("es"):  # fem. plur.
-            return f"{digits}es"
+        return super().num_ord(digits, original_word)
 
     def normalize(self, word: str) -> str:
         return word
@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Set, Tuple
 
 from .base import Language
 
@@ -103,7 +103,7 @@ NUMBERS.update(COMPOSITES)
 
 # This maps certain “radical” stems used in ordinals to their base cardinal.
 # In English, the code uses e.g. fif->five, eigh->eight, etc.
-# You can expand or modify if desired in Dutch. 
+# You can expand or modify if desired in Dutch.
 RAD_MAP = {}
 
 # Dutch ordinals can be tricky because of suffixes:
@@ -151,6 +151,7 @@ RELAXED: Dict[str, Tuple[str, str]] = {}
 
 
 class Dutch(Language):
+    ISO_CODE = "nl"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -172,51 +173,24 @@ class Dutch(Language):
     # Relaxed multiword forms (optional):
     RELAXED: Dict[str, Tuple[str, str]] = RELAXED
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """
-        Convert an ordinal number word (e.g. 'tweede', 'dertiende') 
-        to its cardinal form (e.g. 'twee', 'dertien').
-        Return None if the word is not recognized as an ordinal or 
-        if it’s better left in letters.
-        """
-        # Directly check dictionary first:
-        if word in ORDINALS_MAP:
-            return ORDINALS_MAP[word]
-
-        # If not in the direct map, maybe it has 'ste' or 'de' suffix we can strip,
-        # then see if the remainder is in NUMBERS.
-        possible_suffixes = ("ste", "de")
-        for suffix in possible_suffixes:
-            if word.endswith(suffix) and len(word) > len(suffix):
-                # Strip suffix
-                stripped = word[: -len(suffix)]
-                # If there's a known radical mapping, apply that:
-                if stripped in RAD_MAP:
-                    stripped = RAD_MAP[stripped]
-                # Check if the stripped form is in NUMBERS
-                if stripped in self.NUMBERS:
-                    return stripped
-
-        return None
-
-    def num_ord(self, digits: str, original_word: str) -> str:
-        """
-        Create an ordinal form from digit-based cardinal. 
-        E.g., if digits='21' and the original word was 'eenentwintigste',
-        we might return '21ste'. Minimally, we can just default to '…e'. 
-        You can also detect whether to use 'de' or 'ste'.
+    normalize_on_miss = True  # case insensitive
+
+    ORDINAL_SUFFIXES = ("ste", "de")
+    ORDINAL_STEMS = set(ORDINALS_MAP)
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the cardinals with the "ste" or "de" suffix (1ste, 2de),
+        and the forms of ``ORDINALS_MAP``.
         """
-        # Very rough approach:
-        # - “1” → “1e” or “1ste”
-        # - “2” → “2e” or “2de”
-        # - etc.
-        # If you want to mimic actual Dutch rules, you can examine the original word:
-        if original_word.endswith("ste"):
-            return f"{digits}ste"
-        elif original_word.endswith("de"):
-            return f"{digits}de"
-        # fallback
-        return f"{digits}e"
+        table = {}
+        for radical in set(self.NUMBERS) | set(RAD_MAP):
+            word = RAD_MAP.get(radical, radical)
+            if word in self.NUMBERS:
+                table[radical + "ste"] = (word, "ste")
+                table[radical + "de"] = (word, "de")
+        for ordinal, word in ORDINALS_MAP.items():
+            table[ordinal] = (word, "ste" if ordinal.endswith("ste") else "de")
+        return table
 
     def normalize(self, word: str) -> str:
         """
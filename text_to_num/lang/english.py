@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Set, Tuple
 
 from .base import Language
 
@@ -104,6 +104,7 @@ RAD_MAP = {"fif": "five", "eigh": "eight", "nin": "nine", "twelf": "twelve"}
 
 class English(Language):
 
+    ISO_CODE = "en"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -125,42 +126,38 @@ class English(Language):
     # start => (next, target)
     RELAXED: Dict[str, Tuple[str, str]] = {}
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
+    PHRASE_WORDS = {100: "one hundred", 1000: "one thousand"}
 
-        Return None if word is not an ordinal or is better left in letters.
+    ORDINAL_SUFFIXES = ("th", "ths")
+    ORDINAL_STEMS = (
+        {"first", "second", "third"}
+        | set(RAD_MAP)
+        | {word[:-1] + "ie" for word in NUMBERS if word.endswith("y")}
+    )
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the cardinals with their "th" or "ths" suffix, the last letters
+        adjusted (twentieth, fifth, eighth, ninth, twelfth), and the compounds
+        of first, second and third.
         """
-        plur_suff = word.endswith("ths")
-        sing_suff = word.endswith("th")
-        if not (plur_suff or sing_suff):
-            if word.endswith("first"):
-                source = word.replace("first", "one")
-            elif word.endswith("second"):
-                source = word.replace("second", "two")
-            elif word.endswith("third"):
-                source = word.replace("third", "three")
-            else:
-                return None
-        else:
-            source = word[:-3] if plur_suff else word[:-2]
-        if source in RAD_MAP:
-            source = RAD_MAP[source]
-        elif source.endswith("ie"):
-            source = source[:-2] + "y"
-        elif source.endswith("fif"):  # fifth -> five
-            source = source[:-1] + "ve"
-        elif source.endswith("eigh"):  # eighth -> eight
-            source = source + "t"
-        elif source.endswith("nin"):  # ninth -> nine
-            source = source + "e"
-        if source not in self.NUMBERS:
-            return None
-        return source
-
-    def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal"""
-        sf = original_word[-3:] if original_word.endswith("s") else original_word[-2:]
-        return f"{digits}{sf}"
+        radicals = {word: word for word in self.NUMBERS}
+        for word in self.NUMBERS:
+            if word.endswith("y"):  # twenty -> twentie(th)
+                radicals[word[:-1] + "ie"] = word
+            elif word.endswith("five"):  # twenty-five -> twenty-fif(th)
+                radicals[word[:-2] + "f"] = word
+            elif word.endswith(("eight", "nine")):
+                radicals[word[:-1]] = word
+        radicals.update((radical, word) for radical, word in RAD_MAP.items() if word in self.NUMBERS)
+        table = {}
+        for radical, word in radicals.items():
+            table[radical + "th"] = (word, "th")
+            table[radical + "ths"] = (word, "ths")
+        for word in self.NUMBERS:
+            for cardinal, ordinal in (("one", "first"), ("two", "second"), ("three", "third")):
+                if word.endswith(cardinal):
+                    table[word[: -len(cardinal)] + ordinal] = (word, ordinal[-2:])
+        return table
 
     def normalize(self, word: str) -> str:
         return word
@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional
+from typing import Dict, Tuple
 
 from .base import Language
 
@@ -137,6 +137,7 @@ IRR_ORD = {
 
 class French(Language):
 
+    ISO_CODE = "fr"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -158,33 +159,39 @@ class French(Language):
     # start => (next, target)
     RELAXED = {"quatre": ("vingt", "quatre-vingt")}
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
+    PHRASE_WORDS = {1000: "mille"}
+    PHRASE_WORDS.update({value * 1000: word + " mille" for word, value in UNITS.items() if value > 1})
 
-        Return None if word is not an ordinal or is better left in letters.
+    NORMALIZED_VARIANTS = {"vingts"}
+    normalize_on_miss = True  # any "...vingts..." word
+
+    ORDINAL_SUFFIXES = ("ième", "ièmes")
+    ORDINAL_STEMS = set(IRR_ORD) | {"cinqu", "neuv"} | {word[:-1] for word in NUMBERS if word.endswith("e")}
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the cardinals, without their final "e" (onze -> onzième),
+        with the "ième" or "ièmes" suffix, but for a few irregular ones.
         """
-        if word in IRR_ORD:
-            return IRR_ORD[word][0]
-        plur_suff = word.endswith("ièmes")
-        sing_suff = word.endswith("ième")
-        if not (plur_suff or sing_suff):
-            return None
-        source = word[:-5] if plur_suff else word[:-4]
-        if source == "cinqu":
-            source = "cinq"
-        elif source == "neuv":
-            source = "neuf"
-        elif source not in self.NUMBERS:
-            source = source + "e"
-            if source not in self.NUMBERS:
-                return None
-        return source
+        radicals = {word: word for word in self.NUMBERS}
+        for word in self.NUMBERS:
+            if word.endswith("e"):
+                radicals.setdefault(word[:-1], word)
+        radicals.update(cinqu="cinq", neuv="neuf")
+        table = {}
+        for radical, word in radicals.items():
+            table[radical + "ième"] = (word, "ème")
+            table[radical + "ièmes"] = (word, "èmes")
+        table.update(IRR_ORD)  # written on their own (see ``num_ord``)
+        return table
 
     def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal"""
+        """Add suffix to number in digits to make an ordinal.
+
+        The irregular ordinals are written on their own, without the preceding digits.
+        """
         if original_word in IRR_ORD:
             return IRR_ORD[original_word][1]
-        return f"{digits}ème" if original_word.endswith("e") else f"{digits}èmes"
+        return super().num_ord(digits, original_word)
 
     def normalize(self, word: str) -> str:
         return word.replace("vingts", "vingt")
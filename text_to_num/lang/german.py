@@ -20,10 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional
-import re
+from typing import Dict, Optional, Tuple
 
-from .base import Language
+from .base import CompoundSplitter, Language, split_words
 
 #
 # CONSTANTS
@@ -108,9 +107,11 @@ ALL_WORDS_SORTED_REVERSE = dict(sorted(
 
 class German(Language):
 
+    ISO_CODE = "de"
+
     # TODO: can this be replaced entirely?
-    # Currently it has to be imported into 'parsers' as well ...
     NUMBER_DICT_GER = {"null": 0, **NUMBERS}
+    NUMBER_WORDS_GER = tuple(NUMBER_DICT_GER)
 
     ORDINALS_FIXED_GER = {
         "erste": "eins",
@@ -144,46 +145,84 @@ class German(Language):
     # start => (next, target)
     # RELAXED: Dict[str, Tuple[str, str]] = {}  # TODO: not supported yet
 
+    PHRASE_TENS = "{units}und{tens}"
+    PHRASE_AFTER_HUNDREDS = ("",)
+    PHRASE_AFTER_THOUSANDS = ("",)
+    PHRASE_COEF = ""
+
+    ORDINAL_STEMS = set(ORDINALS_FIXED_GER)
+
     def ord2card(self, word: str) -> Optional[str]:
         """Convert ordinal number to cardinal.
         Return None if word is not an ordinal or is better left in letters.
+
+        The simple ordinals are found in ``ordinal_table``, the compound ones
+        (zweiundzwanzigster) are split.
         """
-        if len(word) > 4:
-            word_base = None
-            # example transf.: zwanzigster -> zwanzigste -> zwanzigs -> zwanzig
-            if word.endswith("ter") or word.endswith("tes") or word.endswith("ten"):
-                word_base = word[:-1].lower()       # e.g. erster -> erste
-            elif word.endswith("te"):
-                word_base = word.lower()
-            if word_base:
-                if word_base in self.ORDINALS_FIXED_GER:
-                    return self.ORDINALS_FIXED_GER[word_base]
-                else:
-                    word_base = word_base[:-2]      # e.g. vierte -> vier
-                    if word_base.endswith("s"):
-                        word_base = word_base[:-1]  # e.g. zwanzigs -> zwanzig
-                    if word_base in self.NUMBER_DICT_GER:
-                        return word_base
-                    # here we could still have e.g: "zweiundzwanzig"
-                    if word_base.endswith(tuple(self.NUMBER_DICT_GER)):
-                        # once again split - TODO: we should try to reduce split calls
-                        word_base_split = self.split_number_word(word_base).split()
-                        wbs_length = len(word_base_split)
-                        if (
-                            wbs_length > 0
-                            and word_base_split[wbs_length - 1] in self.NUMBER_DICT_GER
-                        ):
-                            return "".join(word_base_split)
-                    return None
-            else:
-                return None
-        else:
+        if len(word) <= 4 or not word.endswith(("te", "ter", "tes", "ten")):
             return None
+        ordinal = word.lower()
+        entry = self.ordinal_table().get(ordinal)
+        if entry is not None:
+            return entry[0]
+        return self._ordinal_cardinal(ordinal)
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """The simple ordinals are the fixed ones, and the number words with the "te"
+        (< 20) or "ste" suffix, inflected.
+        """
+        table = {}
+        radicals = [*self.ORDINALS_FIXED_GER, *(word + "te" for word in self.NUMBER_DICT_GER)]
+        radicals += [word + "ste" for word in self.NUMBER_DICT_GER]
+        for radical in radicals:
+            for ending in ("", "r", "s", "n"):
+                cardinal = self._ordinal_cardinal(radical + ending)
+                if cardinal and len(radical + ending) > 4:
+                    table[radical + ending] = (cardinal, ".")
+        return table
+
+    def _ordinal_cardinal(self, ordinal: str) -> Optional[str]:
+        """Return the cardinal of ``ordinal``, in lower case and ending with "te", "ter",
+        "tes" or "ten", or None.
+        """
+        # example transf.: zwanzigster -> zwanzigste -> zwanzigs -> zwanzig
+        base = ordinal if ordinal.endswith("te") else ordinal[:-1]  # e.g. erster -> erste
+        if base in self.ORDINALS_FIXED_GER:
+            return self.ORDINALS_FIXED_GER[base]
+        base = base[:-2]      # e.g. vierte -> vier
+        if base.endswith("s"):
+            base = base[:-1]  # e.g. zwanzigs -> zwanzig
+        if base in self.NUMBER_DICT_GER:
+            return base
+        # here we could still have e.g: "zweiundzwanzig"
+        if base.endswith(self.NUMBER_WORDS_GER):
+            pieces = self.splitter().split(base)
+            if pieces and pieces[-1] in self.NUMBER_DICT_GER:
+                return "".join(pieces)
+        return None
 
     def num_ord(self, digits: str, original_word: str) -> str:
         """Add suffix to number in digits to make an ordinal"""
         return f"{digits}."
 
+    def may_contain_number(self, text: str) -> bool:
+        """Return False if ``text`` is sure not to contain any number word of the language.
+
+        Number words are glued together, so look for them at the start of every word.
+        """
+        index: Optional[Dict[str, Tuple[str, ...]]] = type(self).__dict__.get("_prefix_index")
+        if index is None:
+            prefixes: Dict[str, Tuple[str, ...]] = {}
+            for word in self.vocabulary():
+                prefixes[word[:2]] = prefixes.get(word[:2], ()) + (word,)
+            index = prefixes
+            setattr(type(self), "_prefix_index", index)
+        for word in split_words(text.lower()):
+            candidates = index.get(word[:2])
+            if candidates and word.startswith(candidates):
+                return True
+        return False
+
     def normalize(self, word: str) -> str:
         return word
 
@@ -191,44 +230,9 @@ class German(Language):
         """Splits number words into separate words, e.g.
         einhundertfünzig -> ein hundert fünfzig
         """
-        text = word.lower()  # NOTE: if we want to use this outside it should keep case
-        invalid_word = ""
-        result = ""
-        while len(text) > 0:
-            # start with the longest
-            found = False
-            for sw, int_num in ALL_WORDS_SORTED_REVERSE.items():
-                # Check at the beginning of the current sentence for the longest word in ALL_WORDS
-                if text.startswith(sw):
-                    if len(invalid_word) > 0:
-                        result += invalid_word + " "
-                        invalid_word = ""
-                    result += sw + " "
-                    text = text[len(sw):]
-                    found = True
-                    break
-            # current beginning could not be assigned to a word:
-            if not found:
-                # is (large) ordinal ending?
-                ord_match = None
-                if not invalid_word and len(result) > 3 and text.startswith("ste"):
-                    ord_match = re.search(self.LARGE_ORDINAL_SUFFIXES_GER, text)
-
-                if ord_match:
-                    # add ordinal ending
-                    end = ord_match.span()[1]
-                    # result = result[:-1] + text[start:end]   # drop last space and add suffix
-                    text = text[end:]
-                    invalid_word = ""
-                elif not text[0] == " ":
-                    # move one index
-                    invalid_word += text[0:1]
-                    text = text[1:]
-                else:
-                    if len(invalid_word) > 0:
-                        result += invalid_word + " "
-                        invalid_word = ""
-                    text = text[1:]
-        if len(invalid_word) > 0:
-            result += invalid_word + " "
-        return result
+        # NOTE: if we want to use this outside it should keep case
+        return "".join(piece + " " for piece in self.splitter().split(word.lower()))
+
+    def _compile_splitter(self) -> CompoundSplitter:
+        # The suffixes of LARGE_ORDINAL_SUFFIXES_GER
+        return CompoundSplitter(ALL_WORDS_SORTED_REVERSE, suffixes=("ster", "stes", "sten", "ste"))
@@ -20,9 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple, List
+from typing import Dict, List, Optional, Set, Tuple
 
-from .base import Language
+from .base import CompoundSplitter, Language
 
 #
 # CONSTANTS for Italian
@@ -46,12 +46,12 @@ UNITS: Dict[str, int] = {
 
 
 STENS: Dict[str, int] = {
-word: value
+    word: value
     for value, word in enumerate(
         "dieci undici dodici tredici quattordici quindici sedici diciassette diciotto diciannove"
         .split(),
         10,
-        )
+    )
 }
 
 MTENS: Dict[str, int] = {
@@ -84,8 +84,10 @@ NUMBERS.update(MTENS)
 NUMBERS.update(HUNDRED)
 NUMBERS.update(COMPOSITES)
 
+
 class Italian(Language):
 
+    ISO_CODE = "it"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -107,15 +109,23 @@ class Italian(Language):
 
     RELAXED: Dict[str, Tuple[str, str]] = {}
 
-    # TODO
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
-        Return None if word is not an ordinal or is better left in letters
-        as is the case for first and second.
-        """
-        # This will require specific implementation based on Italian ordinal rules.
-        return None
+    PHRASE_TENS = "{tens}{units}"
+    PHRASE_AFTER_HUNDREDS = ("",)
+    PHRASE_AFTER_THOUSANDS = ("",)
+    PHRASE_COEF = ""
+    PHRASE_WORDS = {1000: "mille"}
+    # the tens drop their final vowel before uno and otto
+    PHRASE_WORDS.update(
+        {
+            ten + unit: ten_word[:-1] + unit_word
+            for ten_word, ten in MTENS.items()
+            for unit_word, unit in (("uno", 1), ("otto", 8))
+        }
+    )
 
+    normalize_on_miss = True  # case insensitive
+
+    # TODO
     def num_ord(self, digits: str, original_word: str) -> str:
         """Add suffix to number in digits to make an ordinal"""
         # This will require specific rules for Italian ordinal suffixes.
@@ -123,8 +133,6 @@ class Italian(Language):
 
     def normalize(self, word: str) -> str:
         return word.lower()
-    
-
 
 
 class iWtoN:
@@ -151,49 +159,40 @@ class iWtoN:
         'diciotto': 18,
         'diciannove': 19,
         'venti': 20,
-        'vent': 20,
         'trenta': 30,
-        'trent': 30,
         'quaranta': 40,
-        'quarant': 40,
         'cinquanta': 50,
-        'sessant': 60,
         'sessanta': 60,
         'settanta': 70,
-        'settant': 70,
         'ottanta': 80,
-        'ottant': 80,
         'novanta': 90,
-        'novant': 90,
     }
 
-    TEN = {
-        'venti': 20,
+    # The tens without their final vowel, only found before "uno" and "otto"
+    ELIDED = {
         'vent': 20,
-        'trenta': 30,
         'trent': 30,
-        'quaranta': 40,
         'quarant': 40,
-        'cinquanta': 50,
-        'cinquanta': 50,
-        'sessanta': 60,
+        'cinquant': 50,
         'sessant': 60,
-        'settanta': 70,
         'settant': 70,
-        'ottanta': 80,
         'ottant': 80,
-        'novanta': 90,
-        'novant': 90
+        'novant': 90,
     }
+    ELIDED_BEFORE = {'uno', 'otto'}
 
     JOINER = 'e'
     NEGATIVE = 'meno'
-    TEN_KEYS = ['venti', 'vent', 'trenta', 'trent', 'quaranta', 'quarant', 'cinquanta', 'cinquant', 'sessanta', 'sessant', 'settanta', 'settant', 'ottanta', 'ottant', 'novanta', 'novant']
     MAGNITUDE = {
         'cento': 100,
         'mille': 1000,
         'milione': 1000000
     }
+    HUNDREDS = {'cento', 'cent'}  # "cent" is elided before "otto" and "ottanta"
+    MILLIONS = {'milione', 'milioni'}
+
+    # The splitter of the compound words, built on first use
+    splitter: Optional[CompoundSplitter] = None
 
     @staticmethod
     def convert(words: str) -> int:
@@ -219,95 +218,106 @@ class iWtoN:
         return result if result else array
 
     @staticmethod
-    def compute(tokens: List[object]) -> int:
-        obj = {
-            'sum': 0
-        }
+    def split(word: str) -> Tuple[str, ...]:
+        """Split the compound number word ``word`` into its parts, in a single pass:
+        "duemilatrecentoventuno" (2321) is "due mila tre cento vent uno".
 
-        leftover = ''
+        The elided tens ("vent", "trent") and "cent" are taken when the full words
+        leave a remainder that cannot be split.
+        """
+        if iWtoN.splitter is None:
+            iWtoN.splitter = CompoundSplitter(
+                [*iWtoN.UNIT, *iWtoN.ELIDED, *iWtoN.MAGNITUDE, *iWtoN.HUNDREDS, *iWtoN.MILLIONS, 'mila'],
+                backtrack=True,
+            )
+        return iWtoN.splitter.split(word)
 
-        for token in tokens:
-            obj['str'] = token
+    @staticmethod
+    def compute(tokens: List[object]) -> int:
+        """Return the value of ``tokens``, the words and numbers of ``tokenize``.
 
+        Their pieces must come in the order of the Italian numbers: the millions, then
+        the thousands ("mille" or a group before "mila"), then a group below a thousand
+        (see ``group_value``). The number of millions can have thousands itself.
+        Raise ValueError otherwise.
+        """
+        pieces: List[object] = []
+        for token in tokens:
             if isinstance(token, int):
-                obj['sum'] += token
+                pieces.append(token)
             else:
-                obj = iWtoN.getMillion(obj['str'], obj['sum'])
-                leftover += obj['str']
-
-        if leftover:
-            raise ValueError('Failed to completely convert string to number')
-
-        return obj['sum']
-
-    @staticmethod
-    def getMillion(string: str, sum: int) -> Dict[str, int]:
-
-        if 'milione' in string or 'milioni' in string:
-            sum = iWtoN.MAGNITUDE['milione'] if sum == 0 else sum * iWtoN.MAGNITUDE['milione']
-            string = string.replace('milione', '').replace('milioni', '')
-            
-        if 'milione' in string:
-            sum *= iWtoN.MAGNITUDE['milione']
-            string = string.replace('milione', '')
-        elif 'milioni' in string:
-            sum *= iWtoN.MAGNITUDE['milione']
-            string = string.replace('milioni', '')
-
-        if string:
-            return iWtoN.getThousands(string, sum)
-        else:
-            return {'str': string, 'sum': sum}
-
-    @staticmethod
-    def getThousands(string: str, sum: int) -> Dict[str, int]:
-        if 'mille' in string:
-            sum += iWtoN.MAGNITUDE['mille']
-            string = string.replace('mille', '')
-        elif 'mila' in string:
-            sum += iWtoN.getHundreds(string[:string.index('mila')], 0)['sum'] * iWtoN.MAGNITUDE['mille']
-            string = string[string.index('mila') + 4:]
-
-        if string:
-            return iWtoN.getHundreds(string, sum)
-        else:
-            return {'str': string, 'sum': sum}
-
-    @staticmethod
-    def getHundreds(string: str, sum: int) -> Dict[str, int | str]:
-        if 'cento' in string:
-            sum += (1 if string.index('cento') == 0 else iWtoN.getUnit(string[:string.index('cento')], 0)['sum']) * iWtoN.MAGNITUDE['cento']
-            string = string[string.index('cento') + 5:]
-
-        if string:
-            return iWtoN.getTens(string, sum)
-        else:
-            return {'str': string, 'sum': sum}
-
-    @staticmethod
-    def getTens(string: str, sum: int) -> Dict[str, int | str]:
-        found = False
-        for key in iWtoN.TEN_KEYS:
-            if key in string:
-                sum += iWtoN.TEN[key]
-                string = string.replace(key, '')
-                found = True
-                break
-
-        if string:
-            return iWtoN.getUnit(string, sum)
-        else:
-            return {'str': string, 'sum': sum}
+                pieces.extend(iWtoN.split(str(token)))
+        if not pieces:
+            raise ValueError('No number to convert')
+        if pieces == ['zero']:
+            return 0
+
+        millions = None
+        thousands = None
+        group: List[object] = []  # the pieces since the last magnitude
+        for piece in pieces:
+            if piece in iWtoN.MILLIONS:
+                if millions is not None:
+                    raise ValueError('The millions must not be repeated')
+                millions = (
+                    (thousands or 0) * iWtoN.MAGNITUDE['mille'] + (iWtoN.group_value(group) if group else 0)
+                ) or 1
+                thousands = None
+            elif piece == 'mila' or piece == 'mille':
+                if thousands is not None:
+                    raise ValueError('The thousands must not be repeated')
+                if piece == 'mille':
+                    if group:
+                        raise ValueError('"mille" must not follow a number')
+                    thousands = 1
+                else:
+                    thousands = iWtoN.group_value(group) if group else 0
+                    if thousands < 2:  # "mille"
+                        raise ValueError('"mila" must follow a number greater than one')
+            else:
+                group.append(piece)
+                continue
+            group = []
+
+        return (
+            (millions or 0) * iWtoN.MAGNITUDE['milione']
+            + (thousands or 0) * iWtoN.MAGNITUDE['mille']
+            + (iWtoN.group_value(group) if group else 0)
+        )
 
     @staticmethod
-    def getUnit(string: str, sum: int) -> Dict[str, int | str]:
-        if string in iWtoN.UNIT:
-            sum += iWtoN.UNIT[string]
-            string = string.replace(string, '')
-        else:
-            sum += 0
-
-        return {'str': string, 'sum': sum}
-
-
+    def group_value(pieces: List[object]) -> int:
+        """Return the value of ``pieces``, a number below a thousand or a number in
+        digits: an optional unit and "cento", then a unit, a teen, a ten or a ten and a
+        unit ("trecentoventuno" is "tre cento vent uno").
 
+        Raise ValueError if they are in another order.
+        """
+        if len(pieces) == 1 and isinstance(pieces[0], int):
+            return pieces[0]
+        value = 0
+        if len(pieces) > 1 and pieces[1] in iWtoN.HUNDREDS:
+            value = iWtoN.UNIT.get(str(pieces[0]), 0)
+            if not 2 <= value <= 9:
+                raise ValueError('Only the units from two to nine multiply "cento"')
+            pieces = pieces[1:]
+        if pieces and pieces[0] in iWtoN.HUNDREDS:
+            if pieces[0] == 'cent' and not str(pieces[1:2]).startswith("['ott"):
+                raise ValueError('"cent" is only elided before "otto" and "ottanta"')
+            value = (value or 1) * iWtoN.MAGNITUDE['cento']
+            pieces = pieces[1:]
+
+        if not pieces:
+            return value
+        first = str(pieces[0])
+        if len(pieces) == 1 and iWtoN.UNIT.get(first, 0) > 0:
+            return value + iWtoN.UNIT[first]
+        if len(pieces) == 2:
+            unit = iWtoN.UNIT.get(str(pieces[1]), 0)
+            if 1 <= unit <= 9:
+                if first in iWtoN.ELIDED and pieces[1] in iWtoN.ELIDED_BEFORE:
+                    return value + iWtoN.ELIDED[first] + unit
+                ten = iWtoN.UNIT.get(first, 0)
+                if ten >= 20:
+                    return value + ten + unit
+        raise ValueError('Failed to completely convert string to number')
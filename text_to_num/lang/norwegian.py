@@ -20,9 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Set, Tuple
 
-from .base import Language
+from .base import CompoundSplitter, Language
 
 #
 # CONSTANTS
@@ -118,7 +118,7 @@ SIGN: Dict[str, str] = {
     "minus": "-",
 }
 
-# Decimal separator in Norwegian is typically "komma" in writing, but 
+# Decimal separator in Norwegian is typically "komma" in writing, but
 # the library wants final output with a dot => we set DECIMAL_SYM = "."
 DECIMAL_SEP = "komma"
 DECIMAL_SYM = "."
@@ -128,8 +128,8 @@ AND = "og"
 AND_NUMS: Set[str] = set()
 
 # Words that you NEVER want to turn into a digit if they appear "alone"
-# The English tests do a context-based approach for “one.” 
-# We add "en" here so the parser can skip numeric conversion in article contexts 
+# The English tests do a context-based approach for “one.”
+# We add "en" here so the parser can skip numeric conversion in article contexts
 # but can still parse it if it combines with another numeric token or word.
 NEVER_IF_ALONE: Set[str] = {"en", "ett"}
 
@@ -137,7 +137,7 @@ NEVER_IF_ALONE: Set[str] = {"en", "ett"}
 # so we leave it empty:
 RELAXED: Dict[str, Tuple[str, str]] = {}
 
-# Ordinal -> Cardinal map: covers 1–19, tens, and 100. 
+# Ordinal -> Cardinal map: covers 1–19, tens, and 100.
 ORDINAL_MAP: Dict[str, str] = {
     "første": "en",
     "andre": "to",
@@ -172,6 +172,7 @@ ORDINAL_MAP: Dict[str, str] = {
 
 
 class Norwegian(Language):
+    ISO_CODE = "no"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -191,19 +192,17 @@ class Norwegian(Language):
 
     RELAXED = RELAXED
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """
-        Convert an ordinal word (e.g. 'første', 'andre') into its cardinal form ('en', 'to'), 
-        returning None if it doesn't match or isn't found.
-        """
-        return ORDINAL_MAP.get(word, None)
+    NORMALIZED_VARIANTS = {"syv"}
+    normalize_on_miss = True  # case insensitive
 
-    def num_ord(self, digits: str, original_word: str) -> str:
+    ORDINAL_STEMS = set(ORDINAL_MAP)
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
         """
-        Create an ordinal form from numeric digits. Norwegian commonly 
-        denotes ordinals by appending a dot, e.g. "1." = første, "2." = andre, etc.
+        Norwegian commonly denotes ordinals by appending a dot to the digits,
+        e.g. "1." = første, "2." = andre, etc.
         """
-        return f"{digits}."
+        return {ordinal: (word, ".") for ordinal, word in ORDINAL_MAP.items()}
 
     def normalize(self, word: str) -> str:
         """
@@ -215,8 +214,8 @@ class Norwegian(Language):
 
     def split_number_word(self, word: str) -> str:
         """
-        In Norwegian, numbers like 'tjueen' (21) or 'tjuesju' (27) can appear as 
-        a single word. If found, split it into separate tokens: e.g. 'tjue en'. 
+        In Norwegian, numbers like 'tjueen' (21) or 'tjuesju' (27) can appear as
+        a single word. If found, split it into separate tokens: e.g. 'tjue en'.
         This is a minimal approach using the known dictionaries up to 99.
 
         Returns a single string with tokens separated by space if a match is found.
@@ -226,22 +225,20 @@ class Norwegian(Language):
         if word in self.NUMBERS:
             return word
 
-        # Try all composite forms up to two segments (e.g. 'tjue' + 'en')
+        # Try the composite forms of two segments (e.g. 'tjue' + 'en')
         # that sum up to 99. If found, split them with a space.
-        for ten_word in self.MTENS:
-            if word.startswith(ten_word):
-                remainder = word[len(ten_word):]
-                if remainder in self.UNITS:
-                    # e.g. "tjue" + "en" => "tjue en"
-                    return f"{ten_word} {remainder}"
-
-        # Also check single-tens range (STENS).
-        for stens_word in self.STENS:
-            if word.startswith(stens_word):
-                remainder = word[len(stens_word):]
-                if remainder in self.UNITS:
-                    # e.g. "femten" + "en" => ...
-                    return f"{stens_word} {remainder}"
+        parts = self.splitter().split(word)
+        if (
+            len(parts) == 2
+            and (parts[0] in self.MTENS or parts[0] in self.STENS)
+            and parts[0] + parts[1] == word
+            and parts[1] in self.UNITS
+        ):
+            # e.g. "tjue" + "en" => "tjue en"
+            return " ".join(parts)
 
         # If nothing matched, return unchanged
         return word
+
+    def _compile_splitter(self) -> CompoundSplitter:
+        return CompoundSplitter([*self.MTENS, *self.STENS, *self.UNITS])
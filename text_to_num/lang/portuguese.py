@@ -21,9 +21,10 @@
 # SOFTWARE.
 
 import re
-from typing import Dict, Optional, Set, Tuple, List
+from operator import itemgetter
+from typing import Dict, Iterable, Optional, Set, Tuple, List
 
-from .base import Language
+from .base import Language, split_segments, split_words
 
 #
 # CONSTANTS
@@ -199,6 +200,11 @@ class Portuguese(Language):
     # start => (next, target)
     RELAXED: Dict[str, Tuple[str, str]] = {}
 
+    PHRASE_TENS = "{tens} e {units}"
+    PHRASE_AFTER_HUNDREDS = (" e ",)
+    PHRASE_AFTER_THOUSANDS = (" ", " e ")  # mil duzentos e vinte, mil e vinte
+    PHRASE_WORDS = {100: "cento"}
+
     PT_ORDINALS = {
         "primeir": "um",
         "segund": "dois",
@@ -229,30 +235,40 @@ class Portuguese(Language):
         "nonigentésim": "mil",
         "milionésim": "milhão",
     }
+    ORDINAL_STEMS = set(PT_ORDINALS)
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
-
-        Return None if word is not an ordinal or is better left in letters
-        as is the case for first and second.
-        """
-
-        ord_ = self.PT_ORDINALS.get(word[:-1], None)
-        return ord_
-
-    def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the ordinal stems with a masculine or feminine ending.
 
         Portuguese language: 22° : vigésimo segundo: 20 + 2 °
         so if there is a couple of ordinals found, only add suffix to the last one
+        (see ``OrdinalsMerger``).
         """
-
-        return f"{digits}º" if original_word.endswith("o") else f"{digits}ª"
+        table = {}
+        for stem, word in self.PT_ORDINALS.items():
+            table[stem + "o"] = (word, "º")
+            table[stem + "a"] = (word, "ª")
+        return table
+
+    def may_contain_number(self, text: str) -> bool:
+        """Return False if ``text`` is sure not to contain any number word of the language,
+        nor anything the ``OrdinalsMerger`` would rewrite.
+        """
+        if "º" in text or "°" in text or "ª" in text:
+            return True
+        words = split_words(text.lower())
+        # ordinal stems take any ending
+        return not (
+            self.vocabulary().isdisjoint(words)
+            and self.PT_ORDINALS.keys().isdisjoint(map(WITHOUT_ENDING, words))
+        )
 
     def normalize(self, word: str) -> str:
         return word
 
 
+WITHOUT_ENDING = itemgetter(slice(None, -1))
+
 SEGMENT_BREAK = re.compile(r"\s*[\.,;\(\)…\[\]:!\?]+\s*")
 
 SUB_REGEXES = [
@@ -267,7 +283,62 @@ SUB_REGEXES = [
 ]
 
 
+ORDINAL_MARKS = ("º", "°", "ª")
+
+
 class OrdinalsMerger:
+    def merge_tokens(self, tokens: List[str]) -> List[str]:
+        """Join the compound ordinals of ``tokens``, the output words of a segment (see
+        ``WORD_SEP``) converted by ``alpha2digit``, like ``merge_compound_ordinals_pt``,
+        as they come.
+
+        Example:
+                ["20º", "7º", "andar"] -> ["27º", "andar"]
+
+        A decimal number (12,5) breaks the sequences like a separator, within its token.
+        """
+        out_tokens: List[str] = []
+        ordinal: Optional[int] = None  # sum of the ordinal sequence, if any
+        gender = ""
+        glued = False  # the sequence goes at the end of the last output token
+
+        def write(text: str, glue: bool) -> None:
+            if glue:
+                out_tokens[-1] += text
+            else:
+                out_tokens.append(text)
+
+        for token in tokens:
+            if not token:  # nothing was written for a number word (zero)
+                continue
+            if SEGMENT_BREAK.search(token) is None:
+                pieces: Iterable[Tuple[str, str]] = ((token, ""),)
+            else:
+                pieces = split_segments(SEGMENT_BREAK, token)
+            glue = False  # the piece goes at the end of the last output token
+            for word, sep in pieces:
+                if word:
+                    if self.is_ordinal(word):  # found an ordinal, push into the sequence
+                        if ordinal is None:
+                            glued = glue
+                        ordinal = (ordinal or 0) + self.get_cardinal(word)
+                        gender = self.get_gender(word)
+                    else:
+                        if ordinal is not None:  # close the sequence
+                            write(self.ordinal_style(str(ordinal) + gender), glued)
+                            ordinal = None
+                        write(self.ordinal_style(word), glue)
+                    glue = True
+                if sep:
+                    if ordinal is not None:
+                        write(self.ordinal_style(str(ordinal) + gender), glued)
+                        ordinal = None
+                    write(sep, glue)
+                    glue = True
+        if ordinal is not None:
+            write(self.ordinal_style(str(ordinal) + gender), glued)
+        return out_tokens
+
     def merge_compound_ordinals_pt(self, text: str) -> str:
         """join compound ordinal cases created by a text2num 1st pass
 
@@ -281,12 +352,8 @@ class OrdinalsMerger:
 
         """
 
-        segments = re.split(SEGMENT_BREAK, text)
-        punct = re.findall(SEGMENT_BREAK, text)
-        if len(punct) < len(segments):
-            punct.append("")
         out_segments = []
-        for segment, sep in zip(segments, punct):  # loop over segments
+        for segment, sep in split_segments(SEGMENT_BREAK, text):  # loop over segments
             tokens = [t for t in segment.split(" ") if len(t) > 0]
 
             pointer = 0
@@ -363,6 +430,15 @@ class OrdinalsMerger:
             gender = "º"
         return gender
 
+    @staticmethod
+    def ordinal_style(token: str) -> str:
+        """Write ``token``, without spaces, in text2num style (see ``text2num_style``)."""
+        if not any(mark in token for mark in ORDINAL_MARKS):
+            return token  # no regex applies
+        for regex, replacement in SUB_REGEXES:
+            token = regex.sub(replacement, token)
+        return token
+
     @staticmethod
     def text2num_style(tokens: List[str]) -> List[str]:
         """convert a list of tokens to text2num_style, i.e. : 1 -> un/one/uno/um"""
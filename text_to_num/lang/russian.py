@@ -164,6 +164,7 @@ SKLON_MAP = {
 
 
 class Russian(Language):
+    ISO_CODE = "ru"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -188,26 +189,28 @@ class Russian(Language):
 
     simplify_check_coef_appliable = True
 
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
-
-        Return None if word is not an ordinal or is better left in letters.
-        """
-        ordinal_suff = word.endswith(("ый", "ая", "ое", "ой", "ий", "ье", "ья"))
-        if not ordinal_suff:
-            return None
-
-        source = word[:-2]
-
-        if source in RAD_MAP:
-            return RAD_MAP[source]
-
-        return word
-
-    def num_ord(self, digits: str, original_word: str) -> str:
-        """Add suffix to number in digits to make an ordinal"""
-        sf = original_word[-2:]
-        return f"{digits}{sf}"
+    PHRASE_WORDS = {
+        100: "сто",
+        2000: "две тысячи",
+        3000: "три тысячи",
+        4000: "четыре тысячи",
+        **{value * 1000: word + " тысяч" for word, value in UNITS.items() if value > 4},
+        # the composites are written in two words
+        **{value: word.replace("-", " ") for word, value in COMPOSITES.items()},
+    }
+
+    NORMALIZED_VARIANTS = set(SKLON_MAP)
+
+    ORDINAL_SUFFIXES = ("ый", "ая", "ое", "ой", "ий", "ье", "ья")
+    ORDINAL_STEMS = set(RAD_MAP)
+
+    def _compile_ordinal_table(self) -> Dict[str, Tuple[str, str]]:
+        """Ordinals are the ordinal stems with a gender, number and case ending."""
+        return {
+            stem + suffix: (word, suffix)
+            for stem, word in RAD_MAP.items()
+            for suffix in self.ORDINAL_SUFFIXES
+        }
 
     def normalize(self, word: str) -> str:
         if word in SKLON_MAP:
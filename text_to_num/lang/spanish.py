@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Set, Tuple
 
 from .base import Language
 
@@ -115,6 +115,7 @@ NUMBERS.update(COMPOSITES)
 
 class Spanish(Language):
 
+    ISO_CODE = "es"
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
     STENS = STENS
@@ -148,15 +149,10 @@ class Spanish(Language):
     # start => (next, target)
     RELAXED: Dict[str, Tuple[str, str]] = {}
 
-    # TODO
-    def ord2card(self, word: str) -> Optional[str]:
-        """Convert ordinal number to cardinal.
-
-        Return None if word is not an ordinal or is better left in letters
-        as is the case for fist and second.
-        """
-        return None
+    PHRASE_TENS = "{tens} y {units}"
+    PHRASE_WORDS = {100: "ciento"}
 
+    # TODO
     def num_ord(self, digits: str, original_word: str) -> str:
         """Add suffix to number in digits to make an ordinal"""
         return f"{digits}º" if original_word.endswith("o") else f"{digits}ª"
@@ -0,0 +1,189 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Convert batches of texts in parallel, over a pool of worker processes.
+
+The workers only receive the language code and the options along with the texts:
+each one loads and compiles its languages once, when it starts.
+"""
+
+import os
+from functools import partial
+from itertools import repeat
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .automaton import compile_automaton
+from .lang import LANG, Language
+from .transforms import _value_parser, alpha2digit_many, text2num_many
+
+# Number of chunks per worker, so that the workers that get the short texts
+# can take over the remaining chunks.
+CHUNKS_PER_WORKER = 4
+# Chunks smaller than that (in characters) are not worth their inter-process
+# communication.
+MIN_CHUNK_SIZE = 2000
+
+
+def preload(*langs: str, alpha2digit: bool = True) -> None:
+    """Load and compile the languages ``langs``.
+
+    If ``alpha2digit`` is false, only what ``text2num`` uses is compiled: the
+    automaton is skipped for the languages it does not read (German and Italian).
+
+    This is the initializer of the worker processes.
+    """
+    for lang in langs:
+        language = LANG[lang]
+        language.token_table()
+        language.vocabulary()
+        language.ordinal_table()
+        # only the languages with compound number words use a splitter
+        if type(language).split_number_word is not Language.split_number_word:
+            language.splitter()
+        if lang == "it":
+            from .lang.italian import iWtoN
+
+            iWtoN.split("")  # builds the splitter of the compound words
+        if alpha2digit:
+            # ``WordToDigitParser`` reads the numbers of all the languages with it
+            compile_automaton(language)
+        else:
+            _value_parser(language, relaxed=False)  # compiles it if ``text2num`` uses it
+
+
+def process_pool(
+    langs: Iterable[str], max_workers: Optional[int] = None, alpha2digit: bool = True
+) -> ProcessPoolExecutor:
+    """Return a process pool whose workers preload the languages ``langs``.
+
+    Use it to share the same workers across several batches. If it only serves
+    ``text2num_parallel``, ``alpha2digit`` can be false (see ``preload``).
+    """
+    langs = tuple(langs)
+    for lang in langs:
+        if lang not in LANG:
+            raise Exception("Language not supported")
+    return ProcessPoolExecutor(
+        max_workers, initializer=partial(preload, alpha2digit=alpha2digit), initargs=langs
+    )
+
+
+def chunk(texts: Sequence[str], workers: int, chunksize: Optional[int] = None) -> List[Sequence[str]]:
+    """Cut ``texts`` into consecutive chunks.
+
+    If ``chunksize`` is not given, the chunks are cut so as to hold about the same number of
+    characters, ``CHUNKS_PER_WORKER`` chunks for each of the ``workers``, unless they get
+    smaller than ``MIN_CHUNK_SIZE`` characters.
+    """
+    if chunksize is not None:
+        return [texts[start:start + chunksize] for start in range(0, len(texts), chunksize)]
+    budget = max(MIN_CHUNK_SIZE, sum(map(len, texts)) // (workers * CHUNKS_PER_WORKER))
+    chunks: List[Sequence[str]] = []
+    start = 0
+    size = 0
+    for end, text in enumerate(texts, 1):
+        size += len(text)
+        if size >= budget:
+            chunks.append(texts[start:end])
+            start = end
+            size = 0
+    if start < len(texts):
+        chunks.append(texts[start:])
+    return chunks
+
+
+def alpha2digit_parallel(
+    texts: Iterable[str],
+    lang: str,
+    relaxed: bool = False,
+    signed: bool = True,
+    ordinal_threshold: int = 3,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[str]:
+    """Convert each string of ``texts`` like ``alpha2digit``, in parallel,
+    and return the results in order.
+
+    The work is done by ``executor``, or by a new ``process_pool`` of ``max_workers``
+    processes (default: the number of processors), in chunks of ``chunksize`` texts
+    (default: see ``chunk``). A single chunk is converted in the current process.
+    """
+    options = (relaxed, signed, ordinal_threshold)
+    texts = list(texts)
+    chunks = chunk(texts, max_workers or os.cpu_count() or 1, chunksize)
+    if len(chunks) <= 1 and executor is None:
+        return alpha2digit_many(texts, lang, *options)
+    results: List[str] = []
+    pool = executor or process_pool([lang], max_workers)
+    try:
+        for converted in pool.map(_alpha2digit_chunk, chunks, repeat(lang), repeat(options)):
+            results.extend(converted)
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return results
+
+
+def text2num_parallel(
+    texts: Iterable[str],
+    lang: str,
+    relaxed: bool = False,
+    errors: str = "raise",
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Optional[int]]:
+    """Convert each string of ``texts`` like ``text2num_many``, in parallel,
+    and return the values in order.
+
+    See ``alpha2digit_parallel`` for the ``executor``, ``max_workers`` and ``chunksize``
+    parameters.
+    """
+    if errors not in ("raise", "none"):
+        raise ValueError("errors must be 'raise' or 'none', not {}".format(repr(errors)))
+    options = (relaxed, errors)
+    texts = list(texts)
+    chunks = chunk(texts, max_workers or os.cpu_count() or 1, chunksize)
+    if len(chunks) <= 1 and executor is None:
+        return text2num_many(texts, lang, *options)
+    values: List[Optional[int]] = []
+    pool = executor or process_pool([lang], max_workers, alpha2digit=False)
+    try:
+        for converted in pool.map(_text2num_chunk, chunks, repeat(lang), repeat(options)):
+            values.extend(converted)
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return values
+
+
+def _alpha2digit_chunk(texts: Sequence[str], lang: str, options: Tuple[bool, bool, int]) -> List[str]:
+    return alpha2digit_many(texts, lang, *options)
+
+
+def _text2num_chunk(
+    texts: Sequence[str], lang: str, options: Tuple[bool, str]
+) -> List[Optional[int]]:
+    return text2num_many(texts, lang, *options)
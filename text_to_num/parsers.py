@@ -23,20 +23,51 @@
 Convert spelled numbers into numeric values or digit strings.
 """
 
-from typing import List, Optional
-
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from text_to_num.automaton import (
+    compile_automaton,
+    START,
+    END,
+    ADD,
+    TIMES_HUNDRED,
+    LEAD_LIMITS,
+)
 from text_to_num.lang import Language
-from text_to_num.lang.german import German  # TODO: optimize and remove
+from text_to_num.lang.base import (
+    Token,
+    NOT_NUMBER,
+    UNIT,
+    STEN,
+    MTEN,
+    MTEN_WSTEN,
+    HUNDRED,
+    MHUNDRED,
+    MULTIPLIER,
+)
+
+# Stands for any word unknown to the language
+UNKNOWN_TOKEN = Token("", NOT_NUMBER, 0)
+
+# The state of a parser, as returned by its ``snapshot`` method
+ParserState = Tuple[Any, ...]
 
 
 class WordStreamValueParserInterface:
     """Interface for language-dependent 'WordStreamValueParser'"""
 
+    __slots__ = ("lang", "relaxed")
+
     def __init__(self, lang: Language, relaxed: bool = False) -> None:
         """Initialize the parser."""
         self.lang = lang
         self.relaxed = relaxed
 
+    def reset(self) -> None:
+        """Forget the current number to parse a new one."""
+        return NotImplemented
+
     def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
         """Push next word from the stream."""
         return NotImplemented
@@ -45,6 +76,14 @@ class WordStreamValueParserInterface:
         """Parse whole text (or fail)."""
         return NotImplemented
 
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later."""
+        return NotImplemented
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        return NotImplemented
+
     @property
     def value(self) -> int:
         """At any moment, get the value of the currently recognized number."""
@@ -64,9 +103,13 @@ class WordStreamValueParser(WordStreamValueParserInterface):
     Public API:
 
         - ``self.push(word)``
+        - ``self.reset()``
+        - ``self.snapshot()`` / ``self.restore(state)``
         - ``self.value: int``
     """
 
+    __slots__ = ("skip", "n000_val", "grp_val", "last_token")
+
     def __init__(self, lang: Language, relaxed: bool = False) -> None:
         """Initialize the parser.
 
@@ -74,11 +117,15 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         ``lang.RELAXED`` as single numbers.
         """
         super().__init__(lang, relaxed)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current number to parse a new one."""
         self.skip: Optional[str] = None
         self.n000_val: int = 0  # the number value part > 1000
         self.grp_val: int = 0  # the current three digit group value
-        self.last_word: Optional[
-            str
+        self.last_token: Optional[
+            Token
         ] = None  # the last valid word for the current group
 
     @property
@@ -86,33 +133,48 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         """At any moment, get the value of the currently recognized number."""
         return self.n000_val + self.grp_val
 
-    def group_expects(self, word: str, update: bool = True) -> bool:
-        """Does the current group expect ``word`` to complete it as a valid number?
-        ``word`` should not be a multiplier; multiplier should be handled first.
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later.
+
+        It is cheap: to try a continuation of the number, take a snapshot, push the next
+        words and restore the snapshot if they do not fit, instead of pushing the
+        previous words again to a new engine.
+        """
+        return (self.skip, self.n000_val, self.grp_val, self.last_token)
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        self.skip, self.n000_val, self.grp_val, self.last_token = state
+
+    def group_expects(self, token: Token, update: bool = True) -> bool:
+        """Does the current group expect ``token`` to complete it as a valid number?
+        ``token`` should not be a multiplier; multiplier should be handled first.
         """
         expected = False
-        if self.last_word is None:
+        kind = token.kind
+        last_kind = self.last_token.kind if self.last_token else None
+        if last_kind is None:
             expected = True
         elif (
-            self.last_word in self.lang.UNITS
+            last_kind == UNIT
             and self.grp_val < 10
-            or self.last_word in self.lang.STENS
+            or last_kind == STEN
             and self.grp_val < 20
         ):
-            expected = word in self.lang.HUNDRED
-        elif self.last_word in self.lang.MHUNDREDS:
+            expected = kind == HUNDRED
+        elif last_kind == MHUNDRED:
             expected = True
-        elif self.last_word in self.lang.MTENS:
+        elif last_kind == MTEN or last_kind == MTEN_WSTEN:
             expected = (
-                word in self.lang.UNITS
-                or word in self.lang.STENS
-                and self.last_word in self.lang.MTENS_WSTENS
+                kind == UNIT
+                or kind == STEN
+                and last_kind == MTEN_WSTEN
             )
-        elif self.last_word in self.lang.HUNDRED:
-            expected = word not in self.lang.HUNDRED
+        elif last_kind == HUNDRED:
+            expected = kind != HUNDRED
 
         if update:
-            self.last_word = word
+            self.last_token = token
         return expected
 
     def is_coef_appliable(self, coef: int) -> bool:
@@ -139,6 +201,25 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         # ex. : "mille milliards de milliards"
         return False
 
+    def apply_multiplier(self, coef: int) -> bool:
+        """Apply the multiplier ``coef`` to the current value if it is expected."""
+        if not self.is_coef_appliable(coef):
+            return False
+        # a multiplier can not be applied to a value bigger than itself,
+        # so it must be applied to the current group
+        if coef < 1000:
+            self.grp_val = (self.grp_val or 1) * coef
+        else:
+            if coef < self.n000_val:
+                self.n000_val = self.n000_val + coef * (
+                    self.grp_val or 1
+                )  # or 1 for "mille"
+            else:
+                self.n000_val = (self.value or 1) * coef
+            self.grp_val = 0
+        self.last_token = None
+        return True
+
     def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
         """Push next word from the stream.
 
@@ -154,8 +235,10 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         If this function returns False, and the last call returned True, that means you
         reached the end of a number. You can get its value from ``self.value``.
 
-        Then, to parse a new number, you need to instanciate a new engine and start
-        again from the last word you tried (the one that has just been rejected).
+        Then, to parse a new number, you need to reset the engine (or instanciate a new one)
+        and start again from the last word you tried (the one that has just been rejected).
+        To try words that may not continue the number, take a ``self.snapshot()`` before
+        pushing them, and ``self.restore()`` it if they don't.
         """
         if not word:
             return False
@@ -163,57 +246,138 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         if word == self.lang.AND and look_ahead in self.lang.AND_NUMS:
             return True
 
-        word = self.lang.normalize(word)
-        if word not in self.lang.NUMBERS:
+        token = self.lang.lookup(word)
+        if token is None or token.kind == NOT_NUMBER:
             return False
 
-        RELAXED = self.lang.RELAXED
-
-        if word in self.lang.MULTIPLIERS:
-            coef = self.lang.MULTIPLIERS[word]
-            if not self.is_coef_appliable(coef):
-                return False
-            # a multiplier can not be applied to a value bigger than itself,
-            # so it must be applied to the current group
-            if coef < 1000:
-                self.grp_val = (self.grp_val or 1) * coef
-                self.last_word = None
-                return True
-            if coef < self.n000_val:
-                self.n000_val = self.n000_val + coef * (
-                    self.grp_val or 1
-                )  # or 1 for "mille"
-            else:
-                self.n000_val = (self.value or 1) * coef
-
-            self.grp_val = 0
-            self.last_word = None
+        if token.kind == MULTIPLIER:
+            return self.apply_multiplier(token.value)
         elif (
             self.relaxed
-            and word in RELAXED
+            and token.relaxed
             and look_ahead
-            and look_ahead.startswith(RELAXED[word][0])
-            and self.group_expects(RELAXED[word][1], update=False)
+            and look_ahead.startswith(token.relaxed[0])
+            and self.group_expects(token.relaxed[1], update=False)
         ):
-            self.skip = RELAXED[word][0]
-            self.grp_val += self.lang.NUMBERS[RELAXED[word][1]]
-        elif self.skip and word.startswith(self.skip):
+            self.skip = token.relaxed[0]
+            self.grp_val += token.relaxed[1].value
+        elif self.skip and token.word.startswith(self.skip):
             self.skip = None
-        elif self.group_expects(word):
-            if word in self.lang.HUNDRED:
+        elif self.group_expects(token):
+            if token.kind == HUNDRED:
                 self.grp_val = (
-                    100 * self.grp_val if self.grp_val else self.lang.HUNDRED[word]
+                    100 * self.grp_val if self.grp_val else token.value
                 )
-            elif word in self.lang.MHUNDREDS:
-                self.grp_val = self.lang.MHUNDREDS[word]
+            elif token.kind == MHUNDRED:
+                self.grp_val = token.value
             else:
-                self.grp_val += self.lang.NUMBERS[word]
+                self.grp_val += token.value
         else:
             self.skip = None
             return False
         return True
 
 
+class WordStreamValueAutomaton(WordStreamValueParser):
+    """The value builder engine, running on the compiled automaton of the language.
+
+    It recognizes the same numbers as ``WordStreamValueParser``, which is kept as
+    the reference implementation, but instead of inferring the expectations of the
+    current group from the last word and the group value, it follows the transitions
+    of ``text_to_num.automaton.compile_automaton(lang)``.
+
+    Public API:
+
+        - ``self.push(word)``
+        - ``self.reset()``
+        - ``self.snapshot()`` / ``self.restore(state)``
+        - ``self.value: int``
+    """
+
+    __slots__ = ("delta", "state")
+
+    def __init__(self, lang: Language, relaxed: bool = False) -> None:
+        """Initialize the parser.
+
+        If ``relaxed`` is True, we treat the sequences described in
+        ``lang.RELAXED`` as single numbers.
+        """
+        self.delta = compile_automaton(lang).delta
+        super().__init__(lang, relaxed)
+
+    def reset(self) -> None:
+        """Forget the current number to parse a new one."""
+        super().reset()
+        self.state = START
+
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later.
+
+        See ``WordStreamValueParser.snapshot``.
+        """
+        return (self.skip, self.n000_val, self.grp_val, self.last_token, self.state)
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        self.skip, self.n000_val, self.grp_val, self.last_token, self.state = state
+
+    def apply_multiplier(self, coef: int) -> bool:
+        """Apply the multiplier ``coef`` to the current value if it is expected."""
+        if super().apply_multiplier(coef):
+            self.state = START
+            return True
+        return False
+
+    def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
+        """Push next word from the stream.
+
+        See ``WordStreamValueParser.push``.
+        """
+        if not word:
+            return False
+
+        if word == self.lang.AND and look_ahead in self.lang.AND_NUMS:
+            return True
+
+        token = self.lang.lookup(word)
+        if token is None or token.kind == NOT_NUMBER:
+            return False
+
+        if token.kind == MULTIPLIER:
+            return self.apply_multiplier(token.value)
+
+        row = self.delta[self.state]
+        relaxed = token.relaxed
+        if (
+            self.relaxed
+            and relaxed
+            and look_ahead
+            and look_ahead.startswith(relaxed[0])
+            and row[relaxed[1].kind] is not None
+        ):
+            self.skip = relaxed[0]
+            self.grp_val += relaxed[1].value
+            state = self.state
+        elif self.skip and token.word.startswith(self.skip):
+            self.skip = None
+            return True
+        else:
+            transition = row[token.kind]
+            if transition is None:
+                self.skip = None
+                return False
+            state, action = transition
+            if action == ADD:
+                self.grp_val += token.value
+            elif action == TIMES_HUNDRED:
+                self.grp_val = 100 * self.grp_val if self.grp_val else token.value
+            else:  # SET
+                self.grp_val = token.value
+        limit = LEAD_LIMITS[state]
+        self.state = END if limit and self.grp_val >= limit else state
+        return True
+
+
 class WordStreamValueParserGerman(WordStreamValueParserInterface):
     """The actual value builder engine for the German language.
 
@@ -223,12 +387,20 @@ class WordStreamValueParserGerman(WordStreamValueParserInterface):
     digits by group of three to more easily speak them out.
     And indeed, the language uses powers of 1000 to structure big numbers.
 
+    A block is parsed once the multiplier that ends it is read, so that words can be
+    pushed one by one: only the last, open, block is parsed again on each word.
+
     Public API:
 
         - ``self.parse(word)``
+        - ``self.push(word)``
+        - ``self.reset()``
+        - ``self.snapshot()`` / ``self.restore(state)``
         - ``self.value: int``
     """
 
+    __slots__ = ("val", "pushed", "block", "last_multiplier", "invalid", "blocks_value", "parts")
+
     def __init__(self, lang: Language, relaxed: bool = False) -> None:
         """Initialize the parser.
 
@@ -237,288 +409,236 @@ class WordStreamValueParserGerman(WordStreamValueParserInterface):
         """
         super().__init__(lang, relaxed)
         self.val: int = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current number to parse a new one."""
+        self.val = 0
+        self.pushed = False
+        self.block: List[str] = []  # the words of the open block
+        self.last_multiplier: Optional[int] = None
+        self.invalid = False  # True once a word is not a number word or misplaced
+        # Value of the closed blocks, or None if one of them is invalid,
+        # and the value of their parts in order
+        self.blocks_value: Optional[int] = 0
+        self.parts: List[int] = []
 
     @property
     def value(self) -> int:
         """At any moment, get the value of the currently recognized number."""
         return self.val
 
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later.
+
+        See ``WordStreamValueParser.snapshot``.
+        """
+        # The lists are copied: the snapshots can be restored in any order
+        return (
+            self.val,
+            self.pushed,
+            tuple(self.block),
+            self.last_multiplier,
+            self.invalid,
+            self.blocks_value,
+            tuple(self.parts),
+        )
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        (
+            self.val,
+            self.pushed,
+            block,
+            self.last_multiplier,
+            self.invalid,
+            self.blocks_value,
+            parts,
+        ) = state
+        self.block = list(block)
+        self.parts = list(parts)
+
     def parse(self, text: str) -> bool:
         """Check text for number words, split complex number words (hundertfünfzig)
         if necessary and parse all at once.
+
+        Return ``True`` if ``text`` is a valid number, whose value is then ``self.value``.
         """
+        self.reset()
         # Correct way of writing German numbers is one single word only if < 1 Mio.
         # We need to split to be able to parse the text:
         text = self.lang.split_number_word(text)
         # print("split text:", text) # for debugging
+        for w in text.lower().split():
+            self._add(w)
+        return self._update()
 
-        STATIC_HUNDRED = "hundert"
+    def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
+        """Push the next word of the number, that may be a compound (hundertfünfzig).
 
-        # Split text at MULTIPLIERS into 'num_groups'
+        Return ``True`` if the words pushed so far make a valid number, whose value is
+        then ``self.value``. Unlike the other parsers, the word is kept in any case:
+        the next words may make the number valid again ("zwei und", "zwei und zwanzig").
+        """
+        if self.pushed and re.match(self.lang.LARGE_ORDINAL_SUFFIXES_GER, word.lower()):  # type: ignore
+            # An ordinal suffix alone is glued to the previous words: "zwanzig ste"
+            pass
+        else:
+            for w in self.lang.split_number_word(word).split():
+                self._add(w)
+        self.pushed = True
+        return self._update()
+
+    def _add(self, w: str) -> None:
+        """Add the (split) word ``w`` to the open block, and parse the block if ``w``
+        ends it.
+        """
+        # Split text at MULTIPLIERS into blocks
         # E.g.: 53.243.724 -> drei und fünfzig Millionen
         # | zwei hundert drei und vierzig tausend | sieben hundert vier und zwanzig
+        number_dict = self.lang.NUMBER_DICT_GER  # type: ignore
+        self.block.append(w)
+        if w in self.lang.MULTIPLIERS:
+            # check for multiplier errors (avoid numbers like "tausend einhundert zwei tausend)
+            if self.last_multiplier is None:
+                self.last_multiplier = number_dict[w]
+            elif number_dict[w] >= self.last_multiplier:
+                self.invalid = True
+            block = self.block
+            self.block = []
+            if self.blocks_value is not None:
+                value = self._block_value(block, self.parts)
+                self.blocks_value = None if value is None else self.blocks_value + value
+
+        # Also interrupt if there is any other word (no number, no AND)
+        # (so signs and decimal symbols never reach the blocks)
+        if w not in number_dict and w != self.lang.AND:
+            self.invalid = True
+
+    def _block_value(self, block: List[str], parts: List[int]) -> Optional[int]:
+        """Return the value of ``block``, or None if it is invalid, and append the value
+        of its parts to ``parts``.
+        """
+        value = self._group_value(block, self.lang.NUMBER_DICT_GER, parts)  # type: ignore
+        # Any part that results to 0 and is not the first part means an error
+        if len(parts) > 1 and parts[-1] == 0:
+            return None
+        return value
+
+    def _update(self) -> bool:
+        """Set ``self.val`` to the value of the words added so far, and return True,
+        or return False if they are not a valid number.
+        """
+        if self.invalid or self.blocks_value is None:
+            return False
+        value = self.blocks_value
+        if self.block:
+            block_value = self._block_value(self.block.copy(), self.parts.copy())
+            if block_value is None:
+                return False
+            value += block_value
+        self.val = value
+        return True
 
-        num_groups = []
-        num_block = []
-        text = text.lower()
-        words = text.split()
-        last_multiplier = None
-        equation_results = []
-
-        for w in words:
-            num_block.append(w)
-            if w in self.lang.MULTIPLIERS:
-                num_groups.append(num_block.copy())
-                num_block.clear()
-
-                # check for multiplier errors (avoid numbers like "tausend einhundert zwei tausend)
-                if last_multiplier is None:
-                    last_multiplier = German.NUMBER_DICT_GER[w]
-                else:
-                    current_multiplier = German.NUMBER_DICT_GER[w]
-                    if (
-                        current_multiplier == last_multiplier
-                        or current_multiplier > last_multiplier
-                    ):
-                        raise ValueError(
-                            "invalid literal for text2num: {}".format(repr(w))
-                        )
-
-            # Also interrupt if there is any other word (no number, no AND)
-            if w not in German.NUMBER_DICT_GER and w != self.lang.AND:
-                raise ValueError("invalid literal for text2num: {}".format(repr(w)))
-
-        if len(num_block) > 0:
-            num_groups.append(num_block.copy())
-            num_block.clear()
-
-        main_equation = "0"
-        ng = None
-
-        while len(num_groups) > 0:
-            if ng is None:
-                ng = num_groups[0].copy()
-            equation = ""
-            processed_a_part = False
-
-            sign_at_beginning = False
-            if (len(ng) > 0) and (ng[0] in self.lang.SIGN):
-                equation += self.lang.SIGN[ng[0]]
-                ng.pop(0)
-                equation_results.append(0)
-                sign_at_beginning = True
-
-            if sign_at_beginning and (
-                (len(ng) == 0)
-                or ((len(ng) > 0) and not ng[0] in German.NUMBER_DICT_GER)
-            ):
-                raise ValueError(
-                    "invalid literal for text2num: {}".format(repr(num_groups))
-                )
-
-            # prozess zero(s) at the beginning
-            null_at_beginning = False
-            while (len(ng) > 0) and (ng[0] in self.lang.ZERO):
-                equation += "0"
-                ng.pop(0)
-                equation_results.append(0)
-                processed_a_part = True
-                null_at_beginning = True
-
+    def _group_value(self, ng: List[str], number_dict: Dict[str, int], parts: List[int]) -> Optional[int]:
+        """Return the value of the number group ``ng``, the words up to and including a
+        multiplier, or None if it is invalid, and append the value of its parts to ``parts``.
+        """
+        STATIC_HUNDRED = "hundert"
+        lang = self.lang
+        # ``ng`` is consumed as its words are processed
+        value: Optional[int] = None
+
+        # process zero(s) at the beginning
+        zeros = 0
+        while zeros < len(ng) and ng[zeros] in lang.ZERO:
+            zeros += 1
+            parts.append(0)
+        if zeros:
+            if zeros < len(ng):
+                return None
+            return 0
+
+        # Process "hundert" groups first
+        if STATIC_HUNDRED in ng:
+            hundred_index = ng.index(STATIC_HUNDRED)
+            if hundred_index == 0:
+                value = 100
+                del ng[0]
+            elif ng[hundred_index - 1] in lang.UNITS or ng[hundred_index - 1] in lang.STENS:
+                if hundred_index - 2 >= 0 and ng[hundred_index - 2] not in lang.MULTIPLIERS:
+                    return None
+                value = number_dict[ng[hundred_index - 1]] * 100
+                del ng[hundred_index - 1:hundred_index + 1]
+            if value is not None:
+                parts.append(value)
+
+        # Process "und" groups
+        summand: Optional[int] = None
+        if lang.AND in ng and len(ng) >= 3:
+            and_index = ng.index(lang.AND)
+
+            # what if "und" comes at the end or beginnig?
+            if and_index + 1 >= len(ng) or and_index == 0:
+                return None
+
+            # get the number before and after the "und"
+            first_summand = ng[and_index - 1]
+            first_summand_num = number_dict.get(first_summand)
+            second_summand_num = number_dict.get(ng[and_index + 1])
+
+            # not all combinations are allowed ("und" is not a number)
             if (
-                null_at_beginning
-                and (len(ng) > 0)
-                and (not ng[0] == self.lang.DECIMAL_SYM)
+                first_summand_num is None
+                or second_summand_num is None
+                or first_summand_num >= 10
+                or second_summand_num < 20
+                or first_summand in lang.NEVER_CONNECTS_WITH_AND  # type: ignore
             ):
-                raise ValueError(
-                    "invalid literal for text2num: {}".format(repr(num_groups))
-                )
-
-            # Process "hundert" groups first
-            if STATIC_HUNDRED in ng:
-
-                hundred_index = ng.index(STATIC_HUNDRED)
-                if hundred_index == 0:
-                    if equation == "":
-                        equation = "100 "
-                    else:
-                        equation += " + 100 "
-                    equation_results.append(100)
-                    ng.pop(hundred_index)
-                    processed_a_part = True
-
-                elif (ng[hundred_index - 1] in self.lang.UNITS) or (
-                    ng[hundred_index - 1] in self.lang.STENS
-                ):
-                    if hundred_index - 2 >= 0 and ng[hundred_index - 2] not in self.lang.MULTIPLIERS:
-                        raise ValueError("invalid {} without multiplier: {}".format(STATIC_HUNDRED, repr(ng)))
-                    multiplier = German.NUMBER_DICT_GER[ng[hundred_index - 1]]
-                    equation += "(" + str(multiplier) + " * 100)"
-                    equation_results.append(multiplier * 100)
-                    ng.pop(hundred_index)
-                    ng.pop(hundred_index - 1)
-                    processed_a_part = True
-
-            # Process "und" groups
-            if self.lang.AND in ng and len(ng) >= 3:
-                and_index = ng.index(self.lang.AND)
-
-                # what if "und" comes at the end or beginnig?
-                if and_index + 1 >= len(ng) or and_index == 0:
-                    raise ValueError(
-                        "invalid 'and' index for text2num: {}".format(repr(ng))
-                    )
-
-                # get the number before and after the "und"
-                first_summand = ng[and_index - 1]
-                second_summand = ng[and_index + 1]
-
-                # string to num for atomic numbers
-                first_summand_num = German.NUMBER_DICT_GER[first_summand]
-                second_summand_num = German.NUMBER_DICT_GER[second_summand]
-
-                # not all combinations are allowed
-                if (
-                    first_summand_num >= 10
-                    or second_summand_num < 20
-                    or first_summand in German.NEVER_CONNECTS_WITH_AND
-                ):
-                    raise ValueError(
-                        "invalid 'and' group for text2num: {}".format(repr(ng))
-                    )
-
-                and_sum_eq = "(" + str(first_summand_num) + " + " + str(second_summand_num) + ")"
-                # Is there already a hundreds value in the equation?
-                if equation == "":
-                    equation += and_sum_eq
-                else:
-                    equation = "(" + equation + " + " + and_sum_eq + ")"
-                equation_results.append(first_summand_num + second_summand_num)
-                ng.pop(and_index + 1)
-                ng.pop(and_index)
-                ng.pop(and_index - 1)
-                processed_a_part = True
-
-            # MTENS (20, 30, 40 .. 90)
-            elif any(x in ng for x in self.lang.MTENS):
-
-                # expect exactly one - TODO: ??! O_o who can read this?
-                mtens_res = [x for x in ng if x in self.lang.MTENS]
-                if not len(mtens_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
-
-                mtens_num = German.NUMBER_DICT_GER[mtens_res[0]]
-                if equation == "":
-                    equation += "(" + str(mtens_num) + ")"
-                else:
-                    equation = "(" + equation + " + (" + str(mtens_num) + "))"
-                mtens_index = ng.index(mtens_res[0])
-                equation_results.append(mtens_num)
-                ng.pop(mtens_index)
-                processed_a_part = True
-
-            # 11, 12, 13, ... 19
-            elif any(x in ng for x in self.lang.STENS):
-
-                # expect exactly one
-                stens_res = [x for x in ng if x in self.lang.STENS]
-                if not len(stens_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
-
-                stens_num = German.NUMBER_DICT_GER[stens_res[0]]
-                if equation == "":
-                    equation += "(" + str(stens_num) + ")"
-                else:
-                    equation = "(" + equation + " + (" + str(stens_num) + "))"
-                stens_index = ng.index(stens_res[0])
-                equation_results.append(stens_num)
-                ng.pop(stens_index)
-                processed_a_part = True
-
-            # 1, 2, ... 9
-            elif any(x in ng for x in self.lang.UNITS):
-
-                # expect exactly one
-                units_res = [x for x in ng if x in self.lang.UNITS]
-                if not len(units_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
-
-                units_num = German.NUMBER_DICT_GER[units_res[0]]
-                if equation == "":
-                    equation += "(" + str(units_num) + ")"
-                else:
-                    equation = "(" + equation + " + (" + str(units_num) + "))"
-                units_index = ng.index(units_res[0])
-                equation_results.append(units_num)
-                ng.pop(units_index)
-                processed_a_part = True
-
-            # Add multipliers
-            if any(x in ng for x in self.lang.MULTIPLIERS):
-                # Multiplier is always the last word
-                if ng[len(ng) - 1] in self.lang.MULTIPLIERS:
-                    multiplier = German.NUMBER_DICT_GER[ng[len(ng) - 1]]
-                    if len(ng) > 1:
-                        # before last has to be UNITS, STENS or MTENS and cannot follow prev. num.
-                        factor = German.NUMBER_DICT_GER[ng[len(ng) - 2]]
-                        if len(equation_results) > 0:
-                            # This prevents things like "zwei zweitausend" (DE) to become 4000
-                            raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-                        if factor and factor >= 1 and factor <= 90:
-                            multiply_eq = "(" + str(factor) + " * " + str(multiplier) + ")"
-                            if equation == "":
-                                equation += multiply_eq
-                            else:
-                                equation += (" * " + multiply_eq)
-                            equation_results.append(factor * multiplier)
-                            ng.pop(len(ng) - 1)
-                            processed_a_part = True
-                        else:
-                            # I think we should fail here instead of ignore?
-                            raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-                    else:
-                        multiply_eq = "(" + str(multiplier) + ")"
-                        if equation == "":
-                            equation += multiply_eq
-                        else:
-                            equation += " * " + multiply_eq
-                        equation_results.append(multiplier)
-                    ng.pop(len(ng) - 1)
-                    processed_a_part = True
-
-            if not processed_a_part:
-                raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-
-            # done, remove number group
-            if len(ng) == 0:
-                num_groups.pop(0)
-                if len(num_groups) > 0:
-                    ng = num_groups[0].copy()
-            else:
-                # at this point there should not be any more number parts
-                raise ValueError(
-                    "invalid literal for text2num - group {} in {}".format(repr(num_groups), text)
-                )
+                return None
 
-            # Any sub-equation that results to 0 and is not the first sub-equation means an error
-            if (
-                len(equation_results) > 1
-                and equation_results[len(equation_results) - 1] == 0
-            ):
-                raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+            summand = first_summand_num + second_summand_num
+            del ng[and_index - 1:and_index + 2]
 
-            main_equation = main_equation + " + (" + equation + ")"
-            # print("equation:", main_equation)  # for debugging
-            # print("equation_results", equation_results)  # for debugging
+        # else, exactly one of MTENS (20, 30, 40 .. 90), 11, 12, 13, ... 19 or 1, 2, ... 9
+        else:
+            for numbers in (lang.MTENS, lang.STENS, lang.UNITS):
+                found = [index for index, w in enumerate(ng) if w in numbers]
+                if found:
+                    if len(found) > 1:
+                        return None
+                    summand = number_dict[ng.pop(found[0])]
+                    break
+
+        if summand is not None:
+            value = summand if value is None else value + summand
+            parts.append(summand)
+
+        # Add multipliers: the multiplier is always the last word
+        if ng and ng[-1] in lang.MULTIPLIERS:
+            multiplier = number_dict[ng.pop()]
+            if ng:
+                # before last has to be UNITS, STENS or MTENS and cannot follow prev. num.
+                factor = number_dict.get(ng[-1])
+                if parts:
+                    # This prevents things like "zwei zweitausend" (DE) to become 4000
+                    return None
+                if not (factor and factor >= 1 and factor <= 90):
+                    # I think we should fail here instead of ignore?
+                    return None
+                value = factor * multiplier
+                parts.append(value)
+                ng.pop()
+            else:
+                value = multiplier if value is None else value * multiplier
+                parts.append(multiplier)
 
-        self.val = eval(main_equation)  # TODO: use 'equation_results' instead
-        return True
+        if value is None:
+            return None
+        if ng:
+            # at this point there should not be any more number parts
+            return None
+        return value
 
 
 class WordToDigitParser:
@@ -553,9 +673,25 @@ class WordToDigitParser:
 
      - ``self.push(word, look_ahead)``
      - ``self.close()``
+     - ``self.reset(preceding_word)``
+     - ``self.snapshot()`` / ``self.restore(state)``
      - ``self.value``: str
     """
 
+    __slots__ = (
+        "lang",
+        "relaxed",
+        "signed",
+        "ordinal_threshold",
+        "_value",
+        "int_builder",
+        "_frac_builder",
+        "in_frac",
+        "closed",
+        "open",
+        "last_word",
+    )
+
     def __init__(
         self,
         lang: Language,
@@ -575,15 +711,71 @@ class WordToDigitParser:
         Ordinals up to `ordinal_threshold` are not converted.
         """
         self.lang = lang
-        self._value: List[str] = []
-        self.int_builder = WordStreamValueParser(lang, relaxed=relaxed)
-        self.frac_builder = WordStreamValueParser(lang, relaxed=relaxed)
+        self.relaxed = relaxed
         self.signed = signed
+        self.ordinal_threshold = ordinal_threshold
+        self._value: List[str] = []
+        self.int_builder: WordStreamValueParser = WordStreamValueAutomaton(lang, relaxed=relaxed)
+        self._frac_builder: Optional[WordStreamValueParser] = None  # built on first decimal
+        self.reset(preceding_word)
+
+    def reset(self, preceding_word: Optional[str] = None) -> None:
+        """Forget the current number to parse a new one.
+
+        The parser is then in the same state as a new instance created
+        with the same options and ``preceding_word``.
+        """
+        self._value = []
+        self.int_builder.reset()
+        if self._frac_builder is not None:
+            self._frac_builder.reset()
         self.in_frac = False
         self.closed = False  # For deferred stop
         self.open = False  # For efficiency
         self.last_word: Optional[str] = preceding_word  # For context
-        self.ordinal_threshold = ordinal_threshold
+
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later.
+
+        The snapshots can be restored in any order, and stay valid after a reset, so that
+        a parser can take up any of the numbers it parsed before (see
+        ``WordStreamValueParser.snapshot``).
+        """
+        frac_state = None if self._frac_builder is None else self._frac_builder.snapshot()
+        return (
+            tuple(self._value),
+            self.int_builder.snapshot(),
+            frac_state,
+            self.in_frac,
+            self.closed,
+            self.open,
+            self.last_word,
+        )
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        (
+            value,
+            int_state,
+            frac_state,
+            self.in_frac,
+            self.closed,
+            self.open,
+            self.last_word,
+        ) = state
+        self._value = list(value)
+        self.int_builder.restore(int_state)
+        if frac_state is not None:
+            self.frac_builder.restore(frac_state)
+        elif self._frac_builder is not None:
+            self._frac_builder.reset()
+
+    @property
+    def frac_builder(self) -> WordStreamValueParser:
+        """The fraction part builder."""
+        if self._frac_builder is None:
+            self._frac_builder = WordStreamValueAutomaton(self.lang, relaxed=self.relaxed)
+        return self._frac_builder
 
     @property
     def value(self) -> str:
@@ -642,29 +834,32 @@ class WordToDigitParser:
         If this function returns False, and the last call returned True, that means you
         reached the end of a number. You can get its value from ``self.value``.
 
-        Then, to parse a new number, you need to instanciate a new engine and start
-        again from the last word you tried (the one that has just been rejected).
+        Then, to parse a new number, you need to reset the engine (or instanciate a new one)
+        and start again from the last word you tried (the one that has just been rejected).
+        To try words that may not continue the number, take a ``self.snapshot()`` before
+        pushing them, and ``self.restore()`` it if they don't.
         """
         if self.closed or self.is_alone(word, look_ahead):
             self.last_word = word
             return False
 
+        token = self.lang.lookup(word) or UNKNOWN_TOKEN
         if (
             self.signed
-            and word in self.lang.SIGN
+            and token.sign
             and look_ahead in self.lang.NUMBERS
             and self.at_start()
         ):
-            self._value.append(self.lang.SIGN[word])
+            self._value.append(token.sign)
         elif (
-            word in self.lang.ZERO
+            token.is_zero
             and self.at_start_of_seq()
             and look_ahead is not None
             and look_ahead in self.lang.DECIMAL_SEP
         ):
             pass
         elif (
-            word in self.lang.ZERO
+            token.is_zero
             and self.at_start_of_seq()
             # and (
             #     look_ahead is None
@@ -689,7 +884,7 @@ class WordToDigitParser:
             )
             self.closed = True
         elif (
-            (word == self.lang.DECIMAL_SEP or word in self.lang.DECIMAL_SEP.split(','))
+            token.is_decimal_sep
             and (look_ahead in self.lang.NUMBERS or look_ahead in self.lang.ZERO)
             and not self.in_frac
         ):
@@ -706,3 +901,234 @@ class WordToDigitParser:
         self.open = True
         self.last_word = word
         return True
+
+
+class WordToDigitParserGerman(WordToDigitParser):
+    """Words to digit transcriber for the German language.
+
+    German numbers do not follow the common order of number processing (see
+    ``WordStreamValueParserGerman``), so the words are gathered in groups that are
+    parsed as they grow: a group ends with the first word that makes it an invalid
+    number, unless this word is "und" and the next one makes it valid again.
+
+    The signs and decimal separators depend on the groups around them, so the
+    groups are held together with them, until a word that is not part of a number.
+    That's why the words must be pushed in their original case: those held but not
+    converted are given back as they were pushed in ``self.value``.
+
+    Public API:
+
+     - ``self.push(word, look_ahead)``
+     - ``self.close()``
+     - ``self.reset(preceding_word)``
+     - ``self.snapshot()`` / ``self.restore(state)``
+     - ``self.value``: str
+    """
+
+    __slots__ = ("group_builder", "group", "group_value", "and_pending", "tokens")
+
+    def __init__(
+        self,
+        lang: Language,
+        relaxed: bool = False,
+        signed: bool = True,
+        ordinal_threshold: int = 3,
+        preceding_word: Optional[str] = None
+    ) -> None:
+        self.group_builder = WordStreamValueParserGerman(lang, relaxed=relaxed)
+        # The words of the current group, the ordinals replaced with cardinals
+        self.group: List[str] = []
+        self.group_value: Optional[int] = None  # while the group is a valid number
+        self.and_pending = False  # True if the group is only valid without its last "und"
+        # The finished groups and other words held: (text, is number, original ordinal)
+        self.tokens: List[Tuple[str, bool, Optional[str]]] = []
+        super().__init__(lang, relaxed, signed, ordinal_threshold, preceding_word)
+
+    def reset(self, preceding_word: Optional[str] = None) -> None:
+        """Forget the current number to parse a new one.
+
+        The parser is then in the same state as a new instance created
+        with the same options and ``preceding_word``.
+        """
+        super().reset(preceding_word)
+        self._clear_group()
+        self.tokens = []
+
+    def snapshot(self) -> ParserState:
+        """Return the current state, to ``restore`` it later.
+
+        See ``WordToDigitParser.snapshot``.
+        """
+        return (
+            super().snapshot(),
+            self.group_builder.snapshot(),
+            tuple(self.group),
+            self.group_value,
+            self.and_pending,
+            tuple(self.tokens),
+        )
+
+    def restore(self, state: ParserState) -> None:
+        """Go back to ``state``, returned by ``self.snapshot()``."""
+        (
+            parent_state,
+            group_state,
+            group,
+            self.group_value,
+            self.and_pending,
+            tokens,
+        ) = state
+        super().restore(parent_state)
+        self.group_builder.restore(group_state)
+        self.group = list(group)
+        self.tokens = list(tokens)
+
+    @property
+    def value(self) -> str:
+        """Return the current value."""
+        out = ""
+        num_of_tokens = len(self.tokens)
+        next_is_decimal_num = False
+        for index, (text, _, ordinal) in enumerate(self.tokens):
+            if next_is_decimal_num:
+                # continue decimals?
+                if self._is_digit(index + 1):
+                    out += text
+                else:
+                    next_is_decimal_num = False
+                    out += text + " "
+            elif (text in self.lang.SIGN) and self.signed:
+                # sign check
+                if index < num_of_tokens - 1 and self.tokens[index + 1][1]:
+                    out += self.lang.SIGN[text]
+            elif ordinal is not None:
+                # cardinal transform
+                out += self.lang.num_ord(text, ordinal) + " "
+            elif (
+                self._is_decimal_sep(text)
+                and index > 0
+                and self.tokens[index - 1][1]
+                and self._is_digit(index + 1)
+            ):
+                # decimal
+                out = out.strip() + self.lang.DECIMAL_SYM
+                next_is_decimal_num = True
+            else:
+                out += text + " "
+        return out.strip()
+
+    def close(self) -> None:
+        """Signal end of input if input stream ends while still in a number.
+
+        It's safe to call it multiple times.
+        """
+        if not self.closed:
+            if self.and_pending:
+                self._add_number()
+                self._add(self.lang.AND, False)
+            elif self.group_value is not None:
+                if len(self.group) == 1 and self.group[0].lower() in self.lang.NEVER_IF_ALONE:
+                    self._add(self.group[0], False)
+                else:
+                    self._add(str(self.group_value), True)
+            self.closed = True
+
+    def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
+        """Push next word from the stream, in its original case.
+
+        Return ``True`` if ``word`` is held with the current value else ``False``,
+        as ``WordToDigitParser.push`` does.
+        """
+        if self.closed:
+            self.last_word = word
+            return False
+
+        held = len(self.tokens)
+        while not self._push_to_group(word, look_ahead is not None):
+            pass
+        self.last_word = word
+        if (
+            self.group
+            or len(self.tokens) == held
+            or self.tokens[-1] != (word, False, None)
+            or (self.signed and word in self.lang.SIGN)
+            or self._is_decimal_sep(word)
+        ):
+            return True
+        # ``word`` is not part of a number, nor a sign or a separator
+        # that could be: the current value ends before it...
+        del self.tokens[-1]
+        if not self.tokens:
+            return False
+        if not self.value:
+            # ... unless it is empty (only signs not followed by a number)
+            self.tokens.append((word, False, None))
+            return True
+        self.close()
+        return False
+
+    def _push_to_group(self, word: str, has_next: bool) -> bool:
+        """Add ``word`` to the current group and finish the group if needed.
+
+        Return False if ``word`` has to be pushed again, to a new group.
+        """
+        ordinal = None
+        cardinal = self.lang.ord2card(word)
+        if cardinal:
+            ordinal = word
+            word = cardinal
+        self.group.append(word)
+        if self.group_builder.push(word):
+            self.group_value = self.group_builder.value
+            self.and_pending = False
+            if ordinal and self.group_value > self.ordinal_threshold:
+                # ordinals end groups
+                self._add_number(ordinal)
+            elif ordinal:
+                # ... but ordinals threshold reverts number back
+                self.group[-1] = ordinal
+                self._add(" ".join(self.group), False)
+        elif self.and_pending:
+            # The "und" does not continue the group: finish the group without it
+            # and push the "und" and ``word`` again
+            self._add_number()
+            self._push_to_group(self.lang.AND, True)
+            return False
+        elif self.group_value is not None:
+            if word == self.lang.AND and has_next:
+                # number might continue after AND
+                self.and_pending = True
+            else:
+                # finish the group, ``word`` may start the next one ("eins eins")
+                self._add_number()
+                return False
+        elif ordinal is not None:
+            # revert ordinal
+            self._add(ordinal, False)
+        else:
+            self._add(word, False)
+        return True
+
+    def _add_number(self, ordinal: Optional[str] = None) -> None:
+        """Finish the current group, the last word excluded, as a number."""
+        if len(self.group) == 2 and self.group[0].lower() in self.lang.NEVER_IF_ALONE:
+            self._add(self.group[0], False)
+        else:
+            self._add(str(self.group_value), True, ordinal)
+
+    def _add(self, text: str, is_num: bool, ordinal: Optional[str] = None) -> None:
+        self.tokens.append((text, is_num, ordinal))
+        self._clear_group()
+
+    def _clear_group(self) -> None:
+        self.group = []
+        self.group_value = None
+        self.and_pending = False
+        self.group_builder.reset()
+
+    def _is_digit(self, index: int) -> bool:
+        """Return True if the token at ``index`` is a number below 10."""
+        return index < len(self.tokens) and self.tokens[index][1] and int(self.tokens[index][0]) < 10
+
+    def _is_decimal_sep(self, text: str) -> bool:
+        return text.lower() in self.lang.DECIMAL_SEP
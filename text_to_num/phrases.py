@@ -0,0 +1,195 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tables of the spelled numbers of a language, from zero to a limit, that ``text2num``
+and ``alpha2digit`` look up before parsing.
+
+A table is built explicitly, once, and given to the conversions that use it::
+
+    >>> from text_to_num import text2num
+    >>> from text_to_num.phrases import build_phrase_table
+    >>> table = build_phrase_table("fr", 9999)  # takes a few seconds
+    >>> text2num("deux mille vingt-et-un", "fr", phrases=table)
+    2021
+    >>> table.info()
+    PhraseTableInfo(limit=9999, phrases=..., segments=..., size=...)
+
+The phrases are spelled from the number words of the language, following the
+``PHRASE_*`` attributes of its class, and only those that the parsers read as the
+expected value are kept: a lookup always gives what parsing would.
+"""
+
+import sys
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional
+
+from .lang import LANG, Language
+from .transforms import (
+    _alpha2digit_segment,
+    _digit_parser,
+    _parse_text2num,
+    _post_processor,
+    _value_parser,
+)
+
+
+class PhraseTableInfo(NamedTuple):
+    """The size of a phrase table."""
+
+    limit: int
+    phrases: int  # read by text2num
+    segments: int  # converted by alpha2digit
+    size: int  # approximate memory use, in bytes
+
+
+def build_phrase_table(lang: str, limit: int) -> "PhraseTable":
+    """Build the table of the spelled numbers of ``lang`` from zero to ``limit``.
+
+    Every number is spelled and parsed with all the options, so the build is slow:
+    from about 0.4 to 4.5 seconds per language for a ``limit`` of 9999. Build the
+    table once and share it: it is read-only.
+    """
+    if lang not in LANG:
+        raise Exception("Language not supported")
+    return PhraseTable(LANG[lang], limit)
+
+
+class PhraseTable:
+    """The spelled numbers of ``language`` from zero to ``limit`` (see
+    ``build_phrase_table``).
+
+    ``values`` maps the phrases to their values, for ``text2num``. ``digits`` maps the
+    phrases that ``alpha2digit`` converts, with any option, when they make a whole
+    segment, to their conversion.
+    """
+
+    __slots__ = ("language", "limit", "values", "digits")
+
+    def __init__(self, language: Language, limit: int) -> None:
+        if limit < 0:
+            raise ValueError("limit must not be negative")
+        self.language = language
+        self.limit = limit
+        self.values: Dict[str, int] = {}
+        self.digits: Dict[str, str] = {}
+        _Speller(language, self).spell_all()
+
+    def info(self) -> PhraseTableInfo:
+        """Return the number of phrases of the table and its memory use."""
+        size = sys.getsizeof(self.values) + sys.getsizeof(self.digits)
+        seen = set()
+        for obj in chain(self.values, self.values.values(), self.digits.values()):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                size += sys.getsizeof(obj)
+        return PhraseTableInfo(self.limit, len(self.values), len(self.digits), size)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _Speller:
+    """Spell the numbers of a language in increasing order, the greater ones from the
+    spellings of their parts, and fill a phrase table with those the parsers accept.
+    """
+
+    def __init__(self, language: Language, table: PhraseTable) -> None:
+        self.language = language
+        self.table = table
+        self.words: Dict[int, List[str]] = {0: sorted(language.ZERO, key=len, reverse=True)}
+        for word, value in language.NUMBERS.items():
+            self.words.setdefault(value, []).append(word)
+        # the hundred and the powers of a thousand, greatest first
+        self.multipliers = [m for m in (1000 ** 4, 1000 ** 3, 1000 ** 2, 1000, 100) if m in self.words]
+        # the accepted spellings of each number, the preferred one first
+        self.spellings: Dict[int, List[str]] = {}
+        self.value_parsers = [_value_parser(language, relaxed) for relaxed in (False, True)]
+        self.digit_parsers = [
+            _digit_parser(language, relaxed, True, threshold)
+            for relaxed, threshold in ((False, 3), (True, 3), (False, 0))
+        ]
+        merger = _post_processor(language, True)
+        self.mergers = [None] if merger is None else [None, merger]
+
+    def spell_all(self) -> None:
+        for value in range(self.table.limit + 1):
+            candidates = dict.fromkeys(self.candidates(value))
+            spellings = [phrase for phrase in candidates if self.accept(phrase, value)]
+            if spellings:
+                self.spellings[value] = spellings
+
+    def preferred(self, value: int) -> Optional[str]:
+        spellings = self.spellings.get(value)
+        return spellings[0] if spellings else None
+
+    def candidates(self, value: int) -> List[str]:
+        language = self.language
+        phrases = [language.PHRASE_WORDS[value]] if value in language.PHRASE_WORDS else []
+        phrases.extend(self.words.get(value, ()))
+        multiplier = next((m for m in self.multipliers if m <= value), None)
+        if multiplier is None:
+            tens, units = divmod(value, 10)
+            tens_word = self.preferred(tens * 10)
+            if value > 20 and units and tens_word:
+                phrases.extend(
+                    language.PHRASE_TENS.format(tens=tens_word, units=units_word)
+                    for units_word in self.words.get(units, ())
+                )
+            return phrases
+        coef, rest = divmod(value, multiplier)
+        if rest:
+            head = self.preferred(value - rest)
+            if head is None:
+                return phrases
+            if multiplier == 100:
+                joiners = language.PHRASE_AFTER_HUNDREDS
+            else:
+                joiners = language.PHRASE_AFTER_THOUSANDS
+            phrases.extend(
+                head + joiner + tail for joiner in joiners for tail in self.spellings.get(rest, ())
+            )
+        else:
+            if coef == 1:
+                phrases.extend(self.words[multiplier])
+            coef_phrase = self.preferred(coef)
+            if coef_phrase is not None:
+                phrases.extend(coef_phrase + language.PHRASE_COEF + word for word in self.words[multiplier])
+        return phrases
+
+    def accept(self, phrase: str, value: int) -> bool:
+        """Add ``phrase`` to the table if the parsers read it as ``value``."""
+        language = self.language
+        for parser in self.value_parsers:
+            if parser is not None:
+                parser.reset()
+            if _parse_text2num(phrase, language, parser) != value:
+                return False
+        self.table.values[phrase] = value
+        digits = str(value)
+        if all(
+            _alpha2digit_segment(phrase, parser, merger) == digits
+            for parser in self.digit_parsers
+            for merger in self.mergers
+        ):
+            self.table.digits[phrase] = digits
+        return True
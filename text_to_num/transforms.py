@@ -21,23 +21,32 @@
 # SOFTWARE.
 
 import re
+from functools import lru_cache
 from itertools import dropwhile
-from typing import Any, Iterator, List, Sequence, Tuple, Union, Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Pattern, Sequence, TextIO, Tuple, Union,
+    Optional,
+)
 
-from .lang import LANG, Language, German, Portuguese, Italian
-from .lang.italian import iWtoN
+from .cache import CallStats, LRUCache
+from .lang import LANG, Language
+from .lang.base import split_segments
 from .parsers import (
     WordStreamValueParserInterface,
-    WordStreamValueParser,  # we should rename this to 'WordStreamValueParserCommon'
+    WordStreamValueAutomaton,
     WordStreamValueParserGerman,
     WordToDigitParser,
+    WordToDigitParserGerman,
 )
 
-from text_to_num.lang.portuguese import OrdinalsMerger
+if TYPE_CHECKING:
+    from .lang.portuguese import OrdinalsMerger
+    from .phrases import PhraseTable
 
-omg = OrdinalsMerger()
 USE_PT_ORDINALS_MERGER = True
 WORD_SEP = re.compile(r"\s*[\.,;\(\)…\[\]:!\?]+\s*|\n")
+OTHER_SPACE = re.compile(r"[^\S \n]")
+NON_SPACE = re.compile(r"\S")
 
 
 def look_ahead(sequence: Sequence[Any]) -> Iterator[Tuple[Any, Any]]:
@@ -58,50 +67,301 @@ def look_ahead(sequence: Sequence[Any]) -> Iterator[Tuple[Any, Any]]:
         yield val, ahead
 
 
-def text2num(text: str, lang: Union[str, Language], relaxed: bool = False) -> int:
+def text2num(
+    text: str,
+    lang: Union[str, Language],
+    relaxed: bool = False,
+    cache: Optional[LRUCache] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> int:
     """Convert the ``text`` string containing an integer number written as letters
     into an integer value.
 
     Set ``relaxed`` to True if you want to accept "quatre vingt(s)" as "quatre-vingt"
     (fr) or "ein und zwanzig" as "einundzwanzig" (de) etc..
 
+    Give a ``cache`` (see ``text_to_num.cache.LRUCache``) to remember the results, errors
+    included, of the texts already converted, and a table of the ``lang`` numbers as
+    ``phrases`` (see ``text_to_num.phrases.build_phrase_table``) to look them up first.
+
     Raises an ValueError if ``text`` does not describe a valid number.
     Return an int.
     """
+    value = try_text2num(text, lang, relaxed, cache, phrases)
+    if value is None:
+        raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+    return value
+
+
+def try_text2num(
+    text: str,
+    lang: Union[str, Language],
+    relaxed: bool = False,
+    cache: Optional[LRUCache] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> Optional[int]:
+    """Convert ``text`` like ``text2num``, but return None if ``text`` does not describe
+    a valid number.
+
+    No exception is raised (nor caught, except by the Italian engine) on the way,
+    which makes it the fastest choice when many texts are not numbers.
+    """
     language: Language
     # mypy seems unable to understand this
     language = LANG[lang] if type(lang) is str else lang  # type: ignore
-    num_parser: WordStreamValueParserInterface
+    _check_phrases(phrases, language)
+    if cache is not None:
+        return _cached_text2num(text, language, relaxed, cache, phrases=phrases)
+    return _text2num(text, language, _value_parser(language, relaxed), phrases)
 
-    # German
-    if type(language) is German:
+
+def text2num_many(
+    texts: Iterable[str],
+    lang: Union[str, Language],
+    relaxed: bool = False,
+    errors: str = "raise",
+    cache: Optional[LRUCache] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> List[Optional[int]]:
+    """Convert each string of ``texts`` like ``text2num`` and return the values in order.
+
+    The language and the parser are set up once for the whole batch.
+
+    If ``errors`` is "raise", the first text that does not describe a valid number
+    raises a ValueError; if it is "none", its value is None.
+    """
+    if errors not in ("raise", "none"):
+        raise ValueError("errors must be 'raise' or 'none', not {}".format(repr(errors)))
+    language: Language
+    language = LANG[lang] if type(lang) is str else lang  # type: ignore
+    _check_phrases(phrases, language)
+    num_parser = _value_parser(language, relaxed)
+    values: List[Optional[int]] = []
+    for text in texts:
+        if cache is not None:
+            value = _cached_text2num(text, language, relaxed, cache, num_parser, phrases)
+        else:
+            if num_parser is not None:
+                num_parser.reset()
+            value = _text2num(text, language, num_parser, phrases)
+        if value is None and errors == "raise":
+            raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+        values.append(value)
+    return values
+
+
+# Cached for the texts that are not numbers
+_INVALID = object()
+
+
+def _cached_text2num(
+    text: str,
+    language: Language,
+    relaxed: bool,
+    cache: LRUCache,
+    num_parser: Optional[WordStreamValueParserInterface] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> Optional[int]:
+    """Return the value of ``text`` from ``cache``, or parse it with ``num_parser``, reset
+    first, or a new parser.
+    """
+    # The default parser only sees the words of the text
+    if language.ISO_CODE != "de" and language.ISO_CODE != "it":
+        key = " ".join(text.split())
+    else:
+        key = text
+    value = cache.get((key, language, relaxed))
+    if value is None:
+        if num_parser is None:
+            num_parser = _value_parser(language, relaxed)
+        else:
+            num_parser.reset()
+        value = _text2num(text, language, num_parser, phrases)
+        cache.put((key, language, relaxed), _INVALID if value is None else value)
+    return None if value is _INVALID else value
+
+
+def _value_parser(language: Language, relaxed: bool) -> Optional[WordStreamValueParserInterface]:
+    """Return a new value parser for ``language``, or None for Italian, whose numbers
+    are read by ``iWtoN`` (see ``_italian_engine``).
+    """
+    if language.ISO_CODE == "de":
         # The German number writing rules do not apply to the common order of number processing
-        num_parser = WordStreamValueParserGerman(
-            language, relaxed=relaxed
+        return WordStreamValueParserGerman(language, relaxed=relaxed)
+    if language.ISO_CODE == "it":
+        return None
+    return WordStreamValueAutomaton(language, relaxed=relaxed)
+
+
+@lru_cache(maxsize=None)
+def _italian_engine() -> Callable[[str], int]:
+    """Return the function that reads the Italian numbers, imported on first use."""
+    from .lang.italian import iWtoN
+
+    return iWtoN.convert
+
+
+def _digit_parser(
+    language: Language, relaxed: bool, signed: bool, ordinal_threshold: int
+) -> WordToDigitParser:
+    if language.ISO_CODE == "de":
+        return WordToDigitParserGerman(
+            language, relaxed=relaxed, signed=signed, ordinal_threshold=ordinal_threshold
         )
-        num_parser.parse(text)
-        return num_parser.value
-    if type(language) is Italian: 
-        # joined_text = "".join(text)
-        # print(joined_text)
-        return iWtoN.convert(text)
+    return WordToDigitParser(language, relaxed=relaxed, signed=signed, ordinal_threshold=ordinal_threshold)
+
+
+def _text2num(
+    text: str,
+    language: Language,
+    num_parser: Optional[WordStreamValueParserInterface],
+    phrases: Optional["PhraseTable"] = None,
+) -> Optional[int]:
+    """Return the value of ``text``, looked up in ``phrases`` if any, or None if it is not
+    a valid number.
+
+    ``num_parser``, from ``_value_parser``, must be new or reset.
+    """
+    if phrases is not None:
+        value = phrases.values.get(text)
+        if value is not None:
+            return value
+    return _parse_text2num(text, language, num_parser)
+
+
+def _check_phrases(phrases: Optional["PhraseTable"], language: Language) -> None:
+    """Raise a ValueError if ``phrases`` is not a table of ``language``."""
+    if phrases is not None and phrases.language.ISO_CODE != language.ISO_CODE:
+        raise ValueError(
+            "phrase table of {} used for {}".format(phrases.language.ISO_CODE, language.ISO_CODE)
+        )
+
+
+def _parse_text2num(
+    text: str, language: Language, num_parser: Optional[WordStreamValueParserInterface]
+) -> Optional[int]:
+    """Parse ``text`` with ``num_parser``, new or reset, and return its value, or None."""
+    if num_parser is None:
+        # Italian: iWtoN only reports errors by raising
+        try:
+            return _italian_engine()(text)
+        except (ValueError, KeyError):
+            return None
+
+    # German
+    if language.ISO_CODE == "de":
+        return num_parser.value if num_parser.parse(text) else None
 
     # Default
-    else:   
-        num_parser = WordStreamValueParser(language, relaxed=relaxed)
+    else:
         tokens = list(dropwhile(lambda x: x in language.ZERO, text.split()))
-        if not all(num_parser.push(word, ahead) for word, ahead in look_ahead(tokens)):
-            raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+        last = len(tokens) - 1
+        for i, word in enumerate(tokens):
+            if not num_parser.push(word, tokens[i + 1] if i < last else None):
+                return None
 
     return num_parser.value
 
 
+def alpha2digit_tokens(
+    tokens: Sequence[str],
+    lang: str,
+    relaxed: bool = False,
+    signed: bool = True,
+    ordinal_threshold: int = 3,
+    lowercased: bool = False,
+    breaks: Iterable[int] = (),
+) -> Tuple[List[str], List[range]]:
+    """Convert the spelled numbers of a sequence of words, like ``alpha2digit``.
+
+    ``tokens`` are words, without spaces nor punctuation, as a speech recognizer outputs
+    them. Set ``lowercased`` if they are already in lower case. ``breaks`` are the indices
+    of the tokens that start a new phrase (after a pause for example), as a punctuation
+    mark would.
+
+    Return the output tokens and, for each of them, the range of the indices of the input
+    tokens it replaces.
+    The German parser does not report where its numbers are, so German is not supported.
+    The Portuguese compound ordinals are not merged.
+    """
+    if lang not in LANG:
+        raise Exception("Language not supported")
+
+    language = LANG[lang]
+    if language.ISO_CODE == "de":
+        raise Exception("Language not supported")
+    num_builder = WordToDigitParser(
+        language,
+        relaxed=relaxed,
+        signed=signed,
+        ordinal_threshold=ordinal_threshold,
+    )
+    words = tokens if lowercased else [token.lower() for token in tokens]
+    out_tokens: List[str] = []
+    sources: List[range] = []
+    bounds = sorted({0, len(tokens), *(i for i in breaks if 0 < i < len(tokens))})
+    for start, end in zip(bounds, bounds[1:]):
+        position = start
+        for first, last, _ in _number_spans(words[start:end], num_builder):
+            for i in range(position, start + first):
+                out_tokens.append(tokens[i])
+                sources.append(range(i, i + 1))
+            out_tokens.append(num_builder.value)
+            sources.append(range(start + first, start + last))
+            position = start + last
+        for i in range(position, end):
+            out_tokens.append(tokens[i])
+            sources.append(range(i, i + 1))
+    return out_tokens, sources
+
+
+def _number_spans(words: Sequence[str], num_builder: WordToDigitParser) -> Iterator[Tuple[int, int, bool]]:
+    """Yield the ``(start, end, is_ordinal)`` index ranges of the numbers of the phrase ``words``
+    (in lower case), in order.
+
+    While a range is yielded, ``num_builder`` holds the corresponding number.
+    """
+    num_builder.reset()
+    last_word = None
+    start: Optional[int] = None  # None while not in a number
+    end = 0
+    ordinal = False
+    for i, (word, ahead) in enumerate(look_ahead(words)):
+        if num_builder.push(word, ahead):
+            if start is None:
+                start = i
+            end = i + 1
+            ordinal = num_builder.closed  # only ordinals close the number
+        elif start is not None:
+            yield start, end, ordinal
+            num_builder.reset(preceding_word=last_word)
+            start = None
+            if num_builder.push(word, ahead):
+                start, end, ordinal = i, i + 1, num_builder.closed
+        last_word = word
+    # End of phrase
+    num_builder.close()
+    if start is not None:
+        yield start, end, ordinal
+
+
+def _normalized_spaces(text: str) -> bool:
+    """Return True if ``alpha2digit`` would leave the spaces of ``text`` unchanged."""
+    if "  " in text or text.startswith(" ") or text.endswith(" "):
+        return False
+    # no newline nor other space character is printable
+    return text.isprintable() or not (" \n" in text or "\n " in text or OTHER_SPACE.search(text))
+
+
 def alpha2digit(
     text: str,
     lang: str,
     relaxed: bool = False,
     signed: bool = True,
     ordinal_threshold: int = 3,
+    cache: Optional[LRUCache] = None,
+    stats: Optional[CallStats] = None,
+    phrases: Optional["PhraseTable"] = None,
 ) -> str:
     """Return the text of ``text`` with all the ``lang`` spelled numbers converted to digits.
     Takes care of punctuation.
@@ -110,235 +370,247 @@ def alpha2digit(
     if you prefer to get « minus 2 » instead of « -2 ».
 
     Ordinals up to `ordinal_threshold` are not converted.
+
+    Pass an ``LRUCache`` as ``cache`` to reuse the conversions of the text segments (see
+    ``WORD_SEP``) already seen with the same options; ``stats``, a ``CallStats``, then
+    counts the segments found in the cache (hits) and converted (misses).
+
+    ``phrases``, a table of the ``lang`` numbers (see ``text_to_num.phrases.build_phrase_table``),
+    gives the conversions of the segments that are spelled numbers.
     """
     if lang not in LANG:
         raise Exception("Language not supported")
 
     language = LANG[lang]
-    segments = WORD_SEP.split(text)
-    punct = WORD_SEP.findall(text)
-    if len(punct) < len(segments):
-        punct.append("")
+    _check_phrases(phrases, language)
+    num_builder = _digit_parser(language, relaxed, signed, ordinal_threshold)
+    merger = _post_processor(language, USE_PT_ORDINALS_MERGER)
+    return _alpha2digit(text, language, num_builder, cache, stats, merger, phrases)
 
-    # Process segments
-    if type(language) is German:
-        # TODO: we should try to build a proper 'WordToDigitParser' for German
-        # and refactor the code to be more similar to the default logic below
-        text = _alpha2digit_agg(
-            language,
-            segments,
-            punct,
-            relaxed=relaxed,
-            signed=signed,
-            ordinal_threshold=ordinal_threshold
-        )
+
+def alpha2digit_many(
+    texts: Iterable[str],
+    lang: str,
+    relaxed: bool = False,
+    signed: bool = True,
+    ordinal_threshold: int = 3,
+    cache: Optional[LRUCache] = None,
+    stats: Optional[CallStats] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> List[str]:
+    """Convert each string of ``texts`` like ``alpha2digit`` and return the results in order.
+
+    The language and the parser are set up once for the whole batch, and the segment
+    ``cache``, ``stats`` and ``phrases``, if any, are shared by all its texts.
+    """
+    if lang not in LANG:
+        raise Exception("Language not supported")
+
+    language = LANG[lang]
+    _check_phrases(phrases, language)
+    num_builder = _digit_parser(language, relaxed, signed, ordinal_threshold)
+    merger = _post_processor(language, USE_PT_ORDINALS_MERGER)
+    return [_alpha2digit(text, language, num_builder, cache, stats, merger, phrases) for text in texts]
+
+
+def alpha2digit_stream(
+    source: Union[TextIO, Iterable[str]],
+    lang: str,
+    relaxed: bool = False,
+    signed: bool = True,
+    ordinal_threshold: int = 3,
+    chunk_size: int = 65536,
+    cache: Optional[LRUCache] = None,
+    stats: Optional[CallStats] = None,
+    phrases: Optional["PhraseTable"] = None,
+) -> Iterator[str]:
+    """Convert the text read from ``source`` like ``alpha2digit`` and yield the result
+    piece by piece.
+
+    ``source`` is a text stream, read by ``chunk_size`` characters, or any iterable of
+    strings (lines, chunks...). The text is only cut after a separator (see ``WORD_SEP``)
+    that more text cannot extend, so numbers are never split and only the last
+    unterminated segment is kept in memory. ``cache``, ``stats`` and ``phrases`` work as
+    in ``alpha2digit``.
+    """
+    if lang not in LANG:
+        raise Exception("Language not supported")
+
+    language = LANG[lang]
+    _check_phrases(phrases, language)
+    num_builder = _digit_parser(language, relaxed, signed, ordinal_threshold)
+    merger = _post_processor(language, USE_PT_ORDINALS_MERGER)
+    yield from _alpha2digit_stream(
+        source, language, num_builder, chunk_size, cache, stats, merger, phrases
+    )
+
+
+def _alpha2digit_stream(
+    source: Union[TextIO, Iterable[str]],
+    language: Language,
+    num_builder: WordToDigitParser,
+    chunk_size: int,
+    cache: Optional[LRUCache],
+    stats: Optional[CallStats],
+    merger: Optional["OrdinalsMerger"],
+    phrases: Optional["PhraseTable"] = None,
+) -> Iterator[str]:
+    chunks: Iterable[str]
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), "")  # type: ignore
     else:
-        # Default
-        out_segments: List[str] = []
-        for segment, sep in zip(segments, punct):
-            tokens = segment.split()
-            num_builder = WordToDigitParser(
-                language,
-                relaxed=relaxed,
-                signed=signed,
-                ordinal_threshold=ordinal_threshold,
-            )
-            last_word = None
-            in_number = False
-            out_tokens: List[str] = []
-            for word, ahead in look_ahead(tokens):
-                if num_builder.push(word.lower(), ahead and ahead.lower()):
-                    in_number = True
-                elif in_number:
-                    out_tokens.append(num_builder.value)
-                    num_builder = WordToDigitParser(
-                        language,
-                        relaxed=relaxed,
-                        signed=signed,
-                        ordinal_threshold=ordinal_threshold,
-                        preceding_word=last_word
-                    )
-                    in_number = num_builder.push(word.lower(), ahead and ahead.lower())
-                if not in_number:
-                    out_tokens.append(word)
-                last_word = word.lower()
-            # End of segment
-            num_builder.close()
-            if num_builder.value:
-                out_tokens.append(num_builder.value)
-            out_segments.append(" ".join(out_tokens))
-            out_segments.append(sep)
-        text = "".join(out_segments)
+        chunks = source
+    buffer = ""
+    scan = 0  # no match can start before
+    for chunk in chunks:
+        buffer += chunk
+        cut, scan = _last_cut(WORD_SEP, buffer, scan)
+        if cut:
+            yield _alpha2digit(buffer[:cut], language, num_builder, cache, stats, merger, phrases)
+            buffer = buffer[cut:]
+            scan -= cut
+    if buffer:
+        yield _alpha2digit(buffer, language, num_builder, cache, stats, merger, phrases)
+
+
+def _post_processor(language: Language, pt_ordinal_merge: bool) -> Optional["OrdinalsMerger"]:
+    """Return the post-processor of the ``language`` segment conversions, if any.
+
+    Set ``pt_ordinal_merge`` to False to leave the Portuguese compound ordinals apart.
+    """
+    if language.ISO_CODE == "pt" and pt_ordinal_merge:
+        return _ordinals_merger()
+    return None
+
 
-    # Post-processing
-    if type(language) is Portuguese and USE_PT_ORDINALS_MERGER:
-        text = omg.merge_compound_ordinals_pt(text)
+@lru_cache(maxsize=None)
+def _ordinals_merger() -> "OrdinalsMerger":
+    """Return the post-processor of the Portuguese conversions."""
+    from .lang.portuguese import OrdinalsMerger
 
-    return text
+    return OrdinalsMerger()
 
 
-def _alpha2digit_agg(
+def _last_cut(separator: Pattern[str], text: str, scan: int) -> Tuple[int, int]:
+    """Return the end of the last match of ``separator`` in ``text``, from ``scan``,
+    that more text could not change (or 0), and the position from which the next
+    matches are to be looked for.
+    """
+    cut = 0
+    for match in separator.finditer(text, scan):
+        # Greedy matches end on a non space character; but the new line alternative of
+        # WORD_SEP may be followed by spaces that could still be part of a longer match.
+        if match.end() == len(text) or not NON_SPACE.search(text, match.end()):
+            return cut, match.start()
+        cut = match.end()
+    return cut, len(text.rstrip())
+
+
+def _alpha2digit(
+    text: str,
     language: Language,
-    segments: List[str],
-    punct: List[Any],
-    relaxed: bool,
-    signed: bool,
-    ordinal_threshold: int = 3
+    num_builder: WordToDigitParser,
+    cache: Optional[LRUCache] = None,
+    stats: Optional[CallStats] = None,
+    merger: Optional["OrdinalsMerger"] = None,
+    phrases: Optional["PhraseTable"] = None,
 ) -> str:
-    """Variant for "agglutinative" languages and languages with different style
-    of processing numbers, for example:
+    """Convert ``text`` with ``num_builder``, which also holds the conversion options,
+    reusing the segments converted in ``cache`` if any, looking the number phrases up
+    in ``phrases`` if any, and post-process each segment with ``merger`` if any.
+    """
+    if _normalized_spaces(text) and not language.may_contain_number(text):
+        # nothing to convert, nothing to normalize
+        return text
 
-    Default parser: "twenty one" (en) = 20, 1, "vingt et un" (fr) = 20, 1
-    German parser: "einundzwanzig" or "ein und zwanzig" (de) = 1, 20
+    # Process segments
+    digits = phrases.digits if phrases is not None else None
+    out_segments: List[str] = []
+    if cache is not None:
+        for segment, sep in split_segments(WORD_SEP, text):
+            out_segments.append(
+                _cached_segment(segment, language, num_builder, cache, stats, merger, digits)
+            )
+            out_segments.append(sep)
+    else:
+        for segment, sep in split_segments(WORD_SEP, text):
+            out_segments.append(_alpha2digit_segment(segment, num_builder, merger, digits))
+            out_segments.append(sep)
+    return "".join(out_segments)
+
+
+def _cached_segment(
+    segment: str,
+    language: Language,
+    num_builder: WordToDigitParser,
+    cache: LRUCache,
+    stats: Optional[CallStats],
+    merger: Optional["OrdinalsMerger"] = None,
+    digits: Optional[Dict[str, str]] = None,
+) -> str:
+    """Convert ``segment`` or return its conversion from ``cache``.
 
-    Only German for now.
+    Each segment is converted on its own, from a reset parser (no preceding word), so
+    its conversion only depends on its text, the language and the options.
     """
-    out_segments: List[str] = []
+    key = (
+        segment,
+        language,
+        num_builder.relaxed,
+        num_builder.signed,
+        num_builder.ordinal_threshold,
+        merger is not None,
+    )
+    converted = cache.get(key)
+    if stats is not None:
+        stats.count(converted is not None)
+    if converted is None:
+        converted = _alpha2digit_segment(segment, num_builder, merger, digits)
+        cache.put(key, converted)
+    return converted
+
+
+def _alpha2digit_segment(
+    segment: str,
+    num_builder: WordToDigitParser,
+    merger: Optional["OrdinalsMerger"] = None,
+    digits: Optional[Dict[str, str]] = None,
+) -> str:
+    """Convert the numbers of ``segment``, a text without separators (see ``WORD_SEP``),
+    and join its compound ordinals with ``merger`` if any.
 
-    def revert_if_alone(sentence_effective_len: int, current_sentence: List[str]) -> bool:
-        """Test if word is 'alone' and should not be shown as number."""
-        # TODO: move this to Language?
-        if sentence_effective_len == 1 and current_sentence[0].lower() in language.NEVER_IF_ALONE:
-            return True
-        else:
-            return False
-
-    for segment, sep in zip(segments, punct):
-        tokens = segment.split()
-        # TODO: Should we use 'split_number_word' once on each token here if relaxed=True?
-        sentence: List[str] = []
-        out_tokens: List[str] = []
-        out_tokens_is_num: List[bool] = []
-        out_tokens_ordinal_org: List[Optional[str]] = []
-        combined_num_result = None
-        current_token_ordinal_org = None
-        reset_to_last_if_failed = False
-        token_index = 0
-
-        while token_index < len(tokens):
-            t = tokens[token_index]
-            token_to_add = None
-            token_to_add_is_num = False
-            tmp_token_ordinal_org = None
-            cardinal_for_ordinal = language.ord2card(t)
-            if cardinal_for_ordinal:
-                tmp_token_ordinal_org = t
-                t = cardinal_for_ordinal
-            sentence.append(t)
-            try:
-                # TODO: this is very inefficient because we analyze the same text
-                # again and again until it fails including 'split_number_word' and all the
-                # heavy lifting ... but it works and is hard to optimize ¯\_(ツ)_/¯
-                num_result = text2num(" ".join(sentence), language, relaxed=relaxed)
-                # TODO: here we need to use 'relaxed' to check how to continue
-                combined_num_result = num_result
-                current_token_ordinal_org = tmp_token_ordinal_org
-                token_index += 1
-                reset_to_last_if_failed = False
-                # ordinals end groups
-                if current_token_ordinal_org and num_result > ordinal_threshold:
-                    token_to_add = str(combined_num_result)
-                    token_to_add_is_num = True
-                # ... but ordinals threshold reverts number back
-                elif current_token_ordinal_org:
-                    current_token_ordinal_org = None
-                    sentence[len(sentence)-1] = str(tmp_token_ordinal_org)
-                    token_to_add = " ".join(sentence)
-                    token_to_add_is_num = False
-            except ValueError:
-                # This will happen if look-ahead was required (e.g. because of AND) but failed:
-                if reset_to_last_if_failed:
-                    reset_to_last_if_failed = False
-                    # repeat last try but ...
-                    token_index -= 1
-                    # ... finish old group first and clean up
-                    token_to_add = str(combined_num_result)
-                    token_to_add_is_num = True
-                # Happens if a) ends with no num b) ends with AND c) ends with invalid next num:
-                elif combined_num_result is not None:
-                    if t == language.AND and (token_index + 1) < len(tokens):
-                        # number might continue after AND
-                        # test the next and then decide to keep it or reset group
-                        reset_to_last_if_failed = True
-                        token_index += 1
-                    else:
-                        # last token has to be tested again in case there is sth like "eins eins"
-                        # finish LAST group but keep token_index
-                        token_to_add = str(combined_num_result)
-                        token_to_add_is_num = True
-                elif tmp_token_ordinal_org is not None:
-                    # revert ordinal
-                    sentence[len(sentence) - 1] = str(tmp_token_ordinal_org)
-                    token_index += 1
-                    token_to_add = " ".join(sentence)
-                    token_to_add_is_num = False
-                    current_token_ordinal_org = None
-                else:
-                    # previous text was not a valid number
-                    # prep. for next group
-                    token_index += 1
-                    token_to_add = t
-                    token_to_add_is_num = False
-            # new grouped tokens? then add and prep. next
-            if token_to_add:
-                if token_to_add_is_num and revert_if_alone(len(sentence)-1, sentence):
-                    token_to_add = str(sentence[0])
-                    token_to_add_is_num = False
-                    current_token_ordinal_org = None
-                out_tokens.append(token_to_add)
-                out_tokens_is_num.append(token_to_add_is_num)
-                out_tokens_ordinal_org.append(current_token_ordinal_org)
-                sentence.clear()
-                combined_num_result = None
-                current_token_ordinal_org = None
-
-        # any remaining tokens to add?
-        if combined_num_result is not None:
-            if revert_if_alone(len(sentence), sentence):
-                out_tokens.append(str(sentence[0]))
-                out_tokens_is_num.append(False)
-            else:
-                out_tokens.append(str(combined_num_result))
-                out_tokens_is_num.append(True)
-            out_tokens_ordinal_org.append(None)  # we can't reach this if it was ordinal
-
-        # join all and keep track on signs
-        out_segment = ""
-        num_of_tokens = len(out_tokens)
-        next_is_decimal_num = False
-        for index, ot in enumerate(out_tokens):
-            if next_is_decimal_num:
-                # continue decimals?
-                if (
-                    index < num_of_tokens - 1
-                    and out_tokens_is_num[index + 1]
-                    and int(out_tokens[index + 1]) < 10
-                ):
-                    out_segment += ot
-                else:
-                    next_is_decimal_num = False
-                    out_segment += ot + " "
-            elif (ot in language.SIGN) and signed:
-                # sign check
-                if index < num_of_tokens - 1:
-                    if out_tokens_is_num[index + 1] is True:
-                        out_segment += language.SIGN[ot]
-            elif out_tokens_ordinal_org[index] is not None:
-                # cardinal transform
-                out_segment += language.num_ord(ot, str(out_tokens_ordinal_org[index])) + " "
-            elif (
-                (ot.lower() in language.DECIMAL_SEP)
-                and index > 0 and index < num_of_tokens - 1
-                and out_tokens_is_num[index - 1] and out_tokens_is_num[index + 1]
-                and int(out_tokens[index + 1]) < 10
-            ):
-                # decimal
-                out_segment = out_segment.strip() + language.DECIMAL_SYM
-                next_is_decimal_num = True
-            else:
-                out_segment += ot + " "
-
-        # print("all:", out_tokens, out_tokens_is_num, out_tokens_ordinal_org) # DEBUG
-        out_segments.append(out_segment.strip())
-        out_segments.append(sep)
-    return "".join(out_segments)
+    ``digits`` are the conversions of the segments that are number phrases (see
+    ``text_to_num.phrases``).
+    """
+    if digits is not None:
+        converted = digits.get(segment)
+        if converted is not None:
+            return converted
+    tokens = segment.split()
+    # The German parser gives back the words it holds but does not convert as they
+    # were pushed: German nouns are capitalized
+    if isinstance(num_builder, WordToDigitParserGerman):
+        words = tokens
+    else:
+        words = [token.lower() for token in tokens]
+    num_builder.reset()
+    last_word = None
+    in_number = False
+    out_tokens: List[str] = []
+    for token, (word, ahead) in zip(tokens, look_ahead(words)):
+        if num_builder.push(word, ahead):
+            in_number = True
+        elif in_number:
+            out_tokens.append(num_builder.value)
+            num_builder.reset(preceding_word=last_word)
+            in_number = num_builder.push(word, ahead)
+        if not in_number:
+            out_tokens.append(token)
+        last_word = word
+    # End of segment
+    num_builder.close()
+    if num_builder.value:
+        out_tokens.append(num_builder.value)
+    if merger is not None:
+        out_tokens = merger.merge_tokens(out_tokens)
+    return " ".join(out_tokens)